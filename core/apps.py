@@ -10,17 +10,90 @@ class CoreConfig(AppConfig):
     name = "core"
 
     def ready(self) -> None:
-        from wagtail.signals import page_published, page_unpublished
+        from django.db.models.signals import post_delete, post_save
+        from wagtail.models import Site
+        from wagtail.signals import page_published, page_unpublished, post_page_move
 
-        from core.cache import clear_content_cache
+        from core.cache import invalidate_content_cache
+        from core.navigation import invalidate_navigation
+        from core.page_cache import purge_all_page_responses, purge_page_responses
+        from core.renditions import schedule_page_renditions
+        from core.warmup import schedule_content_warmup
 
-        # Any publish/unpublish can change what the cached list fragments show,
-        # so flush the content cache on either.
+        # A publish/unpublish can change what the cached fragments depending on
+        # that page's types or subtrees show, so invalidate those on either.
         page_published.connect(
-            clear_content_cache, dispatch_uid="core.cache.clear_content_cache.published"
+            invalidate_content_cache,
+            dispatch_uid="core.cache.invalidate_content_cache.published",
         )
         page_unpublished.connect(
-            clear_content_cache, dispatch_uid="core.cache.clear_content_cache.unpublished"
+            invalidate_content_cache,
+            dispatch_uid="core.cache.invalidate_content_cache.unpublished",
+        )
+
+        # The cached header and footer links. Deleting a live page unpublishes it.
+        page_published.connect(
+            invalidate_navigation,
+            dispatch_uid="core.navigation.invalidate_navigation.published",
+        )
+        page_unpublished.connect(
+            invalidate_navigation,
+            dispatch_uid="core.navigation.invalidate_navigation.unpublished",
+        )
+        post_page_move.connect(
+            invalidate_navigation,
+            dispatch_uid="core.navigation.invalidate_navigation.moved",
+        )
+        post_save.connect(
+            invalidate_navigation,
+            sender=Site,
+            dispatch_uid="core.navigation.invalidate_navigation.site_saved",
+        )
+        post_delete.connect(
+            invalidate_navigation,
+            sender=Site,
+            dispatch_uid="core.navigation.invalidate_navigation.site_deleted",
+        )
+
+        # Anonymous page responses showing the page, or every one for changes
+        # that show in all headers and footers.
+        page_published.connect(
+            purge_page_responses,
+            dispatch_uid="core.page_cache.purge_page_responses.published",
+        )
+        page_unpublished.connect(
+            purge_page_responses,
+            dispatch_uid="core.page_cache.purge_page_responses.unpublished",
+        )
+        post_page_move.connect(
+            purge_all_page_responses,
+            dispatch_uid="core.page_cache.purge_all_page_responses.moved",
+        )
+        post_save.connect(
+            purge_all_page_responses,
+            sender=Site,
+            dispatch_uid="core.page_cache.purge_all_page_responses.site_saved",
+        )
+        post_delete.connect(
+            purge_all_page_responses,
+            sender=Site,
+            dispatch_uid="core.page_cache.purge_all_page_responses.site_deleted",
+        )
+
+        # Then re-render the busiest listings out of band, once per burst.
+        page_published.connect(
+            schedule_content_warmup,
+            dispatch_uid="core.warmup.schedule_content_warmup.published",
+        )
+        page_unpublished.connect(
+            schedule_content_warmup,
+            dispatch_uid="core.warmup.schedule_content_warmup.unpublished",
+        )
+
+        # Create the image renditions a newly published page will show.
+        page_published.connect(
+            schedule_page_renditions,
+            dispatch_uid="core.renditions.schedule_page_renditions",
         )
 
 
@@ -4,6 +4,8 @@ from wagtail import blocks
 from wagtail.documents.blocks import DocumentChooserBlock
 from wagtail.images.blocks import ImageChooserBlock
 from django.db import models
+from django.utils.safestring import SafeString
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 BlockTypeList = list[tuple[str, blocks.Block]]
@@ -240,28 +242,39 @@ class RecentPublicationsBlock(blocks.StructBlock):
         context = super().get_context(value, parent_context=parent_context)
 
         from publications.models import PublicationPage
+        from publications.services import resolve_publication_subtypes
 
-        from core.cache import (
-            CONTENT_CACHE_TIMEOUT,
-            RECENT_PUBLICATIONS_KEY,
-            get_content_cache,
-        )
+        from core.renditions import prefetch_card_images
 
         count = value["number_of_publications"]
-        cache = get_content_cache()
-        cache_key = RECENT_PUBLICATIONS_KEY.format(count=count)
-
-        publications = cache.get(cache_key) if cache is not None else None
-        if publications is None:
-            publications = list(
+        context["publications"] = prefetch_card_images(
+            resolve_publication_subtypes(
                 PublicationPage.objects.live().public().order_by("-first_published_at")[:count]
             )
-            if cache is not None:
-                cache.set(cache_key, publications, CONTENT_CACHE_TIMEOUT)
-
-        context["publications"] = publications
+        )
         return context
 
+    def render(self, value: dict, context: dict | None = None) -> SafeString:
+        """Render the block from the content cache.
+
+        The HTML is cached rather than the publications, so a warm render
+        needs no query for the pages, their subtypes or their renditions.
+        """
+        from publications.models import PublicationPage
+
+        from core.cache import RECENT_PUBLICATIONS_KEY, get_or_compute, page_type_tag, tagged_key
+
+        cache_key = tagged_key(
+            RECENT_PUBLICATIONS_KEY.format(
+                count=value["number_of_publications"],
+                language=get_language(),
+                container=int(bool(context and context.get("container"))),
+            ),
+            [page_type_tag(PublicationPage)],
+        )
+        render = super().render
+        return get_or_compute(cache_key, lambda: render(value, context))
+
     class Meta:
         template = "core/blocks/recent_publications_block.html"
         label = _("Recent Publications Block")
@@ -2,20 +2,44 @@
 
 User-facing list pages (publications, pedagogy) and the home page's
 ``RecentPublicationsBlock`` cache their expensive, non-personalised render in a
-dedicated cache alias (:data:`CONTENT_CACHE_ALIAS`). The whole alias is flushed
-whenever any page is published or unpublished, so visitors never see stale
-content — see :func:`clear_content_cache`, wired up in ``core.apps.CoreConfig``.
+dedicated cache alias (:data:`CONTENT_CACHE_ALIAS`), as do the listings' result
+counts (see ``core.pagination.CachedCountPaginator``).
 
-The alias lives in its own Redis DB (see settings) precisely because the flush
-is wholesale; it must not share storage with sessions.
+Each entry is keyed on the *generation* of the cache tags it depends on: a page
+type (:func:`page_type_tag`) or a page subtree (:func:`subtree_tag`), see
+:func:`tagged_key`. Publishing or unpublishing a page bumps only the tags that
+page touches (:func:`invalidate_content_cache`, wired up in
+``core.apps.CoreConfig``), so e.g. publishing a legal page leaves the
+publication and pedagogy fragments cached. Superseded entries are never read
+again and simply expire. Tag generations are counters in the shared cache, so
+a bump is seen by every worker at once.
+
+The alias lives in its own Redis DB (see settings) so that it can still be
+flushed wholesale (:func:`clear_content_cache`) without touching sessions.
+
+Data that must survive such a flush (e.g. public vote results) lives in the
+``default`` alias instead, under *versioned* keys: writers bump a per-object
+version counter (:func:`bump_cache_version`) and readers only ever look up the
+key for the current version, so an update never has to delete anything.
+Content tags use the same counters.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import json
+import math
+import random
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
-from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache import DEFAULT_CACHE_ALIAS, InvalidCacheBackendError, caches
 from django.core.cache.backends.base import BaseCache
+from django.db.models import Model
+
+if TYPE_CHECKING:
+    from wagtail.models import Page
 
 CONTENT_CACHE_ALIAS = "content"
 
@@ -23,7 +47,48 @@ CONTENT_CACHE_ALIAS = "content"
 # of time-relative bits (e.g. event "upcoming/past" badges) between publishes.
 CONTENT_CACHE_TIMEOUT = 300
 
-RECENT_PUBLICATIONS_KEY = "recent_publications:{count}"
+# Rendered HTML of a ``RecentPublicationsBlock``.
+RECENT_PUBLICATIONS_KEY = "recent_publications:{count}:{language}:{container}"
+
+# Stampede protection (see get_or_compute). Only one request recomputes an
+# entry, holding RECOMPUTE_LOCK_KEY for at most RECOMPUTE_LOCK_TIMEOUT seconds
+# (the bound for a crashed worker). Entries outlive their expiry by STALE_GRACE
+# so the previous value can be served meanwhile; with nothing to serve, other
+# requests poll for up to RECOMPUTE_WAIT seconds before computing themselves.
+RECOMPUTE_LOCK_KEY = "{key}:recompute"
+RECOMPUTE_LOCK_TIMEOUT = 30
+RECOMPUTE_WAIT = 2.0
+RECOMPUTE_POLL_INTERVAL = 0.05
+STALE_GRACE = 60
+# Higher values start probabilistic early recomputation sooner.
+EARLY_EXPIRY_BETA = 1.0
+
+# Generation counter of a content cache tag (stored in the content alias).
+CONTENT_TAG_VERSION_KEY = "content_tag:{tag}"
+
+# Navigation links of a site (``core.navigation``), under NAVIGATION_TAG.
+NAVIGATION_KEY = "navigation:{site_id}"
+NAVIGATION_TAG = "navigation"
+
+# JSON-LD script of a page, per live revision (``core.templatetags.structured_data``).
+# The TTL bounds how long a site or image change takes to show in it.
+STRUCTURED_DATA_KEY = "structured_data:{page_id}:{revision_id}"
+STRUCTURED_DATA_TIMEOUT = 3600
+
+# Anonymous page responses (``core.page_cache``), by host, path, language and
+# query string. Each is also tagged with its URL path and PAGE_RESPONSES_TAG.
+PAGE_RESPONSE_KEY = "page_response:{signature}"
+PAGE_RESPONSES_TAG = "page_responses"
+PAGE_RESPONSE_TIMEOUT = CONTENT_CACHE_TIMEOUT
+
+# Total number of results of a paginated listing, per listing and filter set.
+PAGINATION_COUNT_KEY = "pagination_count:{scope}:{signature}"
+
+# Public vote results, versioned per project and keyed by language for their
+# translated choice labels (stored in the default alias).
+VOTE_RESULTS_VERSION_KEY = "vote_results_version:{project_id}"
+VOTE_RESULTS_KEY = "vote_results:{project_id}:{version}:{language}"
+VOTE_RESULTS_TIMEOUT = 86400
 
 
 def get_content_cache() -> BaseCache | None:
@@ -35,7 +100,185 @@ def get_content_cache() -> BaseCache | None:
 
 
 def clear_content_cache(**kwargs: Any) -> None:
-    """Flush the content cache. Used as a Wagtail publish/unpublish receiver."""
+    """Flush the whole content cache."""
     cache = get_content_cache()
     if cache is not None:
         cache.clear()
+
+
+T = TypeVar("T")
+
+
+class _Entry(NamedTuple):
+    """A value stored by :func:`get_or_compute`, with what early expiry needs."""
+
+    value: Any
+    expires_at: float
+    compute_time: float
+
+
+def _expires_early(entry: _Entry) -> bool:
+    # "XFetch": recompute ahead of expiry with a probability rising as it
+    # nears, earlier for slower computations, so that one request usually
+    # refreshes the entry before everyone finds it missing.
+    jitter = -entry.compute_time * EARLY_EXPIRY_BETA * math.log(1.0 - random.random())  # nosec B311
+    return time.time() + jitter >= entry.expires_at
+
+
+def get_or_compute(key: str, compute: Callable[[], T], timeout: int = CONTENT_CACHE_TIMEOUT) -> T:
+    """Return the content cache value at ``key``, computing it at most once at a time.
+
+    On a miss (or probabilistic early expiry) a short lock elects a single
+    request to call ``compute``; the others serve the previous value if there
+    is one, or briefly poll for the new one. This keeps a burst of requests
+    from all re-running the same expensive query after an invalidation.
+    """
+    cache = get_content_cache()
+    if cache is None:
+        return compute()
+
+    entry = cache.get(key)
+    if entry is not None and not _expires_early(entry):
+        return entry.value
+
+    lock_key = RECOMPUTE_LOCK_KEY.format(key=key)
+    if not cache.add(lock_key, 1, RECOMPUTE_LOCK_TIMEOUT):
+        if entry is not None:
+            return entry.value
+        deadline = time.monotonic() + RECOMPUTE_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(RECOMPUTE_POLL_INTERVAL)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry.value
+        return compute()
+
+    try:
+        started = time.monotonic()
+        value = compute()
+        cache.set(
+            key,
+            _Entry(value, time.time() + timeout, time.monotonic() - started),
+            timeout + STALE_GRACE,
+        )
+    finally:
+        cache.delete(lock_key)
+    return value
+
+
+def page_type_tag(model: type[Model] | Model) -> str:
+    """Tag of every page of type ``model``, subclasses included."""
+    return f"type:{model._meta.label_lower}"
+
+
+def subtree_tag(page: Page) -> str:
+    """Tag of ``page`` and all of its descendants."""
+    return f"tree:{page.path}"
+
+
+def get_page_tags(page: Page) -> list[str]:
+    """The tags a change to ``page`` affects: its types and the subtrees it is in."""
+    from wagtail.models import Page
+
+    # The page's own model, then its concrete ancestors (abstract bases have no pages).
+    types = [page_type_tag(model) for model in (type(page), *page._meta.get_parent_list())]
+    subtrees = [
+        f"tree:{page.path[:length]}"
+        for length in range(Page.steplen, len(page.path) + 1, Page.steplen)
+    ]
+    return types + subtrees
+
+
+def get_tag_versions(cache: BaseCache, tags: Iterable[str]) -> list[int]:
+    """Return the current generation of each of ``tags``, in one round trip."""
+    keys = [CONTENT_TAG_VERSION_KEY.format(tag=tag) for tag in tags]
+    versions = cache.get_many(keys)
+    return [
+        int(versions[key]) if key in versions else get_cache_version(cache, key) for key in keys
+    ]
+
+
+def tagged_key(key: str, tags: Iterable[str]) -> str:
+    """``key`` qualified by the current generation of ``tags``.
+
+    The result changes whenever one of the tags is invalidated, so a value
+    stored under it is never served after a publish affecting those tags.
+    """
+    cache = get_content_cache()
+    if cache is None:
+        return key
+    versions = ".".join(str(version) for version in get_tag_versions(cache, tags))
+    return f"{key}@{versions}"
+
+
+def peek_tagged_key(key: str, tags: Iterable[str]) -> str | None:
+    """:func:`tagged_key` for a lookup only, writing nothing to the cache.
+
+    Returns None if a tag has no generation yet: nothing can have been stored
+    under it, and creating a counter for every key looked up (e.g. for each
+    URL probed) would grow the cache without bound.
+    """
+    cache = get_content_cache()
+    if cache is None:
+        return key
+    keys = [CONTENT_TAG_VERSION_KEY.format(tag=tag) for tag in tags]
+    versions = cache.get_many(keys)
+    if len(versions) < len(keys):
+        return None
+    return f"{key}@{'.'.join(str(int(versions[version_key])) for version_key in keys)}"
+
+
+def invalidate_content_cache(instance: Page, **kwargs: Any) -> None:
+    """Invalidate the tags ``instance`` affects. Used as a publish/unpublish receiver."""
+    cache = get_content_cache()
+    if cache is None:
+        return
+    for tag in get_page_tags(instance):
+        bump_cache_version(cache, CONTENT_TAG_VERSION_KEY.format(tag=tag))
+
+
+def pagination_count_key(scope: str, **filters: Any) -> str:
+    """Key for the result count of listing ``scope`` under ``filters``.
+
+    The filters are hashed so that free-text search terms of any length or
+    alphabet make a valid, bounded cache key.
+    """
+    signature = hashlib.md5(
+        json.dumps(filters, sort_keys=True, default=str).encode(), usedforsecurity=False
+    ).hexdigest()
+    return PAGINATION_COUNT_KEY.format(scope=scope, signature=signature)
+
+
+def get_versioned_cache() -> BaseCache:
+    """Return the cache holding versioned keys (never flushed on publish)."""
+    return caches[DEFAULT_CACHE_ALIAS]
+
+
+def _initial_version() -> int:
+    # Seeded from the clock rather than 1 so that a lost counter (eviction,
+    # Redis restart) never resurrects values cached under an old version.
+    return time.time_ns()
+
+
+def get_cache_version(cache: BaseCache, version_key: str) -> int:
+    """Return the current version stored at ``version_key``, initialising it."""
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, _initial_version(), None)
+        version = cache.get(version_key)
+    return int(version) if version is not None else _initial_version()
+
+
+def bump_cache_version(cache: BaseCache, version_key: str) -> int:
+    """Atomically increment the version at ``version_key`` and return it."""
+    try:
+        return cache.incr(version_key)
+    except ValueError:
+        # No counter yet: start one. A concurrent writer may win the add, in
+        # which case increment theirs so both bumps are accounted for.
+        if cache.add(version_key, _initial_version(), None):
+            return get_cache_version(cache, version_key)
+        try:
+            return cache.incr(version_key)
+        except ValueError:
+            return _initial_version()
@@ -0,0 +1,51 @@
+from typing import Any
+
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+from wagtail.models import Page, get_page_models
+
+from core.toc import dump_table_of_contents, get_table_of_contents
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the table of contents of every page that keeps one (toc_items), "
+        "for pages saved before it was stored."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of pages updated per query (default: 500)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute pages that already have a stored table of contents",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        total = 0
+
+        for model in get_page_models():
+            if "toc_items" not in {field.name for field in model._meta.local_fields}:
+                continue
+
+            pages = model.objects.only("content", "toc_items").order_by("pk")
+            if not options["all"]:
+                pages = pages.filter(toc_items__isnull=True)
+
+            batch: list[Page] = []
+            for page in pages.iterator(chunk_size=batch_size):
+                page.toc_items = dump_table_of_contents(get_table_of_contents(page.content))
+                batch.append(page)
+                if len(batch) >= batch_size:
+                    total += model.objects.bulk_update(batch, ["toc_items"])
+                    batch = []
+            if batch:
+                total += model.objects.bulk_update(batch, ["toc_items"])
+
+        self.stdout.write(self.style.SUCCESS(f"Stored the table of contents of {total} pages."))
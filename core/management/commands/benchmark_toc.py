@@ -0,0 +1,88 @@
+import time
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+from slugify import slugify
+
+from core.toc import HEADER_TAGS, _HeaderParser, _set_header_ids
+
+PARAGRAPH = (
+    '<p data-block-key="k{number}">Le conseil de quartier a présenté le projet de '
+    '<a href="/projets/{number}/">réaménagement</a> &amp; la <b>concertation</b> '
+    "qui l'accompagne.<br/>Les habitants peuvent déposer leurs idées en ligne.</p>"
+)
+
+
+def beautifulsoup_headers(html: str) -> list[tuple[int, str, str]]:
+    """(level, title, id) of each header, as ``core.toc`` found them with BeautifulSoup."""
+    soup = BeautifulSoup(html, "html.parser")
+    return [
+        # Only multi-valued attributes such as ``class`` come back as lists.
+        (int(header.name[1]), header.get_text(), str(header.get("id", "")))
+        for header in soup.find_all(list(HEADER_TAGS))
+    ]
+
+
+def beautifulsoup_header_ids(html: str) -> str:
+    """``html`` with header ids set, as ``core.toc`` did with BeautifulSoup."""
+    soup = BeautifulSoup(html, "html.parser")
+    for header in soup.find_all(list(HEADER_TAGS)):
+        header["id"] = slugify(header.get_text())
+    return str(soup)
+
+
+def build_body(paragraphs: int, section_every: int = 5) -> str:
+    parts = []
+    for number in range(paragraphs):
+        if number % section_every == 0:
+            level = 2 + (number // section_every) % 3
+            parts.append(
+                f'<h{level} data-block-key="h{number}">Section {number} : étape</h{level}>'
+            )
+        parts.append(PARAGRAPH.format(number=number))
+    return "".join(parts)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare BeautifulSoup and the html.parser header extractor of core.toc "
+        "on a large synthetic rich-text body."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--paragraphs",
+            type=int,
+            default=2000,
+            help="Number of paragraphs in the body (default: 2000)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per measure; the fastest one is reported (default: 5)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        html = build_body(options["paragraphs"])
+        self.stdout.write(f"Body: {len(html) / 1024:.0f} KiB")
+
+        measures: dict[str, Callable[[], object]] = {
+            "headers, BeautifulSoup": lambda: beautifulsoup_headers(html),
+            "headers, html.parser": lambda: _HeaderParser(html).headers,
+            "header ids, BeautifulSoup": lambda: beautifulsoup_header_ids(html),
+            "header ids, html.parser": lambda: _set_header_ids(html),
+        }
+        for name, run in measures.items():
+            self.stdout.write(f"{name:28} {self._time(run, options['repeat']):8.1f} ms")
+
+    @staticmethod
+    def _time(run: Callable[[], object], repeat: int) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, (time.perf_counter() - start) * 1000)
+        return best
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.core.management.commands.migrate import Command as MigrateCommand
+
+from core.warmup import warmups_suspended
+
+
+class Command(MigrateCommand):
+    """Django's ``migrate``, without scheduling content warm-ups for the pages it publishes."""
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with warmups_suspended():
+            super().handle(*args, **options)
@@ -0,0 +1,101 @@
+"""Per-site navigation links for the header, footer and error pages.
+
+The links (titles, URLs and ``show_in_menus`` flags of the site root's
+children, and of the legal and about pages) only change when a page is
+published, unpublished, moved or deleted, or a site is edited. They are built
+once per site into a :class:`NavigationTree` kept in the content cache under
+:data:`~core.cache.NAVIGATION_TAG`, which those events invalidate
+(:func:`invalidate_navigation`, wired up in ``core.apps.CoreConfig``).
+
+What depends on the request, such as the active menu item, is derived from
+the cached links by the ``navigation_tags`` template tags.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.http import HttpRequest
+from wagtail.models import Page, Site
+
+from core.cache import (
+    CONTENT_TAG_VERSION_KEY,
+    NAVIGATION_KEY,
+    NAVIGATION_TAG,
+    bump_cache_version,
+    get_content_cache,
+    get_or_compute,
+    tagged_key,
+)
+
+
+@dataclass(frozen=True)
+class NavigationLink:
+    title: str
+    url: str
+    in_menu: bool
+
+
+@dataclass(frozen=True)
+class NavigationTree:
+    home_url: str
+    # Live children of the site root.
+    sections: list[NavigationLink]
+    # Live children of the legal and about index pages.
+    legal_pages: list[NavigationLink]
+    about_pages: list[NavigationLink]
+
+
+def _links(pages: Iterable[Page], site: Site) -> list[NavigationLink]:
+    return [
+        NavigationLink(
+            title=page.title,
+            url=page.get_url(current_site=site) or "#",
+            in_menu=page.show_in_menus,
+        )
+        for page in pages
+    ]
+
+
+def _index_children(model: type[Page], root: Page, site: Site) -> list[NavigationLink]:
+    index = model.objects.live().descendant_of(root).first()
+    if index is None:
+        return []
+    return _links(index.get_children().live(), site)
+
+
+def build_navigation_tree(site: Site) -> NavigationTree:
+    from about.models import AboutIndexPage
+    from legal.models import LegalIndexPage
+
+    root = site.root_page
+    return NavigationTree(
+        home_url=root.get_url(current_site=site) or "/",
+        sections=_links(root.get_children().live(), site),
+        legal_pages=_index_children(LegalIndexPage, root, site),
+        about_pages=_index_children(AboutIndexPage, root, site),
+    )
+
+
+def get_navigation_tree(site: Site, request: HttpRequest | None = None) -> NavigationTree:
+    """The navigation of ``site``, from the content cache.
+
+    With a ``request``, the tree is also kept on it for the other tags of
+    the same render.
+    """
+    tree = getattr(request, "_navigation_tree", None)
+    if tree is None:
+        key = tagged_key(NAVIGATION_KEY.format(site_id=site.pk), [NAVIGATION_TAG])
+        tree = get_or_compute(key, lambda: build_navigation_tree(site))
+        if request is not None:
+            request._navigation_tree = tree  # type: ignore[attr-defined]
+    return tree
+
+
+def invalidate_navigation(**kwargs: Any) -> None:
+    """Invalidate the navigation of every site. Used as a page and site signal receiver."""
+    cache = get_content_cache()
+    if cache is not None:
+        bump_cache_version(cache, CONTENT_TAG_VERSION_KEY.format(tag=NAVIGATION_TAG))
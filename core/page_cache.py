@@ -0,0 +1,227 @@
+"""Full-page response cache for anonymous visitors.
+
+Wagtail renders a page in full for every visitor, though for an anonymous
+one (no session) the output of the page types in :data:`CACHED_PAGE_MODELS`
+depends only on the site, path, query string and language. For them,
+:class:`AnonymousPageCacheMiddleware` stores the zlib-compressed body in the
+content cache and serves it to the next anonymous visitors without routing
+or rendering. Pages are marked cacheable by the ``before_serve_page`` hook
+(``core.wagtail_hooks``), so only Wagtail page views are stored, and never
+private pages.
+
+Entries are keyed on the generation of a per-path tag (:func:`page_url_tag`)
+and of :data:`~core.cache.PAGE_RESPONSES_TAG`, see ``core.cache``. A path's
+counter is only created when a cacheable page is served there: lookups
+write nothing, so probing arbitrary URLs does not grow the cache. Publishing
+or unpublishing a page purges its own URL and those of its ancestors, which
+list it (indexes, the home page's recent publications). Changes that show in
+the header or footer of every page, i.e. to the site root's children or to
+the legal and about pages, as well as moves and site edits, purge every
+page (:func:`purge_page_responses`, wired up in ``core.apps.CoreConfig``).
+
+Per-visitor parts of a cached page are loaded by its scripts: the vote and
+idea widgets through their JSON endpoints (only authenticated visitors can
+use them, and they are never served from this cache), the login form through
+``/api/csrf/`` for a CSRF token of its own.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeGuard
+from urllib.parse import parse_qsl, urlencode
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+
+from core.cache import (
+    CONTENT_TAG_VERSION_KEY,
+    PAGE_RESPONSE_KEY,
+    PAGE_RESPONSE_TIMEOUT,
+    PAGE_RESPONSES_TAG,
+    bump_cache_version,
+    get_content_cache,
+    peek_tagged_key,
+    tagged_key,
+)
+
+if TYPE_CHECKING:
+    from wagtail.models import Page
+
+# Page types whose anonymous responses are cached.
+CACHED_PAGE_MODELS = frozenset(
+    {
+        "home.homepage",
+        "publications.projectpage",
+        "publications.eventpage",
+        "pedagogy.pedagogycardpage",
+        "legal.legalindexpage",
+        "legal.termsofservicepage",
+        "legal.privacypolicypage",
+        "legal.cookiespolicypage",
+        "legal.codeofconductpage",
+        "about.aboutindexpage",
+        "about.aboutwebsitepage",
+        "about.aboutcommissionpage",
+        "about.aboutdevteampage",
+    }
+)
+
+# Query parameters that do not change a page, left out of the cache key.
+IGNORED_QUERY_PARAMETERS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+IGNORED_QUERY_PREFIXES = ("utm_",)
+
+
+def page_url_tag(path: str) -> str:
+    """Tag of the cached responses for URL path ``path``."""
+    return f"url:{path}"
+
+
+def normalize_query_string(query_string: str) -> str:
+    """``query_string`` with its parameters sorted and tracking ones removed."""
+    parameters = [
+        (name, value)
+        for name, value in parse_qsl(query_string, keep_blank_values=True)
+        if name not in IGNORED_QUERY_PARAMETERS and not name.startswith(IGNORED_QUERY_PREFIXES)
+    ]
+    return urlencode(sorted(parameters))
+
+
+def is_cacheable_request(request: HttpRequest) -> bool:
+    """An anonymous GET or HEAD, with no session nor pending messages."""
+    return (
+        request.method in ("GET", "HEAD")
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def _page_response_key_parts(request: HttpRequest) -> tuple[str, list[str]]:
+    signature = hashlib.md5(
+        "\n".join(
+            (
+                request.get_host(),
+                request.path,
+                getattr(request, "LANGUAGE_CODE", settings.LANGUAGE_CODE),
+                normalize_query_string(request.META.get("QUERY_STRING", "")),
+            )
+        ).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return (
+        PAGE_RESPONSE_KEY.format(signature=signature),
+        [page_url_tag(request.path), PAGE_RESPONSES_TAG],
+    )
+
+
+def page_response_key(request: HttpRequest) -> str:
+    """Key to store the response to ``request`` under, starting its tags' generations.
+
+    Only called for cacheable page views, so only real page paths get a counter.
+    """
+    return tagged_key(*_page_response_key_parts(request))
+
+
+def cached_page_response_key(request: HttpRequest) -> str | None:
+    """Key a response to ``request`` would be stored under, or None if none can be.
+
+    Looking it up writes nothing, so requests for arbitrary paths (404s,
+    probes) leave no per-path generation counter behind.
+    """
+    return peek_tagged_key(*_page_response_key_parts(request))
+
+
+def mark_page_response_cacheable(page: Page, request: HttpRequest) -> None:
+    """Let the middleware store the response of ``page``, if its type is cached."""
+    if page._meta.label_lower not in CACHED_PAGE_MODELS:
+        return
+    if page.get_view_restrictions().exists():
+        return
+    if not is_cacheable_request(request):
+        return
+    # Keyed before rendering, so a publish meanwhile leaves the stored response unreachable.
+    request._page_response_key = page_response_key(request)  # type: ignore[attr-defined]
+
+
+def _is_cacheable_response(
+    response: HttpResponseBase, request: HttpRequest
+) -> TypeGuard[HttpResponse]:
+    if getattr(request, "_page_response_key", None) is None or request.method != "GET":
+        return False
+    if not isinstance(response, HttpResponse) or response.status_code != 200 or response.cookies:
+        return False
+    cache_control = response.get("Cache-Control", "")
+    if any(directive in cache_control for directive in ("private", "no-cache", "no-store")):
+        return False
+    session = getattr(request, "session", None)
+    return session is None or not session.modified
+
+
+class AnonymousPageCacheMiddleware:
+    """Serve and store the cached responses of anonymous page views.
+
+    Must come after ``LocaleMiddleware``, whose language is part of the key.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        cache = get_content_cache()
+        if cache is None or not is_cacheable_request(request):
+            return self.get_response(request)
+
+        key = cached_page_response_key(request)
+        cached = cache.get(key) if key is not None else None
+        if cached is not None:
+            content_type, body = cached
+            cached_response = HttpResponse(zlib.decompress(body), content_type=content_type)
+            patch_vary_headers(cached_response, ("Cookie",))
+            return cached_response
+
+        response = self.get_response(request)
+        if _is_cacheable_response(response, request):
+            cache.set(
+                request._page_response_key,  # type: ignore[attr-defined]
+                (response["Content-Type"], zlib.compress(response.content)),
+                PAGE_RESPONSE_TIMEOUT,
+            )
+        return response
+
+
+def _shows_in_navigation(page: Page) -> bool:
+    from about.models import AboutIndexPage
+    from legal.models import LegalIndexPage
+
+    parent = page.get_parent()
+    site = page.get_site()
+    if parent is None or site is None or parent.pk == site.root_page_id:
+        return True
+    return parent.specific_class in (LegalIndexPage, AboutIndexPage)
+
+
+def _bump(tag: str) -> None:
+    cache = get_content_cache()
+    if cache is not None:
+        bump_cache_version(cache, CONTENT_TAG_VERSION_KEY.format(tag=tag))
+
+
+def purge_page_responses(instance: Page, **kwargs: Any) -> None:
+    """Purge the cached responses ``instance`` shows in. Used as a publish/unpublish receiver."""
+    if _shows_in_navigation(instance):
+        _bump(PAGE_RESPONSES_TAG)
+        return
+
+    for page in instance.get_ancestors(inclusive=True):
+        url_parts = page.get_url_parts()
+        if url_parts is not None and url_parts[2] is not None:
+            _bump(page_url_tag(url_parts[2]))
+
+
+def purge_all_page_responses(**kwargs: Any) -> None:
+    """Purge every cached response. Used as a page move and site signal receiver."""
+    _bump(PAGE_RESPONSES_TAG)
@@ -0,0 +1,79 @@
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, TypeVar, overload
+
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from core.cache import CONTENT_CACHE_TIMEOUT, get_content_cache
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that keeps its total in the content cache under ``count_key``.
+
+    Listings otherwise run a ``COUNT(*)`` over the same filtered query as the
+    page itself on every request. A total can only change when a page is
+    published or unpublished (besides the passage of time, bounded by
+    ``CONTENT_CACHE_TIMEOUT``), so ``count_key`` should be a
+    ``core.cache.tagged_key`` over the pages the listing draws from. Without a
+    ``count_key`` or a content cache it behaves like ``Paginator``.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet | Sequence[Any],
+        per_page: int,
+        *args: Any,
+        count_key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.count_key = count_key
+
+    @cached_property
+    def count(self) -> int:
+        cache = get_content_cache()
+        if self.count_key is None or cache is None:
+            return super().count
+
+        count = cache.get(self.count_key)
+        if count is None:
+            count = super().count
+            cache.set(self.count_key, count, CONTENT_CACHE_TIMEOUT)
+        return count
+
+
+T = TypeVar("T")
+
+
+class LazyObjectList(Sequence[T]):
+    """``object_list`` of a paginator page that is loaded on first access.
+
+    ``load`` receives the page's original object list (usually a sliced
+    queryset) and returns the items, e.g. with related rows preloaded. Until a
+    template iterates the page nothing is queried, so a listing whose cards
+    come from a cached fragment runs neither the page query nor ``load``.
+    """
+
+    def __init__(self, object_list: Iterable[T], load: Callable[[Iterable[T]], list[T]]) -> None:
+        self._object_list = object_list
+        self._load = load
+
+    @cached_property
+    def _items(self) -> list[T]:
+        return self._load(self._object_list)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
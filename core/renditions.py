@@ -0,0 +1,200 @@
+"""Registry of the image renditions templates render, and their pre-generation.
+
+Wagtail creates a rendition the first time a template asks for it, inside the
+request. Publishing a page therefore schedules :func:`generate_page_renditions`
+in a Celery worker, which creates every rendition the page's templates will
+request (hero image and StreamField images) ahead of the first visitor.
+Templates still create a rendition inline if it is missing.
+
+Keep the specs below in step with the ``{% image %}`` tags in the templates;
+``core/tests/test_renditions.py`` checks that every spec they use is listed.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from django.db import transaction
+from wagtail import blocks
+from wagtail.fields import StreamField
+from wagtail.images import get_image_model
+from wagtail.images.models import SourceImageIOError
+
+from about.blocks import MemberBlock, UserBlock
+from core.blocks import (
+    CardBlock,
+    CustomImageBlock,
+    DeprecatedImageTextBlock,
+    HeroBlock,
+    ImageSize,
+    TestimonialBlock,
+)
+
+if TYPE_CHECKING:
+    from wagtail.images.models import AbstractImage
+    from wagtail.models import Page
+
+# Publication and pedagogy cards in listings and the recent-publications block.
+CARD_IMAGE_RENDITION = "fill-600x375"
+# Social preview image in the JSON-LD (``core.templatetags.structured_data``).
+SOCIAL_IMAGE_RENDITION = "fill-1200x630"
+
+# Renditions of a page's ``hero_image``, by page model label.
+HERO_IMAGE_RENDITIONS: dict[str, tuple[str, ...]] = {
+    "publications.projectpage": (
+        CARD_IMAGE_RENDITION,
+        SOCIAL_IMAGE_RENDITION,
+        "width-1200",
+        "width-700",
+    ),
+    "publications.eventpage": (
+        CARD_IMAGE_RENDITION,
+        SOCIAL_IMAGE_RENDITION,
+        "width-1200",
+        "width-600",
+    ),
+    "pedagogy.pedagogycardpage": (
+        CARD_IMAGE_RENDITION,
+        SOCIAL_IMAGE_RENDITION,
+        "width-1200",
+        "width-700",
+    ),
+}
+
+# ``core/blocks/image_block.html``: the inline size, plus the lightbox.
+IMAGE_BLOCK_RENDITIONS: dict[str, str] = {
+    ImageSize.SMALL: "width-400",
+    ImageSize.MEDIUM: "width-800",
+    ImageSize.LARGE: "width-1200",
+    ImageSize.FULL: "width-1920",
+}
+IMAGE_BLOCK_LIGHTBOX_RENDITION = "width-1920"
+
+RenditionRequest = tuple["AbstractImage | None", str]
+PageT = TypeVar("PageT", bound="Page")
+
+
+def _field_renditions(
+    name: str, *specs: str
+) -> Callable[[blocks.StructValue], Iterable[RenditionRequest]]:
+    def renditions(value: blocks.StructValue) -> Iterable[RenditionRequest]:
+        return [(value.get(name), spec) for spec in specs]
+
+    return renditions
+
+
+def _image_block_renditions(value: blocks.StructValue) -> Iterable[RenditionRequest]:
+    image = value.get("image")
+    size_spec = IMAGE_BLOCK_RENDITIONS.get(
+        value.get("size"), IMAGE_BLOCK_RENDITIONS[ImageSize.FULL]
+    )
+    return [(image, IMAGE_BLOCK_LIGHTBOX_RENDITION), (image, size_spec)]
+
+
+# Renditions of StreamField blocks, by block class: a function from the block's
+# value to the (image, spec) pairs its template renders.
+BLOCK_RENDITIONS: dict[
+    type[blocks.Block], Callable[[blocks.StructValue], Iterable[RenditionRequest]]
+] = {
+    CustomImageBlock: _image_block_renditions,
+    DeprecatedImageTextBlock: _field_renditions("image", "width-400"),
+    # The first hero of a page is full screen, the others a banner.
+    HeroBlock: _field_renditions("image", "fill-1920x1080", "fill-1920x600"),
+    CardBlock: _field_renditions("image", "fill-600x450"),
+    TestimonialBlock: _field_renditions("author_image", "fill-100x100"),
+    UserBlock: _field_renditions("image", "fill-120x120"),
+    MemberBlock: _field_renditions("image", "fill-120x120"),
+}
+
+
+def get_registered_specs() -> set[str]:
+    """Every rendition spec listed in this registry."""
+    specs = {spec for hero_specs in HERO_IMAGE_RENDITIONS.values() for spec in hero_specs}
+    specs.update(IMAGE_BLOCK_RENDITIONS.values())
+    specs.add(IMAGE_BLOCK_LIGHTBOX_RENDITION)
+    for renditions in BLOCK_RENDITIONS.values():
+        specs.update(spec for _image, spec in renditions(blocks.StructValue(None, [])))
+    return specs
+
+
+def _walk_block(block: blocks.Block, value: Any) -> Iterator[RenditionRequest]:
+    if value is None:
+        return
+    if (renditions := BLOCK_RENDITIONS.get(type(block))) is not None:
+        yield from renditions(value)
+
+    if isinstance(block, blocks.StreamBlock):
+        for child in value:
+            yield from _walk_block(child.block, child.value)
+    elif isinstance(block, blocks.StructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from _walk_block(child_block, value.get(name))
+    elif isinstance(block, blocks.ListBlock):
+        for item in value:
+            yield from _walk_block(block.child_block, item)
+
+
+def get_page_renditions(page: Page) -> dict[AbstractImage, set[str]]:
+    """The renditions ``page``'s templates render, grouped by image."""
+    requests: list[RenditionRequest] = []
+
+    hero_image = getattr(page, "hero_image", None)
+    for spec in HERO_IMAGE_RENDITIONS.get(page._meta.label_lower, ()):
+        requests.append((hero_image, spec))
+
+    for field in page._meta.get_fields():
+        if isinstance(field, StreamField):
+            value = getattr(page, field.name)
+            requests.extend(_walk_block(value.stream_block, value))
+
+    renditions: dict[AbstractImage, set[str]] = defaultdict(set)
+    for image, spec in requests:
+        if image is not None:
+            renditions[image].add(spec)
+    return renditions
+
+
+def generate_page_renditions(page: Page) -> int:
+    """Create the missing renditions of ``page``; returns how many it looked up."""
+    generated = 0
+    for image, specs in get_page_renditions(page).items():
+        try:
+            generated += len(image.get_renditions(*specs))
+        except SourceImageIOError:
+            # The original file is gone; templates fall back the same way.
+            continue
+    return generated
+
+
+def prefetch_card_images(
+    pages: Iterable[PageT], specs: Iterable[str] = (CARD_IMAGE_RENDITION,)
+) -> list[PageT]:
+    """Load the ``hero_image`` of ``pages``, with its ``specs`` renditions, in two queries.
+
+    Each image is cached on its page, so a card grid rendering
+    ``{% image page.hero_image <spec> %}`` needs no query per card for an
+    existing rendition.
+    """
+    pages = list(pages)
+    image_ids = {page.hero_image_id for page in pages if page.hero_image_id}
+    if not image_ids:
+        return pages
+
+    images = get_image_model().objects.prefetch_renditions(*specs).in_bulk(image_ids)
+    for page in pages:
+        if page.hero_image_id:
+            page._meta.get_field("hero_image").set_cached_value(
+                page, images.get(page.hero_image_id)
+            )
+    return pages
+
+
+def schedule_page_renditions(instance: Page, **kwargs: Any) -> None:
+    """Generate ``instance``'s renditions in a worker. Used as a publish receiver."""
+    from core.tasks import generate_page_renditions as generate_page_renditions_task
+
+    transaction.on_commit(
+        lambda: generate_page_renditions_task.delay(instance.pk)  # type: ignore[attr-defined]
+    )
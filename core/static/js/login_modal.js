@@ -12,6 +12,11 @@ document.addEventListener('DOMContentLoaded', function () {
         const formData = new FormData(loginForm);
 
         try {
+            // The page may come from the page cache, with another visitor's token.
+            const tokenResponse = await fetch('/api/csrf/', { credentials: 'same-origin' });
+            const { csrfToken } = await tokenResponse.json();
+            formData.set('csrfmiddlewaretoken', csrfToken);
+
             const response = await fetch(loginForm.action, {
                 method: 'POST',
                 body: formData,
@@ -0,0 +1,17 @@
+from celery import shared_task
+from wagtail.models import Page
+
+from core import renditions, warmup
+
+
+@shared_task
+def warm_content_cache() -> int:
+    return warmup.warm_content_cache()
+
+
+@shared_task
+def generate_page_renditions(page_id: int) -> int:
+    page = Page.objects.filter(pk=page_id).first()
+    if page is None:
+        return 0
+    return renditions.generate_page_renditions(page.specific)
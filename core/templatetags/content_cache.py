@@ -0,0 +1,65 @@
+from django import template
+from django.core.cache.utils import make_template_fragment_key
+from django.template.base import FilterExpression, NodeList, Parser, Token
+from django.template.context import Context
+from django.utils.safestring import SafeString
+from wagtail.models import Page
+
+from core.cache import get_content_cache, get_or_compute, get_tag_versions, subtree_tag
+
+register = template.Library()
+
+
+@register.simple_tag
+def subtree_cache_version(page: Page) -> str:
+    """Generation of ``page``'s subtree tag, to vary a ``{% cache %}`` fragment on.
+
+    The fragment is then recomputed after any page in that subtree is published
+    or unpublished, and kept when unrelated pages are.
+    """
+    cache = get_content_cache()
+    if cache is None:
+        return ""
+    return str(get_tag_versions(cache, [subtree_tag(page)])[0])
+
+
+class ContentCacheNode(template.Node):
+    def __init__(
+        self,
+        nodelist: NodeList,
+        timeout: FilterExpression,
+        fragment_name: str,
+        vary_on: list[FilterExpression],
+    ) -> None:
+        self.nodelist = nodelist
+        self.timeout = timeout
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+
+    def render(self, context: Context) -> SafeString:
+        timeout = int(self.timeout.resolve(context))
+        key = make_template_fragment_key(
+            self.fragment_name, [var.resolve(context) for var in self.vary_on]
+        )
+        return get_or_compute(key, lambda: self.nodelist.render(context), timeout)
+
+
+@register.tag("content_cache")
+def do_content_cache(parser: Parser, token: Token) -> ContentCacheNode:
+    """Cache a fragment in the content cache, recomputing it once at a time.
+
+    Usage: ``{% content_cache timeout fragment_name [var1 var2 ...] %}...{% endcontent_cache %}``.
+    Like ``{% cache %}`` with ``using="content"``, but backed by
+    ``core.cache.get_or_compute`` for stampede protection.
+    """
+    nodelist = parser.parse(("endcontent_cache",))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires at least 2 arguments.")
+    return ContentCacheNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        bits[2],
+        [parser.compile_filter(bit) for bit in bits[3:]],
+    )
@@ -5,52 +5,64 @@ from django_stubs_ext import StrOrPromise
 from django import template
 from django.template.context import BaseContext
 from wagtail.models import Site, Page
-from wagtail.templatetags.wagtailcore_tags import pageurl
 
-from legal.models import LegalIndexPage
-from about.models import AboutIndexPage
+from core.navigation import NavigationLink, NavigationTree, get_navigation_tree
 
 register = template.Library()
 
 
-@register.simple_tag(takes_context=True)
-def get_site_root(context: BaseContext) -> Site | None:
+def _get_site(context: BaseContext) -> Site | None:
     request = context.get("request")
 
     if request is not None:
         site = Site.find_for_request(request)
         if site is not None:
-            return site.root_page
+            return site
+
+    return Site.objects.filter(is_default_site=True).first() or Site.objects.first()
 
-    default_site = Site.objects.filter(is_default_site=True).first() or Site.objects.first()
-    if default_site is not None:
-        return default_site.root_page
 
-    return None
+def _get_navigation(context: BaseContext) -> NavigationTree | None:
+    site = _get_site(context)
+    if site is None:
+        return None
+    return get_navigation_tree(site, context.get("request"))
 
 
 @register.simple_tag(takes_context=True)
-def get_legal_pages(context: BaseContext) -> list[Page]:
-    root = get_site_root(context)
-    if not root:
-        return []
+def get_site_root(context: BaseContext) -> Page | None:
+    site = _get_site(context)
+    return site.root_page if site is not None else None
+
+
+@register.simple_tag(takes_context=True)
+def get_home_url(context: BaseContext) -> str:
+    navigation = _get_navigation(context)
+    return navigation.home_url if navigation else "/"
+
 
-    legal_index = LegalIndexPage.objects.live().descendant_of(root).first()
-    if legal_index:
-        return legal_index.get_children().live().in_menu()
-    return []
+@register.simple_tag(takes_context=True)
+def get_menu_pages(context: BaseContext) -> list[NavigationLink]:
+    navigation = _get_navigation(context)
+    if not navigation:
+        return []
+    return [link for link in navigation.sections if link.in_menu]
 
 
 @register.simple_tag(takes_context=True)
-def get_about_pages(context: BaseContext) -> list[Page]:
-    root = get_site_root(context)
-    if not root:
+def get_legal_pages(context: BaseContext) -> list[NavigationLink]:
+    navigation = _get_navigation(context)
+    if not navigation:
         return []
+    return [link for link in navigation.legal_pages if link.in_menu]
 
-    about_index = AboutIndexPage.objects.live().descendant_of(root).first()
-    if about_index:
-        return about_index.get_children().live().in_menu()
-    return []
+
+@register.simple_tag(takes_context=True)
+def get_about_pages(context: BaseContext) -> list[NavigationLink]:
+    navigation = _get_navigation(context)
+    if not navigation:
+        return []
+    return [link for link in navigation.about_pages if link.in_menu]
 
 
 @dataclass
@@ -64,28 +76,22 @@ class MenuItem:
 def get_navigation_menu_items(
     context: BaseContext,
 ) -> list[MenuItem]:
-    root = get_site_root(context)
+    navigation = _get_navigation(context)
     request = context["request"]
-    if not root or not request:
+    if not navigation or not request:
         return []
 
-    home_url = pageurl(context, root) or "/"
-
     menu_items = [
         MenuItem(
             title=_("Home"),
-            url=home_url,
-            is_active=request.path == home_url,
+            url=navigation.home_url,
+            is_active=request.path == navigation.home_url,
         )
     ]
-    for page in root.get_children().live().in_menu():
-        page_url = pageurl(context, page)
-        menu_items.append(
-            MenuItem(
-                title=page.title,
-                url=page_url or "#",
-                is_active=request.path == page_url,
+    for link in navigation.sections:
+        if link.in_menu:
+            menu_items.append(
+                MenuItem(title=link.title, url=link.url, is_active=request.path == link.url)
             )
-        )
 
     return menu_items
@@ -1,5 +1,6 @@
 import json
 from typing import Any
+from urllib.parse import urljoin
 
 from django import template
 from django.conf import settings
@@ -8,6 +9,9 @@ from django.utils.safestring import SafeString, mark_safe
 from wagtail.images.models import Image, SourceImageIOError
 from wagtail.models import Page
 
+from core.cache import STRUCTURED_DATA_KEY, STRUCTURED_DATA_TIMEOUT, get_or_compute
+from core.renditions import SOCIAL_IMAGE_RENDITION
+
 register = template.Library()
 
 
@@ -16,35 +20,39 @@ register = template.Library()
 # ---------------------------------------------------------------------------
 
 
-def _absolute_url(request: HttpRequest, path: str) -> str:
-    return request.build_absolute_uri(path)
+def _site_root_url(page: Page) -> str:
+    site = page.get_site()
+    return site.root_url if site is not None else settings.WAGTAILADMIN_BASE_URL
+
 
+def _absolute_url(root_url: str, path: str) -> str:
+    return urljoin(f"{root_url}/", path)
 
-def _image_url(request: HttpRequest, image: Image, spec: str = "fill-1200x630") -> str | None:
+
+def _image_url(root_url: str, image: Image, spec: str = SOCIAL_IMAGE_RENDITION) -> str | None:
     if image is None:
         return None
 
     try:
         rendition = image.get_rendition(spec)
-        return _absolute_url(request, rendition.url)
+        return _absolute_url(root_url, rendition.url)
     except SourceImageIOError:
         return None
 
 
-def _page_url(request: HttpRequest, page: Page) -> str:
-    return _absolute_url(request, page.url)
+def _page_url(root_url: str, page: Page) -> str:
+    return _absolute_url(root_url, page.get_url() or "/")
 
 
-def _site_name(request: HttpRequest) -> str:
+def _site_name() -> str:
     return settings.WEBSITE_NAME
 
 
-def _organization(request: HttpRequest) -> dict[str, str]:
-    name = _site_name(request)
+def _organization(root_url: str) -> dict[str, str]:
     return {
         "@type": "Organization",
-        "name": name,
-        "url": _absolute_url(request, "/"),
+        "name": _site_name(),
+        "url": _absolute_url(root_url, "/"),
     }
 
 
@@ -53,44 +61,44 @@ def _organization(request: HttpRequest) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-def _schema_for_home(request: HttpRequest, page: Page) -> dict[str, Any]:
-    site_name = _site_name(request)
+def _schema_for_home(root_url: str, page: Page) -> dict[str, Any]:
+    site_name = _site_name()
     data: dict[str, Any] = {
         "@context": "https://schema.org",
         "@type": "WebSite",
         "name": site_name or page.title,
-        "url": _absolute_url(request, "/"),
+        "url": _absolute_url(root_url, "/"),
     }
     if page.search_description:
         data["description"] = page.search_description
     return data
 
 
-def _schema_for_pedagogy_index(request: HttpRequest, page: Page) -> dict[str, Any]:
+def _schema_for_pedagogy_index(root_url: str, page: Page) -> dict[str, Any]:
     return {
         "@context": "https://schema.org",
         "@type": "CollectionPage",
         "name": page.title,
-        "url": _page_url(request, page),
+        "url": _page_url(root_url, page),
         "description": getattr(page, "page_introduction", "") or page.search_description or "",
-        "publisher": _organization(request),
+        "publisher": _organization(root_url),
     }
 
 
-def _schema_for_pedagogy_card(request: HttpRequest, page: Page) -> dict[str, Any]:
+def _schema_for_pedagogy_card(root_url: str, page: Page) -> dict[str, Any]:
     data: dict[str, Any] = {
         "@context": "https://schema.org",
         "@type": "LearningResource",
         "name": page.title,
-        "url": _page_url(request, page),
-        "publisher": _organization(request),
+        "url": _page_url(root_url, page),
+        "publisher": _organization(root_url),
     }
     description = getattr(page, "description", "") or page.search_description or ""
 
     if description:
         data["description"] = description
 
-    image_url = _image_url(request, getattr(page, "hero_image", None))
+    image_url = _image_url(root_url, getattr(page, "hero_image", None))
     if image_url:
         data["image"] = image_url
 
@@ -101,31 +109,31 @@ def _schema_for_pedagogy_card(request: HttpRequest, page: Page) -> dict[str, Any
     return data
 
 
-def _schema_for_publication_index(request: HttpRequest, page: Page) -> dict[str, Any]:
+def _schema_for_publication_index(root_url: str, page: Page) -> dict[str, Any]:
     return {
         "@context": "https://schema.org",
         "@type": "CollectionPage",
         "name": page.title,
-        "url": _page_url(request, page),
+        "url": _page_url(root_url, page),
         "description": getattr(page, "page_introduction", "") or page.search_description or "",
-        "publisher": _organization(request),
+        "publisher": _organization(root_url),
     }
 
 
-def _schema_for_project(request: HttpRequest, page: Page) -> dict[str, Any]:
+def _schema_for_project(root_url: str, page: Page) -> dict[str, Any]:
     data: dict[str, Any] = {
         "@context": "https://schema.org",
         "@type": "Article",
         "name": page.title,
         "headline": page.title,
-        "url": _page_url(request, page),
-        "publisher": _organization(request),
+        "url": _page_url(root_url, page),
+        "publisher": _organization(root_url),
     }
     description = getattr(page, "description", "") or page.search_description or ""
     if description:
         data["description"] = description
 
-    image_url = _image_url(request, getattr(page, "hero_image", None))
+    image_url = _image_url(root_url, getattr(page, "hero_image", None))
     if image_url:
         data["image"] = image_url
 
@@ -142,19 +150,19 @@ def _schema_for_project(request: HttpRequest, page: Page) -> dict[str, Any]:
     return data
 
 
-def _schema_for_event(request: HttpRequest, page: Page) -> dict[str, Any]:
+def _schema_for_event(root_url: str, page: Page) -> dict[str, Any]:
     data: dict[str, Any] = {
         "@context": "https://schema.org",
         "@type": "Event",
         "name": page.title,
-        "url": _page_url(request, page),
-        "organizer": _organization(request),
+        "url": _page_url(root_url, page),
+        "organizer": _organization(root_url),
     }
     description = getattr(page, "description", "") or page.search_description or ""
     if description:
         data["description"] = description
 
-    image_url = _image_url(request, getattr(page, "hero_image", None))
+    image_url = _image_url(root_url, getattr(page, "hero_image", None))
     if image_url:
         data["image"] = image_url
 
@@ -189,12 +197,12 @@ def _schema_for_event(request: HttpRequest, page: Page) -> dict[str, Any]:
     return data
 
 
-def _schema_fallback(request: HttpRequest, page: Page) -> dict[str, Any]:
+def _schema_fallback(root_url: str, page: Page) -> dict[str, Any]:
     data: dict[str, Any] = {
         "@context": "https://schema.org",
         "@type": "WebPage",
         "name": page.title,
-        "url": _page_url(request, page),
+        "url": _page_url(root_url, page),
     }
     if page.search_description:
         data["description"] = page.search_description
@@ -215,11 +223,45 @@ _SCHEMA_BUILDERS = {
 }
 
 
-def get_structured_data(request: HttpRequest, page: Page) -> dict[str, Any]:
-    """Return the structured data dict for the given page. Public API for testing."""
+def get_structured_data(page: Page) -> dict[str, Any]:
+    """Return the structured data dict for the given page. Public API for testing.
+
+    Absolute URLs are built from the root URL of the page's site.
+    """
     class_name = page.__class__.__name__
     builder = _SCHEMA_BUILDERS.get(class_name, _schema_fallback)
-    return builder(request, page)
+    return builder(_site_root_url(page), page)
+
+
+def render_structured_data(page: Page) -> SafeString:
+    """The ``<script type="application/ld+json">`` tag of ``page``."""
+    json_str = json.dumps(get_structured_data(page), ensure_ascii=True, indent=None)
+    # json.dumps does NOT escape <, > or & — they are ASCII and pass through
+    # unchanged. A page field containing "</script>" would otherwise break out
+    # of the tag and allow script injection. Escape them the same way
+    # django.utils.html.json_script does.
+    json_str = json_str.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+    return mark_safe(  # nosec B308 B703 — HTML-significant chars escaped above
+        f'<script type="application/ld+json">{json_str}</script>'
+    )
+
+
+def get_cached_structured_data(request: HttpRequest, page: Page) -> SafeString:
+    """:func:`render_structured_data`, cached per page and live revision.
+
+    Only the live version of a page is cached: previews, and pages never
+    published through a revision, are rendered each time.
+    """
+    revision_id = page.live_revision_id
+    if getattr(request, "is_preview", False) or not page.live or revision_id is None:
+        return render_structured_data(page)
+
+    key = STRUCTURED_DATA_KEY.format(page_id=page.pk, revision_id=revision_id)
+    return mark_safe(  # nosec B308 B703 — cached output of render_structured_data
+        get_or_compute(
+            key, lambda: str(render_structured_data(page)), timeout=STRUCTURED_DATA_TIMEOUT
+        )
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -236,13 +278,4 @@ def structured_data_script(context: Any) -> SafeString:
     if request is None or page is None:
         return mark_safe("")  # nosec B308 B703 — literal empty string, no user input
 
-    schema = get_structured_data(request, page)
-    json_str = json.dumps(schema, ensure_ascii=True, indent=None)
-    # json.dumps does NOT escape <, > or & — they are ASCII and pass through
-    # unchanged. A page field containing "</script>" would otherwise break out
-    # of the tag and allow script injection. Escape them the same way
-    # django.utils.html.json_script does.
-    json_str = json_str.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
-    return mark_safe(  # nosec B308 B703 — HTML-significant chars escaped above
-        f'<script type="application/ld+json">{json_str}</script>'
-    )
+    return get_cached_structured_data(request, page)
@@ -5,14 +5,42 @@ no-op for the rest of the suite); these tests swap in a real in-memory cache to
 exercise the caching and invalidation paths.
 """
 
+import threading
+import time
+
+from datetime import timedelta
+
 import pytest
 from django.core.cache import caches
+from django.db import connection
+from django.template import Context, Template
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import Page
 
 from core.blocks import RecentPublicationsBlock
-from core.cache import RECENT_PUBLICATIONS_KEY
+from core import cache as content_cache
+from core.cache import (
+    RECENT_PUBLICATIONS_KEY,
+    RECOMPUTE_LOCK_KEY,
+    _Entry,
+    get_or_compute,
+    get_page_tags,
+    page_type_tag,
+    pagination_count_key,
+    subtree_tag,
+    tagged_key,
+)
+from core.pagination import CachedCountPaginator
+from core.tests.utils.factories import ImageFactory
+from pedagogy.factories.pedagogy_card_factory import PedagogyCardPageFactory
 from pedagogy.models.pedagogy_index import PedagogyIndexPage
+from publications.models.event import EventPage
+from publications.models.project import ProjectPage
+from publications.models.publication import PublicationPage
 from publications.models.publication_index import PublicationIndexPage
+from publications.services import PublicationFilters
 
 _LOCMEM_CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache", "LOCATION": ""},
@@ -29,39 +57,91 @@ def locmem_content_cache(settings):
 
 
 @pytest.mark.django_db
-def test_publishing_a_page_flushes_content_cache(locmem_content_cache):
-    cache = caches["content"]
-    cache.set("sentinel", "value", 300)
-    assert cache.get("sentinel") == "value"
-
+def test_publishing_a_page_invalidates_its_tags(locmem_content_cache):
     index = PublicationIndexPage.objects.get()
+    subtree_key = tagged_key("fragment", [subtree_tag(index)])
+    type_key = tagged_key("fragment", [page_type_tag(PublicationIndexPage)])
+
     index.save_revision().publish()
 
-    assert cache.get("sentinel") is None
+    assert tagged_key("fragment", [subtree_tag(index)]) != subtree_key
+    assert tagged_key("fragment", [page_type_tag(PublicationIndexPage)]) != type_key
 
 
 @pytest.mark.django_db
-def test_unpublishing_a_page_flushes_content_cache(locmem_content_cache):
-    cache = caches["content"]
+def test_unpublishing_a_page_invalidates_its_tags(locmem_content_cache):
     index = PublicationIndexPage.objects.get()
-    cache.set("sentinel", "value", 300)
+    key = tagged_key("fragment", [subtree_tag(index)])
 
     index.unpublish()
 
-    assert cache.get("sentinel") is None
+    assert tagged_key("fragment", [subtree_tag(index)]) != key
 
 
 @pytest.mark.django_db
-def test_recent_publications_block_caches_query(locmem_content_cache):
+def test_publishing_an_unrelated_page_keeps_other_fragments(locmem_content_cache):
+    publications = PublicationIndexPage.objects.get()
+    pedagogy = PedagogyIndexPage.objects.get()
+    publication_keys = [
+        tagged_key("fragment", [subtree_tag(publications)]),
+        tagged_key("fragment", [page_type_tag(PublicationPage)]),
+    ]
+    pedagogy_key = tagged_key("fragment", [subtree_tag(pedagogy)])
+
+    pedagogy.save_revision().publish()
+
+    assert [
+        tagged_key("fragment", [subtree_tag(publications)]),
+        tagged_key("fragment", [page_type_tag(PublicationPage)]),
+    ] == publication_keys
+    assert tagged_key("fragment", [subtree_tag(pedagogy)]) != pedagogy_key
+
+
+@pytest.mark.django_db
+def test_publishing_a_child_invalidates_ancestor_subtrees_and_supertypes():
+    index = PublicationIndexPage.objects.get()
+    project = ProjectPage(title="Tagged", slug="tagged")
+    index.add_child(instance=project)
+
+    tags = get_page_tags(project)
+
+    assert page_type_tag(ProjectPage) in tags
+    assert page_type_tag(PublicationPage) in tags
+    assert page_type_tag(Page) in tags
+    assert subtree_tag(index) in tags
+    assert subtree_tag(project) in tags
+
+
+@pytest.mark.django_db
+def test_recent_publications_block_caches_rendered_html(
+    locmem_content_cache, django_assert_num_queries
+):
     block = RecentPublicationsBlock()
-    cache_key = RECENT_PUBLICATIONS_KEY.format(count=5)
+    cache_key = tagged_key(
+        RECENT_PUBLICATIONS_KEY.format(count=5, language="fr", container=1),
+        [page_type_tag(PublicationPage)],
+    )
     assert caches["content"].get(cache_key) is None
 
-    context = block.get_context({"number_of_publications": 5})
+    html = block.render({"number_of_publications": 5}, {"container": True})
 
-    assert isinstance(context["publications"], list)
-    # The query result is now memoised in the content cache.
+    # The HTML is now memoised in the content cache, and served without queries.
     assert caches["content"].get(cache_key) is not None
+    with django_assert_num_queries(0):
+        assert block.render({"number_of_publications": 5}, {"container": True}) == html
+
+
+@pytest.mark.django_db
+def test_recent_publications_block_is_rerendered_after_publish(locmem_content_cache):
+    block = RecentPublicationsBlock()
+    value = {"number_of_publications": 5}
+    assert "Nouveau projet" not in block.render(value)
+
+    project = ProjectPage(title="Nouveau projet", slug="nouveau-projet")
+    PublicationIndexPage.objects.get().add_child(instance=project)
+    project.save_revision().publish()
+
+    assert "Nouveau projet" in block.render(value)
 
 
 @pytest.mark.django_db
@@ -73,8 +153,165 @@ def test_publication_index_renders_with_cache_tag(client: Client):
     assert response.status_code == 200
 
 
+def _listing_queries(client: Client, url: str) -> list[str]:
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get(url).status_code == 200
+    return [query["sql"] for query in queries.captured_queries]
+
+
+@pytest.mark.django_db
+def test_cached_publication_listing_skips_the_listing_queries(locmem_content_cache, client):
+    index = PublicationIndexPage.objects.get()
+    for number in range(3):
+        index.add_child(
+            instance=EventPage(
+                title=f"Event {number}",
+                slug=f"event-{number}",
+                event_date=timezone.now() + timedelta(days=number + 1),
+            )
+        )
+    url = f"{index.url}?type=events"
+
+    cold = _listing_queries(client, url)
+    warm = _listing_queries(client, url)
+
+    assert any("publications_eventpage" in sql for sql in cold)
+    assert not any(
+        "publications_publicationpage" in sql or "publications_eventpage" in sql for sql in warm
+    )
+
+
+@pytest.mark.django_db
+def test_cached_pedagogy_listing_skips_the_card_image_queries(locmem_content_cache, client):
+    index = PedagogyIndexPage.objects.get()
+    PedagogyCardPageFactory.create(parent=index, hero_image=ImageFactory.create())
+
+    cold = _listing_queries(client, index.url)
+    warm = _listing_queries(client, index.url)
+
+    assert any("wagtailimages" in sql for sql in cold)
+    assert not any("wagtailimages" in sql or "pedagogy_pedagogycardpage" in sql for sql in warm)
+
+
 @pytest.mark.django_db
 def test_pedagogy_index_renders_with_cache_tag(client: Client):
     index = PedagogyIndexPage.objects.get()
     response = client.get(index.url)
     assert response.status_code == 200
+
+
+def test_pagination_count_key_depends_on_every_filter():
+    key = pagination_count_key("publications:3", type="all", search="vélo")
+    assert key == pagination_count_key("publications:3", search="vélo", type="all")
+    assert key != pagination_count_key("publications:3", type="all", search="velo")
+    assert key != pagination_count_key("publications:4", type="all", search="vélo")
+
+
+@pytest.mark.django_db
+def test_cached_count_paginator_counts_once(locmem_content_cache, django_assert_num_queries):
+    key = pagination_count_key("test", search="")
+
+    with django_assert_num_queries(1):
+        assert CachedCountPaginator(PublicationPage.objects.all(), 10, count_key=key).count == 0
+    with django_assert_num_queries(0):
+        assert CachedCountPaginator(PublicationPage.objects.all(), 10, count_key=key).count == 0
+    assert caches["content"].get(key) == 0
+
+
+@pytest.mark.django_db
+def test_publication_index_count_is_cached_until_publish(locmem_content_cache, rf):
+    index = PublicationIndexPage.objects.get()
+    filters = PublicationFilters.from_request(rf.get("/", {"type": "projects"}))
+    key = tagged_key(filters.count_key(f"publications:{index.pk}"), [subtree_tag(index)])
+
+    index.get_publications(rf.get("/", {"type": "projects"}))
+    assert caches["content"].get(key) is not None
+
+    index.save_revision().publish()
+    assert tagged_key(filters.count_key(f"publications:{index.pk}"), [subtree_tag(index)]) != key
+
+
+def _counting(value):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return value
+
+    return compute, calls
+
+
+def test_get_or_compute_caches_the_value(locmem_content_cache):
+    compute, calls = _counting("fresh")
+
+    assert get_or_compute("fragment", compute) == "fresh"
+    assert get_or_compute("fragment", compute) == "fresh"
+    assert len(calls) == 1
+
+
+def test_get_or_compute_serves_previous_value_while_another_request_recomputes(
+    locmem_content_cache,
+):
+    cache = caches["content"]
+    # Already expired, but kept for the stale grace period.
+    get_or_compute("fragment", lambda: "previous", timeout=-1)
+    cache.add(RECOMPUTE_LOCK_KEY.format(key="fragment"), 1)
+    compute, calls = _counting("fresh")
+
+    assert get_or_compute("fragment", compute) == "previous"
+    assert calls == []
+
+
+def test_get_or_compute_waits_for_the_recomputing_request(locmem_content_cache, monkeypatch):
+    monkeypatch.setattr(content_cache, "RECOMPUTE_POLL_INTERVAL", 0.01)
+    cache = caches["content"]
+    cache.add(RECOMPUTE_LOCK_KEY.format(key="fragment"), 1)
+    # Stands in for the request holding the lock, storing its result shortly.
+    threading.Timer(
+        0.05, lambda: cache.set("fragment", _Entry("theirs", time.time() + 300, 0))
+    ).start()
+    compute, calls = _counting("mine")
+
+    assert get_or_compute("fragment", compute) == "theirs"
+    assert calls == []
+
+
+def test_get_or_compute_recomputes_once_under_concurrency(locmem_content_cache, monkeypatch):
+    monkeypatch.setattr(content_cache, "RECOMPUTE_POLL_INTERVAL", 0.01)
+    calls = []
+
+    def slow_compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_or_compute("fragment", slow_compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+def test_get_or_compute_expires_early_as_expiry_nears(locmem_content_cache):
+    get_or_compute("fragment", lambda: "old", timeout=-1)
+    compute, calls = _counting("new")
+
+    assert get_or_compute("fragment", compute) == "new"
+    assert len(calls) == 1
+
+
+def test_content_cache_tag_renders_fragment_once(locmem_content_cache):
+    template = Template(
+        "{% load content_cache %}{% content_cache 300 fragment name %}{{ value }}{% endcontent_cache %}"
+    )
+
+    assert template.render(Context({"name": "a", "value": "first"})) == "first"
+    assert template.render(Context({"name": "a", "value": "second"})) == "first"
+    assert template.render(Context({"name": "b", "value": "second"})) == "second"
@@ -0,0 +1,132 @@
+"""Tests for the post-publish content cache warm-up."""
+
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+import pytest
+from django.core.cache import caches
+from django.core.cache.utils import make_template_fragment_key
+from django.core.management import call_command
+from django.core.management.commands.migrate import Command as MigrateCommand
+
+from core.templatetags.content_cache import subtree_cache_version
+from core.warmup import CONTENT_WARMUP_PENDING_KEY, get_warmup_requests, warm_content_cache
+from pedagogy.models import PedagogyIndexPage
+from publications.models import ProjectCategory
+from publications.models.publication_index import PublicationIndexPage
+
+_LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache", "LOCATION": ""},
+    "content": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+@pytest.fixture
+def locmem_content_cache(settings):
+    settings.CACHES = _LOCMEM_CACHES
+    # As with a real worker, so publishes schedule the warm-up instead of skipping it.
+    settings.CELERY_TASK_ALWAYS_EAGER = False
+    caches["content"].clear()
+    yield
+    caches["content"].clear()
+
+
+def _fragment_keys(name: str, index_model: type) -> list[str]:
+    """The keys ``{% content_cache %}`` stores the warmed ``name`` fragments under."""
+    return [
+        make_template_fragment_key(name, [page.id, urlencode(query), subtree_cache_version(page)])
+        for page, query in get_warmup_requests()
+        if isinstance(page.specific, index_model)
+    ]
+
+
+@pytest.mark.django_db
+def test_publish_burst_schedules_a_single_warmup(
+    locmem_content_cache, django_capture_on_commit_callbacks
+):
+    index = PublicationIndexPage.objects.get()
+
+    with patch("core.tasks.warm_content_cache.apply_async") as apply_async:
+        with django_capture_on_commit_callbacks(execute=True):
+            for _ in range(3):
+                index.save_revision().publish()
+
+    apply_async.assert_called_once()
+    assert caches["content"].get(CONTENT_WARMUP_PENDING_KEY) is not None
+
+
+@pytest.mark.django_db
+def test_publish_with_eager_celery_skips_the_warmup(
+    locmem_content_cache, settings, django_capture_on_commit_callbacks
+):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    index = PublicationIndexPage.objects.get()
+
+    with patch("core.tasks.warm_content_cache.apply_async") as apply_async:
+        with django_capture_on_commit_callbacks(execute=True):
+            index.save_revision().publish()
+
+    apply_async.assert_not_called()
+    assert caches["content"].get(CONTENT_WARMUP_PENDING_KEY) is None
+
+
+@pytest.mark.django_db
+def test_publish_during_migrations_skips_the_warmup(
+    locmem_content_cache, django_capture_on_commit_callbacks
+):
+    index = PublicationIndexPage.objects.get()
+
+    def migrate(*args, **options):
+        with django_capture_on_commit_callbacks(execute=True):
+            index.save_revision().publish()
+
+    with patch("core.tasks.warm_content_cache.apply_async") as apply_async:
+        with patch.object(MigrateCommand, "handle", migrate):
+            call_command("migrate")
+
+    apply_async.assert_not_called()
+    assert caches["content"].get(CONTENT_WARMUP_PENDING_KEY) is None
+
+
+@pytest.mark.django_db
+def test_failed_migration_resumes_warmups(locmem_content_cache, django_capture_on_commit_callbacks):
+    index = PublicationIndexPage.objects.get()
+
+    with patch.object(MigrateCommand, "handle", side_effect=RuntimeError("broken migration")):
+        with pytest.raises(RuntimeError):
+            call_command("migrate")
+
+    with patch("core.tasks.warm_content_cache.apply_async") as apply_async:
+        with django_capture_on_commit_callbacks(execute=True):
+            index.save_revision().publish()
+
+    apply_async.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_warmup_covers_each_publication_filter():
+    index = PublicationIndexPage.objects.get()
+
+    queries = [query for page, query in get_warmup_requests() if page.pk == index.pk]
+
+    assert {} in queries
+    assert {"type": "events"} in queries
+    for category in ProjectCategory.values:
+        assert {"type": "projects", "category": category} in queries
+
+
+@pytest.mark.django_db
+def test_warmup_renders_and_stores_list_fragments(locmem_content_cache):
+    caches["content"].add(CONTENT_WARMUP_PENDING_KEY, 1)
+
+    rendered = warm_content_cache()
+
+    assert rendered == len(get_warmup_requests())
+    publication_keys = _fragment_keys("publications_list", PublicationIndexPage)
+    pedagogy_keys = _fragment_keys("pedagogy_list", PedagogyIndexPage)
+    assert len(publication_keys) == 3 + len(ProjectCategory.values)
+    assert len(pedagogy_keys) == 1
+    stored = caches["content"].get_many(publication_keys + pedagogy_keys)
+    assert set(stored) == {*publication_keys, *pedagogy_keys}
+    # Publishes from now on schedule a new warm-up.
+    assert caches["content"].get(CONTENT_WARMUP_PENDING_KEY) is None
@@ -1,8 +1,14 @@
+from django.core.cache import caches
 from django.template.context import BaseContext
-from django.test import TestCase, RequestFactory
+from django.test import TestCase, RequestFactory, override_settings
 from django.template import Context, Template
 from wagtail.models import Site, Page
-from core.templatetags.navigation_tags import get_site_root, get_legal_pages
+from core.templatetags.navigation_tags import (
+    get_about_pages,
+    get_legal_pages,
+    get_navigation_menu_items,
+    get_site_root,
+)
 from legal.models import LegalIndexPage, TermsOfServicePage
 
 
@@ -122,3 +128,79 @@ class LegalPagesTagTests(TestCase):
         pages = get_legal_pages(context)
 
         self.assertEqual(len(pages), 0)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "content": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+)
+class NavigationCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.root = Site.objects.get(is_default_site=True).root_page
+        caches["content"].clear()
+
+    def _context(self, path: str = "/") -> BaseContext:
+        request = self.factory.get(path)
+        # Wagtail's serve view resolves the site before templates render.
+        Site.find_for_request(request)
+        return BaseContext({"request": request})
+
+    def _menu_titles(self) -> list[str]:
+        return [str(item.title) for item in get_navigation_menu_items(self._context())]
+
+    def test_navigation_is_served_from_the_cache(self) -> None:
+        self._menu_titles()
+
+        context = self._context()
+        with self.assertNumQueries(0):
+            get_navigation_menu_items(context)
+            get_legal_pages(context)
+            get_about_pages(context)
+
+    def test_active_item_is_computed_per_request(self) -> None:
+        section = Page(title="Section", slug="section", show_in_menus=True)
+        self.root.add_child(instance=section)
+        section_url = section.get_url()
+
+        on_home = get_navigation_menu_items(self._context("/"))
+        on_section = get_navigation_menu_items(self._context(section_url))
+
+        self.assertEqual([item.is_active for item in on_home][:1], [True])
+        self.assertEqual([str(item.title) for item in on_section if item.is_active], ["Section"])
+
+    def test_publish_and_unpublish_update_the_menu(self) -> None:
+        self.assertNotIn("New section", self._menu_titles())
+
+        section = Page(title="New section", slug="new-section", show_in_menus=True, live=False)
+        self.root.add_child(instance=section)
+        self.assertNotIn("New section", self._menu_titles())
+
+        section.save_revision().publish()
+        self.assertIn("New section", self._menu_titles())
+
+        section.refresh_from_db()
+        section.unpublish()
+        self.assertNotIn("New section", self._menu_titles())
+
+    def test_moving_a_page_updates_the_menu(self) -> None:
+        container = Page(title="Container", slug="container", show_in_menus=False)
+        self.root.add_child(instance=container)
+        section = Page(title="Moved section", slug="moved-section", show_in_menus=True)
+        container.add_child(instance=section)
+        self.assertNotIn("Moved section", self._menu_titles())
+
+        section.move(self.root, pos="last-child")
+
+        self.assertIn("Moved section", self._menu_titles())
+
+    def test_deleting_a_page_updates_the_menu(self) -> None:
+        section = Page(title="Deleted section", slug="deleted-section", show_in_menus=True)
+        self.root.add_child(instance=section)
+        self.assertIn("Deleted section", self._menu_titles())
+
+        section.delete()
+
+        self.assertNotIn("Deleted section", self._menu_titles())
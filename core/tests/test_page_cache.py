@@ -0,0 +1,134 @@
+"""Tests for the anonymous full-page response cache (``core.page_cache``)."""
+
+import pytest
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from core.cache import CONTENT_TAG_VERSION_KEY
+from core.page_cache import normalize_query_string, page_url_tag
+from home.models import HomePage
+from pedagogy.models import PedagogyIndexPage
+from publications.factories import ProjectPageFactory
+from publications.models import PublicationIndexPage
+
+_LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "content": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "content"},
+}
+
+
+@pytest.fixture
+def page_cache(settings):
+    settings.CACHES = _LOCMEM_CACHES
+    caches["content"].clear()
+    yield
+    caches["content"].clear()
+
+
+@pytest.fixture
+def project(db):
+    index = PublicationIndexPage.objects.get()
+    project = ProjectPageFactory.create(parent=index, title="Projet en cache", hero_image=None)
+    project.save_revision().publish()
+    project.refresh_from_db()
+    return project
+
+
+def _get(client: Client, url: str) -> str:
+    response = client.get(url)
+    assert response.status_code == 200
+    return response.content.decode()
+
+
+def _is_cached(client: Client, url: str) -> bool:
+    with CaptureQueriesContext(connection) as queries:
+        _get(client, url)
+    return not queries.captured_queries
+
+
+def test_query_strings_are_normalized():
+    assert normalize_query_string("b=2&a=1&utm_source=news&fbclid=x") == "a=1&b=2"
+    assert normalize_query_string("") == ""
+
+
+@pytest.mark.django_db
+def test_anonymous_page_view_is_served_from_the_cache(
+    page_cache, project, client, django_assert_num_queries
+):
+    first = _get(client, project.url)
+
+    with django_assert_num_queries(0):
+        response = client.get(f"{project.url}?utm_campaign=spring")
+
+    assert response.content.decode() == first
+    assert "Cookie" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_authenticated_visitors_bypass_the_cache(page_cache, project, client, django_user_model):
+    _get(client, project.url)
+    user = django_user_model.objects.create_user(
+        email="visitor@example.com", password="x", first_name="Camille"
+    )
+    client.force_login(user)
+
+    assert "Camille" in _get(client, project.url)
+
+
+@pytest.mark.django_db
+def test_other_page_types_are_not_cached(page_cache, client):
+    index = PedagogyIndexPage.objects.get()
+    _get(client, index.url)
+
+    assert not _is_cached(client, index.url)
+
+
+@pytest.mark.django_db
+def test_uncached_paths_leave_no_tag_counter(page_cache, client):
+    index = PedagogyIndexPage.objects.get()
+    client.get(index.url)
+    client.get("/page-inexistante/")
+    client.head("/page-inexistante/")
+
+    for path in (index.url, "/page-inexistante/"):
+        assert not caches["content"].has_key(CONTENT_TAG_VERSION_KEY.format(tag=page_url_tag(path)))
+
+
+@pytest.mark.django_db
+def test_publishing_purges_the_page_and_its_ancestors_only(page_cache, project, client):
+    other = ProjectPageFactory.create(
+        parent=project.get_parent(), title="Autre projet", hero_image=None
+    )
+    other.save_revision().publish()
+    home = HomePage.objects.get()
+    for url in (project.url, home.url, other.url):
+        _get(client, url)
+
+    project.title = "Projet renommé"
+    project.save_revision().publish()
+
+    assert "Projet renommé" in _get(client, project.url)
+    assert not _is_cached(client, home.url)
+    assert _is_cached(client, other.url)
+
+
+@pytest.mark.django_db
+def test_navigation_changes_purge_every_page(page_cache, project, client):
+    _get(client, project.url)
+    index = PublicationIndexPage.objects.get()
+
+    index.title = "Toutes les publications"
+    index.save_revision().publish()
+
+    assert "Toutes les publications" in _get(client, project.url)
+
+
+@pytest.mark.django_db
+def test_csrf_token_endpoint_sets_a_token(client):
+    response = client.get("/api/csrf/")
+
+    assert response.json()["csrfToken"]
+    assert "csrftoken" in response.cookies
+    assert "no-cache" in response["Cache-Control"]
@@ -0,0 +1,106 @@
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from wagtail.images import get_image_model
+
+from core.blocks import BLOCK_TYPE_IMAGE, BLOCK_TYPE_TWO_COLUMN, ImageSize
+from core.renditions import (
+    CARD_IMAGE_RENDITION,
+    SOCIAL_IMAGE_RENDITION,
+    generate_page_renditions,
+    get_page_renditions,
+    get_registered_specs,
+    prefetch_card_images,
+)
+from core.tests.utils.factories import ImageFactory
+from publications.models import ProjectPage, PublicationIndexPage, PublicationPage
+
+_IMAGE_TAG_SPEC = re.compile(r"{%\s*image\s+\S+\s+([\w-]+)")
+
+
+def _template_specs() -> set[str]:
+    specs = set()
+    for template in Path(settings.BASE_DIR).glob("*/templates/**/*.html"):
+        specs.update(_IMAGE_TAG_SPEC.findall(template.read_text()))
+    return specs
+
+
+def test_every_template_spec_is_registered():
+    assert _template_specs() <= get_registered_specs()
+
+
+@pytest.fixture
+def project(db):
+    index = PublicationIndexPage.objects.get()
+    hero, inline = ImageFactory.create(), ImageFactory.create()
+    page = ProjectPage(
+        title="Illustrated",
+        slug="illustrated",
+        hero_image=hero,
+        content=[
+            (BLOCK_TYPE_IMAGE, {"image": inline, "size": ImageSize.SMALL, "alt_text": ""}),
+            (
+                BLOCK_TYPE_TWO_COLUMN,
+                {
+                    "left_column": [
+                        (
+                            BLOCK_TYPE_IMAGE,
+                            {"image": inline, "size": ImageSize.FULL, "alt_text": ""},
+                        )
+                    ],
+                    "right_column": [],
+                },
+            ),
+        ],
+    )
+    index.add_child(instance=page)
+    return page
+
+
+def test_page_renditions_cover_hero_and_nested_stream_images(project):
+    renditions = get_page_renditions(project)
+
+    assert {CARD_IMAGE_RENDITION, SOCIAL_IMAGE_RENDITION} <= renditions[project.hero_image]
+    inline = project.content[0].value["image"]
+    assert renditions[inline] == {"width-400", "width-1920"}
+
+
+def test_generating_renditions_twice_creates_them_once(project):
+    Rendition = get_image_model().get_rendition_model()
+
+    generate_page_renditions(project)
+    created = Rendition.objects.count()
+    generate_page_renditions(project)
+
+    assert created == sum(len(specs) for specs in get_page_renditions(project).values())
+    assert Rendition.objects.count() == created
+
+
+def test_publishing_schedules_rendition_generation(project, django_capture_on_commit_callbacks):
+    with patch("core.tasks.generate_page_renditions.delay") as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            project.save_revision().publish()
+
+    delay.assert_called_once_with(project.pk)
+
+
+def test_card_images_load_in_constant_queries(db, django_assert_num_queries):
+    index = PublicationIndexPage.objects.get()
+    for number in range(3):
+        page = ProjectPage(title=f"Card {number}", hero_image=ImageFactory.create())
+        index.add_child(instance=page)
+        page.hero_image.get_rendition(CARD_IMAGE_RENDITION)
+    index.add_child(instance=ProjectPage(title="No image", hero_image=None))
+
+    publications = list(PublicationPage.objects.all())
+    # One query for the images, one for their renditions.
+    with django_assert_num_queries(2):
+        publications = prefetch_card_images(publications)
+
+    with django_assert_num_queries(0):
+        for publication in publications:
+            if publication.hero_image:
+                publication.hero_image.get_rendition(CARD_IMAGE_RENDITION)
@@ -2,7 +2,8 @@ import json
 from datetime import timedelta
 
 from django.conf import settings
-from django.test import RequestFactory, TestCase
+from django.core.cache import caches
+from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 from wagtail.models import Site
 
@@ -46,46 +47,46 @@ class StructuredDataBaseTestCase(TestCase):
 
 class HomePageStructuredDataTests(StructuredDataBaseTestCase):
     def test_type_is_website(self) -> None:
-        schema = get_structured_data(self.request, self.home)
+        schema = get_structured_data(self.home)
         self.assertEqual(schema["@type"], "WebSite")
         self.assertEqual(schema["@context"], "https://schema.org")
 
     def test_name_is_site_name(self) -> None:
-        schema = get_structured_data(self.request, self.home)
+        schema = get_structured_data(self.home)
         self.assertEqual(schema["name"], settings.WEBSITE_NAME)
 
     def test_url_is_present(self) -> None:
-        schema = get_structured_data(self.request, self.home)
+        schema = get_structured_data(self.home)
         self.assertIn("url", schema)
 
     def test_description_from_search_description(self) -> None:
         self.home.search_description = "La plateforme urbaine participative"
         self.home.save()
-        schema = get_structured_data(self.request, self.home)
+        schema = get_structured_data(self.home)
         self.assertEqual(schema["description"], "La plateforme urbaine participative")
 
     def test_no_description_when_empty(self) -> None:
         self.home.search_description = ""
         self.home.save()
-        schema = get_structured_data(self.request, self.home)
+        schema = get_structured_data(self.home)
         self.assertNotIn("description", schema)
 
 
 class PedagogyIndexStructuredDataTests(StructuredDataBaseTestCase):
     def test_type_is_collection_page(self) -> None:
-        schema = get_structured_data(self.request, self.pedagogy_index)
+        schema = get_structured_data(self.pedagogy_index)
         self.assertEqual(schema["@type"], "CollectionPage")
 
     def test_name_equals_title(self) -> None:
-        schema = get_structured_data(self.request, self.pedagogy_index)
+        schema = get_structured_data(self.pedagogy_index)
         self.assertEqual(schema["name"], self.pedagogy_index.title)
 
     def test_description_from_page_introduction(self) -> None:
-        schema = get_structured_data(self.request, self.pedagogy_index)
+        schema = get_structured_data(self.pedagogy_index)
         self.assertEqual(schema["description"], "Introduction pédagogique")
 
     def test_publisher_is_organisation(self) -> None:
-        schema = get_structured_data(self.request, self.pedagogy_index)
+        schema = get_structured_data(self.pedagogy_index)
         self.assertEqual(schema["publisher"]["@type"], "Organization")
         self.assertEqual(schema["publisher"]["name"], settings.WEBSITE_NAME)
 
@@ -100,44 +101,44 @@ class PedagogyCardStructuredDataTests(StructuredDataBaseTestCase):
         )
 
     def test_type_is_learning_resource(self) -> None:
-        schema = get_structured_data(self.request, self.card)
+        schema = get_structured_data(self.card)
         self.assertEqual(schema["@type"], "LearningResource")
 
     def test_name_equals_title(self) -> None:
-        schema = get_structured_data(self.request, self.card)
+        schema = get_structured_data(self.card)
         self.assertEqual(schema["name"], self.card.title)
 
     def test_description_from_card_description(self) -> None:
-        schema = get_structured_data(self.request, self.card)
+        schema = get_structured_data(self.card)
         self.assertEqual(schema["description"], "Une fiche sur l'urbanisme")
 
     def test_image_included_when_hero_image_present(self) -> None:
-        schema = get_structured_data(self.request, self.card)
+        schema = get_structured_data(self.card)
         self.assertIn("image", schema)
         self.assertIsInstance(schema["image"], str)
 
     def test_no_image_when_hero_image_missing(self) -> None:
         self.card.hero_image = None
-        schema = get_structured_data(self.request, self.card)
+        schema = get_structured_data(self.card)
         self.assertNotIn("image", schema)
 
     def test_date_published_after_publish(self) -> None:
         self.card.first_published_at = timezone.now()
-        schema = get_structured_data(self.request, self.card)
+        schema = get_structured_data(self.card)
         self.assertIn("datePublished", schema)
 
 
 class PublicationIndexStructuredDataTests(StructuredDataBaseTestCase):
     def test_type_is_collection_page(self) -> None:
-        schema = get_structured_data(self.request, self.publication_index)
+        schema = get_structured_data(self.publication_index)
         self.assertEqual(schema["@type"], "CollectionPage")
 
     def test_description_from_page_introduction(self) -> None:
-        schema = get_structured_data(self.request, self.publication_index)
+        schema = get_structured_data(self.publication_index)
         self.assertEqual(schema["description"], "Découvrez nos publications")
 
     def test_publisher_is_organisation(self) -> None:
-        schema = get_structured_data(self.request, self.publication_index)
+        schema = get_structured_data(self.publication_index)
         self.assertEqual(schema["publisher"]["@type"], "Organization")
 
 
@@ -152,29 +153,29 @@ class ProjectPageStructuredDataTests(StructuredDataBaseTestCase):
         )
 
     def test_type_is_article(self) -> None:
-        schema = get_structured_data(self.request, self.project)
+        schema = get_structured_data(self.project)
         self.assertEqual(schema["@type"], "Article")
 
     def test_name_equals_title(self) -> None:
-        schema = get_structured_data(self.request, self.project)
+        schema = get_structured_data(self.project)
         self.assertEqual(schema["name"], self.project.title)
 
     def test_description_present(self) -> None:
-        schema = get_structured_data(self.request, self.project)
+        schema = get_structured_data(self.project)
         self.assertEqual(schema["description"], "Un projet pour améliorer la mobilité")
 
     def test_article_section_from_category(self) -> None:
-        schema = get_structured_data(self.request, self.project)
+        schema = get_structured_data(self.project)
         self.assertIn("articleSection", schema)
         self.assertIsInstance(schema["articleSection"], str)
         self.assertNotEqual(schema["articleSection"], "")
 
     def test_image_included_when_hero_image_present(self) -> None:
-        schema = get_structured_data(self.request, self.project)
+        schema = get_structured_data(self.project)
         self.assertIn("image", schema)
 
     def test_publisher_is_organisation(self) -> None:
-        schema = get_structured_data(self.request, self.project)
+        schema = get_structured_data(self.project)
         self.assertEqual(schema["publisher"]["@type"], "Organization")
         self.assertEqual(schema["publisher"]["name"], settings.WEBSITE_NAME)
 
@@ -195,33 +196,33 @@ class EventPageStructuredDataTests(StructuredDataBaseTestCase):
         )
 
     def test_type_is_event(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertEqual(schema["@type"], "Event")
 
     def test_name_equals_title(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertEqual(schema["name"], self.event.title)
 
     def test_description_present(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertEqual(schema["description"], "Un forum pour les habitants")
 
     def test_start_date_present(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertIn("startDate", schema)
 
     def test_end_date_present(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertIn("endDate", schema)
 
     def test_offline_event_has_place_location(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertEqual(schema["location"]["@type"], "Place")
         self.assertEqual(schema["location"]["name"], "Salle des fêtes")
         self.assertEqual(schema["location"]["address"], "1 rue de la Paix, 75001 Paris")
 
     def test_offline_attendance_mode(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertEqual(
             schema["eventAttendanceMode"],
             "https://schema.org/OfflineEventAttendanceMode",
@@ -237,7 +238,7 @@ class EventPageStructuredDataTests(StructuredDataBaseTestCase):
             location="",
             address="",
         )
-        schema = get_structured_data(self.request, online_event)
+        schema = get_structured_data(online_event)
         self.assertEqual(schema["location"]["@type"], "VirtualLocation")
         self.assertEqual(schema["location"]["url"], "https://meet.example.com/event")
         self.assertEqual(
@@ -246,7 +247,7 @@ class EventPageStructuredDataTests(StructuredDataBaseTestCase):
         )
 
     def test_organizer_is_organisation(self) -> None:
-        schema = get_structured_data(self.request, self.event)
+        schema = get_structured_data(self.event)
         self.assertEqual(schema["organizer"]["@type"], "Organization")
         self.assertEqual(schema["organizer"]["name"], settings.WEBSITE_NAME)
 
@@ -279,7 +280,7 @@ class StructuredDataScriptTagTests(StructuredDataBaseTestCase):
         self.assertEqual(str(result), "")
 
     def test_fallback_for_unknown_page_type(self) -> None:
-        schema = get_structured_data(self.request, self.home.get_parent())
+        schema = get_structured_data(self.home.get_parent())
         self.assertEqual(schema["@type"], "WebPage")
 
     def test_script_breakout_payload_is_escaped(self) -> None:
@@ -305,3 +306,59 @@ class StructuredDataScriptTagTests(StructuredDataBaseTestCase):
         )
         parsed = json.loads(json_str)
         self.assertEqual(parsed["description"], payload)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "content": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+)
+class StructuredDataCacheTests(StructuredDataBaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        caches["content"].clear()
+        self.project: ProjectPage = ProjectPageFactory.create(
+            parent=self.publication_index, title="Projet en cache", description="Première"
+        )
+        self.project.save_revision().publish()
+        self.project.refresh_from_db()
+
+    def _render(self, request=None) -> str:
+        from django.template import Context
+
+        return str(
+            structured_data_script(
+                Context({"request": request or self.request, "page": self.project})
+            )
+        )
+
+    def test_urls_come_from_the_site_root(self) -> None:
+        schema = get_structured_data(self.project)
+
+        self.assertEqual(schema["url"], f"{self.site.root_url}{self.project.get_url()}")
+        self.assertEqual(schema["publisher"]["url"], f"{self.site.root_url}/")
+
+    def test_live_revision_is_rendered_once(self) -> None:
+        first = self._render()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._render(self.factory.get("/other/")), first)
+
+    def test_publishing_a_revision_renders_it_again(self) -> None:
+        self._render()
+
+        self.project.description = "Seconde"
+        self.project.save_revision().publish()
+        self.project.refresh_from_db()
+
+        self.assertIn("Seconde", self._render())
+
+    def test_previews_are_not_cached(self) -> None:
+        self._render()
+        self.project.description = "Brouillon"
+        request = self.factory.get("/")
+        request.is_preview = True  # type: ignore[attr-defined]
+
+        self.assertIn("Brouillon", self._render(request))
+        self.assertNotIn("Brouillon", self._render())
@@ -1,8 +1,15 @@
 import pytest
 from unittest.mock import MagicMock
 
+from bs4 import BeautifulSoup
+from slugify import slugify
 from wagtail.rich_text import RichText
 
+from core.management.commands.benchmark_toc import (
+    beautifulsoup_header_ids,
+    beautifulsoup_headers,
+    build_body,
+)
 from core.toc import (
     TableOfContentsItem,
     generate_header_ids,
@@ -191,3 +198,79 @@ class TestGetTableOfContents:
         assert len(toc) == 4
         assert [item.title for item in toc] == ["First", "Second", "Third", "Fourth"]
         assert [item.level for item in toc] == [2, 3, 2, 4]
+
+
+EQUIVALENCE_SAMPLES = [
+    "<h2>Introduction</h2><p>Content</p><h3>Details</h3>",
+    '<h2 data-block-key="a1" class="title">Avec attributs</h2>',
+    '<h2 id="custom">Identifiant existant</h2><h3 id="">Identifiant vide</h3>',
+    '<h2 id="deja-bon">Déjà bon</h2>',
+    "<h2>Café &amp; croissants &#8211; <b>gras</b> <i>italique</i></h2>",
+    "<H3>Majuscules</H3><p>Texte</p>",
+    "<h2>Titre\nsur deux lignes</h2>\n<p>Paragraphe\nmultiligne</p>\n<h4>Fin</h4>",
+    "<h2>Non fermé<p>suite</p>",
+    "<p>Séparateurs\u2028\r\n\x0c</p>\r\n<h2 class=x>Après</h2>",
+    "<h2></h2><h3>   </h3>",
+    "<!-- commentaire --><h2>Après<!-- dedans --> commentaire</h2>",
+    "<p>Pas de titre<br>du tout</p><h5>Niveau 5</h5><h1>Niveau 1</h1>",
+    "<h2 title='a \"quote\"'>Guillemets</h2><h3 data-x=1>Sans guillemets</h3>",
+    build_body(30),
+]
+
+
+def _rich_text_block(html: str) -> MagicMock:
+    block = MagicMock()
+    block.block_type = "rich_text"
+    block.value = {"text": RichText(html)}
+    return block
+
+
+@pytest.mark.parametrize("html", EQUIVALENCE_SAMPLES)
+class TestBeautifulSoupEquivalence:
+    """The html.parser extractor matches the former BeautifulSoup implementation."""
+
+    def test_table_of_contents_matches(self, html: str) -> None:
+        expected = [
+            TableOfContentsItem(title=title, id=id_attr or slugify(title), level=level)
+            for level, title, id_attr in beautifulsoup_headers(html)
+            if id_attr or slugify(title)
+        ]
+
+        assert get_table_of_contents([_rich_text_block(html)]) == expected
+
+    def test_header_ids_give_the_same_document(self, html: str) -> None:
+        block = _rich_text_block(html)
+
+        generate_header_ids(block)
+
+        assert BeautifulSoup(block.value["text"].source, "html.parser") == BeautifulSoup(
+            beautifulsoup_header_ids(html), "html.parser"
+        )
+
+
+def test_generate_header_ids_leaves_other_markup_untouched() -> None:
+    """Only header start tags are rewritten; the rest is kept byte for byte."""
+    html = (
+        "<p class='lead'>Un &amp; deux<br>trois</p>"
+        '<h2 data-block-key="x">Titre</h2>'
+        "<ul><li>Élément</li></ul><h3>Sous-titre</h3><p>fin</p>"
+    )
+    block = _rich_text_block(html)
+
+    generate_header_ids(block)
+
+    assert block.value["text"].source == (
+        "<p class='lead'>Un &amp; deux<br>trois</p>"
+        '<h2 data-block-key="x" id="titre">Titre</h2>'
+        '<ul><li>Élément</li></ul><h3 id="sous-titre">Sous-titre</h3><p>fin</p>'
+    )
+
+
+def test_generate_header_ids_is_idempotent() -> None:
+    block = _rich_text_block(build_body(20))
+    generate_header_ids(block)
+    once = block.value["text"].source
+
+    generate_header_ids(block)
+
+    assert block.value["text"].source == once
@@ -1,9 +1,16 @@
-from dataclasses import dataclass
+import re
+from dataclasses import asdict, dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from typing import Any
 
-from bs4 import BeautifulSoup
 from slugify import slugify
 from wagtail.blocks import StreamValue
 
+HEADER_TAGS = frozenset({"h2", "h3", "h4"})
+# Fragments without a match have no header to parse for.
+_HEADER_START_TAG = re.compile(r"<h[2-4]", re.IGNORECASE)
+
 
 @dataclass
 class TableOfContentsItem:
@@ -12,21 +19,104 @@ class TableOfContentsItem:
     level: int
 
 
+@dataclass
+class _Header:
+    level: int
+    attrs: list[tuple[str, str | None]]
+    # Span of the start tag in the source.
+    start: int
+    end: int
+    text: list[str] = field(default_factory=list)
+
+    @property
+    def title(self) -> str:
+        return "".join(self.text)
+
+    @property
+    def id(self) -> str | None:
+        return next((value or "" for name, value in self.attrs if name == "id"), None)
+
+
+class _HeaderParser(HTMLParser):
+    """Collects the ``h2``-``h4`` headers of an HTML fragment and their text.
+
+    Only the start tags are located in the source, so a caller can rewrite
+    them and leave the rest of the markup untouched.
+    """
+
+    def __init__(self, html: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.headers: list[_Header] = []
+        self._open: list[_Header] = []
+        # ``getpos`` counts lines on "\n" only, unlike ``str.splitlines``.
+        self._line_offsets = [0, *(match.end() for match in re.finditer("\n", html))]
+        self.feed(html)
+        self.close()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag not in HEADER_TAGS:
+            return
+        line, column = self.getpos()
+        start = self._line_offsets[line - 1] + column
+        end = start + len(self.get_starttag_text() or "")
+        header = _Header(level=int(tag[1]), attrs=attrs, start=start, end=end)
+        self.headers.append(header)
+        self._open.append(header)
+
+    def handle_endtag(self, tag: str) -> None:
+        for index in range(len(self._open) - 1, -1, -1):
+            if f"h{self._open[index].level}" == tag:
+                del self._open[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        # Headers nested in an unclosed one also count towards its text.
+        for header in self._open:
+            header.text.append(data)
+
+
+def _find_headers(html: str) -> list[_Header]:
+    if not _HEADER_START_TAG.search(html):
+        return []
+    return _HeaderParser(html).headers
+
+
+def _start_tag_with_id(start_tag: str, header: _Header, header_id: str) -> str:
+    if header.id is None:
+        closing = len(start_tag) - (2 if start_tag.endswith("/>") else 1)
+        return f'{start_tag[:closing]} id="{escape(header_id)}"{start_tag[closing:]}'
+
+    attrs = []
+    for name, value in header.attrs:
+        if name == "id":
+            value = header_id
+        attrs.append(f" {name}" if value is None else f' {name}="{escape(value)}"')
+    return f"<h{header.level}{''.join(attrs)}>"
+
+
+def _set_header_ids(html: str) -> str:
+    """``html`` with each header's ``id`` set to the slug of its text.
+
+    Only the start tags of the headers whose ``id`` changes are rewritten.
+    """
+    parts: list[str] = []
+    position = 0
+    for header in _find_headers(html):
+        header_id = slugify(header.title)
+        if header.id == header_id:
+            continue
+        parts.append(html[position : header.start])
+        parts.append(_start_tag_with_id(html[header.start : header.end], header, header_id))
+        position = header.end
+    parts.append(html[position:])
+    return "".join(parts)
+
+
 def generate_header_ids(block: StreamValue.StreamChild) -> None:
     if block.block_type == "text":
-        html = block.value.source
-        soup = BeautifulSoup(html, "html.parser")
-        for header in soup.find_all(["h2", "h3", "h4"]):
-            header_id = slugify(header.get_text())
-            header["id"] = header_id
-        block.value.source = str(soup)
+        block.value.source = _set_header_ids(block.value.source)
     elif block.block_type == "rich_text":
-        html = block.value["text"].source
-        soup = BeautifulSoup(html, "html.parser")
-        for header in soup.find_all(["h2", "h3", "h4"]):
-            header_id = slugify(header.get_text())
-            header["id"] = header_id
-        block.value["text"].source = str(soup)
+        block.value["text"].source = _set_header_ids(block.value["text"].source)
 
 
 def get_table_of_contents(content: StreamValue) -> list[TableOfContentsItem]:
@@ -40,17 +130,21 @@ def get_table_of_contents(content: StreamValue) -> list[TableOfContentsItem]:
             html = block.value["text"].source
 
         if html:
-            soup = BeautifulSoup(html, "html.parser")
-            for header in soup.find_all(["h2", "h3", "h4"]):
-                level = int(header.name[1])
-                title = header.get_text()
-                id_attr = header.get("id", "")
+            for header in _find_headers(html):
+                title = header.title
+                id_attr = header.id or slugify(title)
                 if not id_attr:
-                    id_attr = slugify(title)
-
-                if not id_attr or not isinstance(id_attr, str):
                     continue
 
-                toc.append(TableOfContentsItem(title=title, id=id_attr, level=level))
+                toc.append(TableOfContentsItem(title=title, id=id_attr, level=header.level))
 
     return toc
+
+
+def dump_table_of_contents(toc: list[TableOfContentsItem]) -> list[dict[str, Any]]:
+    """``toc`` as JSON-serializable data, for storing on the page."""
+    return [asdict(item) for item in toc]
+
+
+def load_table_of_contents(data: list[dict[str, Any]]) -> list[TableOfContentsItem]:
+    return [TableOfContentsItem(**item) for item in data]
@@ -1,4 +1,5 @@
 from django.http import HttpRequest
+from wagtail.blocks import StreamValue
 
 
 def get_client_ip(request: HttpRequest) -> str | None:
@@ -7,3 +8,8 @@ def get_client_ip(request: HttpRequest) -> str | None:
         return x_forwarded_for.split(",")[0]
 
     return request.META.get("REMOTE_ADDR")
+
+
+def get_stream_text(value: StreamValue) -> str:
+    """Plain text of a StreamField value, as Wagtail indexes it (no markup or block names)."""
+    return " ".join(filter(None, value.stream_block.get_searchable_content(value)))
@@ -0,0 +1,17 @@
+from django.http import HttpRequest, JsonResponse
+from django.middleware.csrf import get_token
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.cache import never_cache
+
+
+@method_decorator(never_cache, name="dispatch")
+class CsrfTokenView(View):
+    """A CSRF token (and cookie) for forms on pages served from the page cache.
+
+    Such a page carries the token of whoever first rendered it, so its forms
+    fetch their own before posting.
+    """
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        return JsonResponse({"csrfToken": get_token(request)})
@@ -252,3 +252,12 @@ def register_docs_menu_item() -> MenuItem:
         icon_name="help",
         order=10000,
     )
+
+
+@hooks.register("before_serve_page")
+def mark_page_response_cacheable(
+    page: Page, request: HttpRequest, serve_args: list, serve_kwargs: dict
+) -> None:
+    from core.page_cache import mark_page_response_cacheable
+
+    mark_page_response_cacheable(page, request)
@@ -0,0 +1,127 @@
+"""Out-of-band rendering of the busiest content pages after a publish.
+
+A publish invalidates the cached list fragments (see ``core.cache``), so the
+next visitors would otherwise pay for re-rendering them. Instead, publishing
+schedules :func:`warm_content_cache` in a Celery worker, which renders those
+pages as an anonymous visitor so their fragments land in the content cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.http import HttpRequest, HttpResponseBase
+from wagtail.models import Page
+
+from core.cache import get_content_cache
+
+# Set while a warm-up is scheduled, so a burst of publishes enqueues only one.
+CONTENT_WARMUP_PENDING_KEY = "content_warmup:pending"
+# Seconds a warm-up waits for further publishes before it runs.
+CONTENT_WARMUP_DELAY = 30
+# Bound on the pending flag, should the scheduled task never start.
+CONTENT_WARMUP_PENDING_TIMEOUT = CONTENT_WARMUP_DELAY + 300
+
+# Set while warm-ups must not be scheduled, see :func:`warmups_suspended`.
+_warmups_suspended: ContextVar[bool] = ContextVar("warmups_suspended", default=False)
+
+
+@contextmanager
+def warmups_suspended() -> Iterator[None]:
+    """Schedule no warm-up for publishes within the block, even if it raises.
+
+    ``migrate`` runs in it: pages published by data migrations must not be
+    rendered against a schema that is only partly migrated.
+    """
+    token = _warmups_suspended.set(True)
+    try:
+        yield
+    finally:
+        _warmups_suspended.reset(token)
+
+
+def schedule_content_warmup(**kwargs: Any) -> None:
+    """Schedule a warm-up, unless one is pending. Used as a publish/unpublish receiver.
+
+    Nothing is scheduled during migrations or when Celery runs tasks eagerly,
+    where the warm-up would render every listing inside the publishing request.
+    """
+    if _warmups_suspended.get() or getattr(settings, "CELERY_TASK_ALWAYS_EAGER", False):
+        return
+    cache = get_content_cache()
+    if cache is None:
+        return
+    if not cache.add(CONTENT_WARMUP_PENDING_KEY, 1, CONTENT_WARMUP_PENDING_TIMEOUT):
+        return
+
+    from core.tasks import warm_content_cache as warm_content_cache_task
+
+    transaction.on_commit(
+        lambda: warm_content_cache_task.apply_async(countdown=CONTENT_WARMUP_DELAY)  # type: ignore[attr-defined]
+    )
+
+
+def get_warmup_requests() -> list[tuple[Page, dict[str, str]]]:
+    """The pages and query strings to render: the first page of each listing filter."""
+    from home.models import HomePage
+    from pedagogy.models import PedagogyIndexPage
+    from publications.models import ProjectCategory, PublicationIndexPage
+
+    publication_filters: list[dict[str, str]] = [
+        {},
+        {"type": "projects"},
+        {"type": "events"},
+        *({"type": "projects", "category": category} for category in ProjectCategory.values),
+    ]
+
+    requests: list[tuple[Page, dict[str, str]]] = []
+    for index in PublicationIndexPage.objects.live():
+        requests.extend((index, query) for query in publication_filters)
+    requests.extend((index, {}) for index in PedagogyIndexPage.objects.live())
+    # The home page renders the recent-publications block.
+    requests.extend((home, {}) for home in HomePage.objects.live())
+    return requests
+
+
+class _WarmupHandler(BaseHandler):
+    """Runs the middleware chain around ``Page.serve``, bypassing URL routing."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.load_middleware()
+
+    def _get_response(self, request: HttpRequest) -> HttpResponseBase:
+        response = request.warmup_page.serve(request)  # type: ignore[attr-defined]
+        if hasattr(response, "render") and callable(response.render):
+            response = response.render()
+        return response
+
+
+def warm_content_cache() -> int:
+    """Render the hot listing pages so their cached fragments are stored.
+
+    Returns the number of pages rendered.
+    """
+    cache = get_content_cache()
+    if cache is not None:
+        # Publishes from now on need a warm-up of their own.
+        cache.delete(CONTENT_WARMUP_PENDING_KEY)
+
+    handler = _WarmupHandler()
+    rendered = 0
+    for page, query in get_warmup_requests():
+        page = page.specific
+        request = WSGIRequest({**page._get_dummy_headers(), "QUERY_STRING": urlencode(query)})
+        request.is_dummy = True  # type: ignore[attr-defined]
+        request.warmup_page = page  # type: ignore[attr-defined]
+        if handler.get_response(request).status_code == 200:
+            rendered += 1
+    return rendered
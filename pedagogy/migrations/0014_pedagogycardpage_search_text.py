@@ -0,0 +1,53 @@
+# Generated by Django 6.0.3 on 2026-10-18 02:08
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def backfill_search_text(apps, schema_editor):
+    """Fill the plain-text column that ``PedagogyCardPage.save`` now maintains."""
+    PedagogyCardPage = apps.get_model("pedagogy", "PedagogyCardPage")
+
+    cards = list(PedagogyCardPage.objects.only("pk", "title", "description", "content"))
+    for card in cards:
+        content = card.content.stream_block.get_searchable_content(card.content)
+        card.search_text = " ".join(
+            part for part in (card.title, card.description, *content) if part
+        )
+    PedagogyCardPage.objects.bulk_update(cards, ["search_text"], batch_size=500)
+
+
+def create_trigram_index(apps, schema_editor):
+    # icontains compiles to UPPER(column) LIKE UPPER(%s) on PostgreSQL; SQLite
+    # has no trigram index and simply scans the (now much smaller) column.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE INDEX pedagogy_card_search_trgm_idx ON pedagogy_pedagogycardpage "
+        "USING gin (UPPER(search_text) gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS pedagogy_card_search_trgm_idx")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pedagogy", "0013_alter_pedagogycardpage_content"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="pedagogycardpage",
+            name="search_text",
+            field=models.TextField(blank=True, editable=False, serialize=False),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-18 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pedagogy", "0014_pedagogycardpage_search_text"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pedagogycardpage",
+            name="toc_items",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
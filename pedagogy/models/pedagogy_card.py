@@ -1,6 +1,6 @@
 from django_stubs_ext import StrOrPromise
 from wagtail.admin.panels import FieldPanel
-from typing import override
+from typing import Any, override
 
 from wagtail.admin.panels import InlinePanel
 from wagtail.models import Page
@@ -10,7 +10,17 @@ from django.utils.translation import gettext_lazy as _
 from wagtail.search import index
 
 from core.blocks import CONTENT_BLOCK_TYPES
-from core.toc import TableOfContentsItem, generate_header_ids, get_table_of_contents
+from core.utils import get_stream_text
+from core.toc import (
+    TableOfContentsItem,
+    dump_table_of_contents,
+    generate_header_ids,
+    get_table_of_contents,
+    load_table_of_contents,
+)
+
+# Fields ``search_text`` is extracted from.
+SEARCH_TEXT_FIELDS = frozenset({"title", "description", "content"})
 
 
 class PedagogyCardPage(Page):
@@ -51,6 +61,17 @@ class PedagogyCardPage(Page):
         help_text=_("Display the table of contents in the sidebar"),
     )
 
+    # Plain text of the title, description and content, kept in step on save
+    # so the card search need not scan the StreamField JSON. On PostgreSQL a
+    # trigram index on it (migration 0014) serves ``icontains`` lookups.
+    search_text: models.TextField = models.TextField(blank=True, editable=False, serialize=False)
+
+    # Table of contents of ``content``, stored when the content is saved to the
+    # live row so rendering the page need not parse its rich text. ``clean``
+    # marks it stale, so a preview of edited content parses it instead.
+    toc_items: models.JSONField = models.JSONField(null=True, blank=True, editable=False)
+    _toc_items_stale = False
+
     search_fields = Page.search_fields + [
         index.SearchField("description"),
         index.SearchField("content"),
@@ -64,6 +85,29 @@ class PedagogyCardPage(Page):
         FieldPanel("show_toc"),
     ]
 
+    @override
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # Partial saves, such as ``save_revision`` writing to the live row while
+        # the instance holds the draft, only refresh the derived columns when
+        # they write a field those come from; publishing does a full save.
+        update_fields = kwargs.get("update_fields")
+        derived_fields: set[str] = set()
+        if update_fields is None or not SEARCH_TEXT_FIELDS.isdisjoint(update_fields):
+            self.search_text = self.get_search_text()
+            derived_fields.add("search_text")
+        if update_fields is None or "content" in update_fields:
+            self.toc_items = dump_table_of_contents(get_table_of_contents(self.content))
+            derived_fields.add("toc_items")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *derived_fields}
+
+        super().save(*args, **kwargs)
+
+    def get_search_text(self) -> str:
+        return " ".join(
+            part for part in (self.title, self.description, get_stream_text(self.content)) if part
+        )
+
     def has_resource(self) -> bool:
         return self.resources.exists()
 
@@ -74,7 +118,10 @@ class PedagogyCardPage(Page):
         for block in self.content:
             if block.block_type in ("text", "rich_text"):
                 generate_header_ids(block)
+        self._toc_items_stale = True
 
     @property
     def table_of_contents(self) -> list[TableOfContentsItem]:
-        return get_table_of_contents(self.content)
+        if self.toc_items is None or self._toc_items_stale:
+            return get_table_of_contents(self.content)
+        return load_table_of_contents(self.toc_items)
@@ -1,7 +1,6 @@
 from typing import Any
 from django_stubs_ext import StrOrPromise
 
-from django.core.paginator import Paginator
 from django.db import models
 from django.http import HttpRequest
 from django.template import Context
@@ -10,6 +9,8 @@ from wagtail.models import Page, PanelPlaceholder
 from django.utils.translation import gettext_lazy as _
 from wagtail.search import index
 from wagtail.admin.panels import FieldPanel
+from core.cache import pagination_count_key, subtree_tag, tagged_key
+from core.pagination import CachedCountPaginator, LazyObjectList
 from pedagogy.models.pedagogy_card import PedagogyCardPage
 
 
@@ -60,20 +61,29 @@ class PedagogyIndexPage(Page):
         return _("Pedagogy Entries Index")
 
     def _populate_pedagogy_entries(self, context: Context, request: HttpRequest) -> None:
+        from core.renditions import prefetch_card_images
+
         pedagogy_entries = (
             PedagogyCardPage.objects.live().descendant_of(self).order_by("-first_published_at")
         )
         search_query = request.GET.get("search", "")
         if search_query:
-            pedagogy_entries = pedagogy_entries.filter(
-                models.Q(title__icontains=search_query)
-                | models.Q(description__icontains=search_query)
-                | models.Q(content__icontains=search_query)
-            )
+            pedagogy_entries = pedagogy_entries.filter(search_text__icontains=search_query)
 
-        paginator = Paginator(pedagogy_entries, self.PEDAGOGY_ENTRIES_PER_PAGE)
+        paginator = CachedCountPaginator(
+            pedagogy_entries,
+            self.PEDAGOGY_ENTRIES_PER_PAGE,
+            count_key=tagged_key(
+                pagination_count_key(f"pedagogy:{self.pk}", search=search_query),
+                [subtree_tag(self)],
+            ),
+        )
         page_number = request.GET.get("page")
         pedagogy_entries = paginator.get_page(page_number)
+        # Loaded when the cards are rendered, which a cached listing fragment skips.
+        pedagogy_entries.object_list = LazyObjectList(
+            pedagogy_entries.object_list, prefetch_card_images
+        )
 
         context.update({"pedagogy_entries": pedagogy_entries})
 
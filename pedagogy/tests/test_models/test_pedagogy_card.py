@@ -1,8 +1,10 @@
 import pytest
+from wagtail.models import Page
 from wagtail.rich_text import RichText
 
 from core.blocks import BLOCK_TYPE_RICH_TEXT, TextJustification
 from pedagogy.factories.pedagogy_card_factory import PedagogyCardPageFactory
+from pedagogy.models import PedagogyCardPage, PedagogyIndexPage
 
 
 @pytest.mark.django_db
@@ -37,3 +39,64 @@ def test_table_of_contents_generation() -> None:
         assert toc_item.title == expected_item["title"]
         assert toc_item.id == expected_item["id"]
         assert toc_item.level == expected_item["level"]
+
+
+def _rich_text_content(html: str) -> list:
+    return [
+        (
+            BLOCK_TYPE_RICH_TEXT,
+            {"text": RichText(html), "justification": TextJustification.LEFT},
+        ),
+    ]
+
+
+@pytest.mark.django_db
+def test_search_text_is_extracted_on_save() -> None:
+    root = Page.get_first_root_node()
+    page = PedagogyCardPageFactory.create(
+        parent=root,
+        title="Budget participatif",
+        description="Comment proposer un projet",
+        content=_rich_text_content("<h2>Étapes</h2><p>Déposer une <b>idée</b></p>"),
+    )
+
+    page.refresh_from_db()
+    assert "Budget participatif" in page.search_text
+    assert "Comment proposer un projet" in page.search_text
+    assert "Déposer une idée" in page.search_text
+    assert "<p>" not in page.search_text
+    assert BLOCK_TYPE_RICH_TEXT not in page.search_text
+
+
+@pytest.mark.django_db
+def test_saving_a_draft_leaves_the_live_search_text() -> None:
+    page = PedagogyCardPageFactory.create(parent=Page.get_first_root_node(), title="Public title")
+    page.save_revision().publish()
+
+    page.title = "Confidential draft wording"
+    page.save_revision()
+
+    page.refresh_from_db()
+    assert "Public title" in page.search_text
+    assert "Confidential" not in page.search_text
+
+    page.get_latest_revision().publish()
+    page.refresh_from_db()
+    assert "Confidential draft wording" in page.search_text
+
+
+@pytest.mark.django_db
+def test_index_search_matches_text_but_not_markup(rf) -> None:
+    index = PedagogyIndexPage(title="Fiches", slug="fiches")
+    Page.get_first_root_node().add_child(instance=index)
+    card = PedagogyCardPageFactory.create(
+        parent=index, content=_rich_text_content("<p>Un <b>jardin</b> partagé</p>")
+    )
+
+    def search(query: str) -> list[PedagogyCardPage]:
+        context = index.get_context(rf.get("/", {"search": query}))
+        return list(context["pedagogy_entries"])
+
+    assert search("jardin partagé") == [card]
+    assert search(BLOCK_TYPE_RICH_TEXT) == []
+    assert search("<b>") == []
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class PublicationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "publications"
+
+    def ready(self) -> None:
+        from django.conf import settings
+        from django.db.models.signals import post_save
+
+        from publications.signals import sync_response_locality
+
+        # Votes and ideas carry their author's locality; re-flag them when the
+        # author's postal code may have changed.
+        post_save.connect(
+            sync_response_locality,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="publications.signals.sync_response_locality",
+        )
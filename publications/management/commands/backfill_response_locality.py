@@ -0,0 +1,25 @@
+from typing import Any
+
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+
+from publications.services import backfill_response_locality
+
+
+class Command(BaseCommand):
+    help = (
+        "Flag every vote and idea as local or not from its author's postal code, "
+        "then rebuild the vote statistics."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows updated per query (default: 5000)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows = backfill_response_locality(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Flagged {rows} vote and idea rows."))
@@ -0,0 +1,127 @@
+import random
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+from core.blocks import BLOCK_TYPE_RICH_TEXT
+from core.tests.utils.blocks import mock_block_value
+from publications.factories import ProjectPageFactory
+from publications.models import PublicationIndexPage, PublicationPage
+from publications.services import (
+    _search_publications_icontains,
+    filter_publications_by_type,
+    search_publications,
+)
+
+# Terms mixed into the synthetic titles so the benchmark queries have matches.
+TOPICS = [
+    "piste cyclable",
+    "jardin partagé",
+    "rénovation de l'école",
+    "éclairage public",
+    "marché couvert",
+    "aire de jeux",
+    "végétalisation",
+    "stationnement vélo",
+]
+
+QUERIES = ["jardin", "ecole", "pistes cyclables", "végétaliser la rue", "marché"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the icontains and full-text publication searches on synthetic pages. "
+        "The pages are rolled back afterwards unless --keep is given. Only works in DEBUG mode."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=50000,
+            help="Number of synthetic pages to create (default: 50000)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per query; the fastest one is reported (default: 5)",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the synthetic pages instead of rolling them back",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not settings.DEBUG:
+            self.stderr.write(self.style.ERROR("This command can only be run when DEBUG=True"))
+            return
+
+        index_page = PublicationIndexPage.objects.first()
+        if not index_page:
+            self.stderr.write(self.style.ERROR("No PublicationIndexPage found."))
+            return
+
+        try:
+            with transaction.atomic():
+                self._create_pages(index_page, options["pages"])
+                self._run(index_page, options["repeat"])
+                if not options["keep"]:
+                    raise _Rollback
+        except _Rollback:
+            self.stdout.write("Synthetic pages rolled back.")
+
+    def _create_pages(self, index_page: PublicationIndexPage, count: int) -> None:
+        self.stdout.write(f"Creating {count} synthetic pages...")
+        for number in range(count):
+            page = ProjectPageFactory.build(
+                hero_image=None,
+                content=[(BLOCK_TYPE_RICH_TEXT, mock_block_value(BLOCK_TYPE_RICH_TEXT))],
+            )
+            page.title = f"{page.title} {random.choice(TOPICS)}"  # nosec B311
+            page.slug = f"benchmark-{number}"
+            index_page.add_child(instance=page)
+            if (number + 1) % 5000 == 0:
+                self.stdout.write(f"  {number + 1} pages")
+
+    def _run(self, index_page: PublicationIndexPage, repeat: int) -> None:
+        base = filter_publications_by_type(
+            PublicationPage.objects.live().descendant_of(index_page), "all", True
+        )
+        searches: dict[str, Callable[[QuerySet, str], QuerySet]] = {
+            "icontains": _search_publications_icontains,
+        }
+        if connection.vendor == "postgresql":
+            searches["full-text"] = search_publications
+        else:
+            self.stdout.write(
+                self.style.WARNING("Full-text search needs PostgreSQL; timing icontains only.")
+            )
+
+        for query in QUERIES:
+            for name, search in searches.items():
+                elapsed, total = self._time(lambda: search(base, query), repeat)
+                self.stdout.write(f"{query!r:24} {name:10} {total:6} matches  {elapsed:8.1f} ms")
+
+    @staticmethod
+    def _time(build: Callable[[], QuerySet], repeat: int) -> tuple[float, int]:
+        """Best time, in ms, to count the matches and load the first listing page."""
+        best = float("inf")
+        total = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            queryset = build()
+            total = queryset.count()
+            list(queryset[:12])
+            best = min(best, (time.perf_counter() - start) * 1000)
+        return best, total
@@ -13,6 +13,7 @@ from publications.models.form import (
     UNFAVORABLE_CHOICES,
     VoteChoice,
 )
+from publications.services import rebuild_vote_statistics, rebuild_vote_tallies
 
 
 User = get_user_model()
@@ -320,6 +321,10 @@ class Command(BaseCommand):
 
             self.stdout.write(f"  Created {project_votes} votes for: {project.title}")
 
+        # Votes are created directly, bypassing the counter-maintaining helpers.
+        rebuild_vote_tallies()
+        rebuild_vote_statistics()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"\nSuccessfully created:\n"
@@ -0,0 +1,23 @@
+from typing import Any
+
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+
+from publications.services import rebuild_vote_tallies
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-project vote tallies from the stored vote responses."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Only rebuild the tally of this project ID (repeatable; default: all)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows = rebuild_vote_tallies(options["project_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} vote tally rows."))
@@ -0,0 +1,85 @@
+# Generated by Django 6.0.3 on 2026-10-18 00:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_vote_tallies(apps, schema_editor):
+    """Seed the tallies from the votes already collected."""
+    FormResponse = apps.get_model("publications", "FormResponse")
+    VoteTally = apps.get_model("publications", "VoteTally")
+
+    rows = (
+        FormResponse.objects.values("project_id", "choice")
+        .annotate(count=Count("id"), comment_count=Count("id", filter=~Q(comment="")))
+        .order_by()
+    )
+    VoteTally.objects.bulk_create(
+        [
+            VoteTally(
+                project_id=row["project_id"],
+                choice=row["choice"],
+                count=row["count"],
+                comment_count=row["comment_count"],
+            )
+            for row in rows
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0009_remove_projectpage_enable_voting_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VoteTally",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "choice",
+                    models.CharField(
+                        choices=[
+                            ("UNFAVORABLE", "Unfavorable"),
+                            ("RATHER_UNFAVORABLE", "Rather Unfavorable"),
+                            ("RATHER_FAVORABLE", "Rather Favorable"),
+                            ("FAVORABLE", "Favorable"),
+                        ],
+                        max_length=30,
+                        verbose_name="Choice",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Votes")),
+                (
+                    "comment_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Votes with a comment"),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vote_tallies",
+                        to="publications.projectpage",
+                        verbose_name="Project",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Vote Tally",
+                "verbose_name_plural": "Vote Tallies",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "choice"), name="unique_project_choice_tally"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_vote_tallies, migrations.RunPython.noop),
+    ]
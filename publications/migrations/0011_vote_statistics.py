@@ -0,0 +1,85 @@
+# Generated by Django 6.0.3 on 2026-10-18 01:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+FAVORABLE_VALUES = ("RATHER_FAVORABLE", "FAVORABLE")
+
+
+def backfill_vote_statistics(apps, schema_editor):
+    """Seed the dashboard counters from the votes already collected."""
+    FormResponse = apps.get_model("publications", "FormResponse")
+    VoteStatistics = apps.get_model("publications", "VoteStatistics")
+
+    has_comment = ~Q(comment="")
+    favorable = Q(choice__in=FAVORABLE_VALUES)
+    local = Q(user__postal_code=getattr(settings, "LOCAL_POSTAL_CODE", "13007"))
+
+    rows = (
+        FormResponse.objects.values("project_id")
+        .annotate(
+            total_votes=Count("id"),
+            with_comments=Count("id", filter=has_comment),
+            favorable_votes=Count("id", filter=favorable),
+            local_total_votes=Count("id", filter=local),
+            local_with_comments=Count("id", filter=local & has_comment),
+            local_favorable_votes=Count("id", filter=local & favorable),
+        )
+        .order_by()
+    )
+    VoteStatistics.objects.bulk_create([VoteStatistics(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0010_vote_tally"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VoteStatistics",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="vote_statistics",
+                        serialize=False,
+                        to="publications.projectpage",
+                        verbose_name="Project",
+                    ),
+                ),
+                ("total_votes", models.PositiveIntegerField(default=0, verbose_name="Total votes")),
+                (
+                    "with_comments",
+                    models.PositiveIntegerField(default=0, verbose_name="Votes with a comment"),
+                ),
+                (
+                    "favorable_votes",
+                    models.PositiveIntegerField(default=0, verbose_name="Favorable votes"),
+                ),
+                (
+                    "local_total_votes",
+                    models.PositiveIntegerField(default=0, verbose_name="Local votes"),
+                ),
+                (
+                    "local_with_comments",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Local votes with a comment"
+                    ),
+                ),
+                (
+                    "local_favorable_votes",
+                    models.PositiveIntegerField(default=0, verbose_name="Local favorable votes"),
+                ),
+            ],
+            options={
+                "verbose_name": "Vote Statistics",
+                "verbose_name_plural": "Vote Statistics",
+            },
+        ),
+        migrations.RunPython(backfill_vote_statistics, migrations.RunPython.noop),
+    ]
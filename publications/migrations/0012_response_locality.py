@@ -0,0 +1,55 @@
+# Generated by Django 6.0.3 on 2026-10-18 01:19
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def backfill_response_locality(apps, schema_editor):
+    """Flag the votes and ideas already collected, as 0011 counted them."""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    local_author = Exists(
+        User.objects.filter(
+            pk=OuterRef("user_id"),
+            postal_code=getattr(settings, "LOCAL_POSTAL_CODE", "13007"),
+        )
+    )
+    for model_name in ("FormResponse", "IdeaResponse"):
+        apps.get_model("publications", model_name).objects.update(is_local=local_author)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0011_vote_statistics"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formresponse",
+            name="is_local",
+            field=models.BooleanField(
+                default=False,
+                help_text="Whether the author has the local postal code",
+                verbose_name="Local",
+            ),
+        ),
+        migrations.AddField(
+            model_name="idearesponse",
+            name="is_local",
+            field=models.BooleanField(
+                default=False,
+                help_text="Whether the author has the local postal code",
+                verbose_name="Local",
+            ),
+        ),
+        migrations.RunPython(backfill_response_locality, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="formresponse",
+            index=models.Index(fields=["project", "is_local"], name="vote_project_locality_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="idearesponse",
+            index=models.Index(fields=["project", "is_local"], name="idea_project_locality_idx"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.3 on 2026-10-18 01:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0012_response_locality"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="formresponse",
+            index=models.Index(fields=["project", "created_at"], name="vote_project_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="idearesponse",
+            index=models.Index(fields=["project", "created_at"], name="idea_project_created_idx"),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 6.0.3 on 2026-10-18 01:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0013_response_created_at_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ParticipationActivity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("VOTE", "Vote"), ("IDEA", "Idea")],
+                        max_length=10,
+                        verbose_name="Kind",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("HOUR", "Hour"), ("DAY", "Day")],
+                        max_length=10,
+                        verbose_name="Granularity",
+                    ),
+                ),
+                ("bucket", models.DateTimeField(verbose_name="Period start")),
+                ("choice", models.CharField(blank=True, max_length=30, verbose_name="Choice")),
+                ("is_local", models.BooleanField(default=False, verbose_name="Local")),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Count")),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participation_activity",
+                        to="publications.projectpage",
+                        verbose_name="Project",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Participation Activity",
+                "verbose_name_plural": "Participation Activity",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "kind", "granularity", "bucket", "choice", "is_local"),
+                        name="unique_participation_activity_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
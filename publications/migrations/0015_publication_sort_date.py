@@ -0,0 +1,69 @@
+# Generated by Django 6.0.3 on 2026-10-18 01:46
+
+from datetime import datetime, time
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_listing_dates(apps, schema_editor):
+    """Compute the stored listing dates that ``PublicationPage.save`` now maintains."""
+    PublicationPage = apps.get_model("publications", "PublicationPage")
+    EventPage = apps.get_model("publications", "EventPage")
+
+    pages = list(PublicationPage.objects.only("pk", "first_published_at"))
+    for page in pages:
+        page.sort_date = page.first_published_at
+    PublicationPage.objects.bulk_update(pages, ["sort_date"], batch_size=500)
+
+    events = list(EventPage.objects.only("pk", "event_date", "end_date"))
+    updated = []
+    for event in events:
+        visible_until = event.end_date
+        if visible_until is None:
+            visible_until = datetime.combine(event.event_date.date(), time(23, 59, 59))
+            if timezone.is_aware(event.event_date):
+                visible_until = timezone.make_aware(visible_until, timezone.get_current_timezone())
+        updated.append(
+            PublicationPage(pk=event.pk, sort_date=event.event_date, visible_until=visible_until)
+        )
+    PublicationPage.objects.bulk_update(updated, ["sort_date", "visible_until"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("publications", "0014_participation_activity"),
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+        ("wagtailimages", "0027_image_description"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="publicationpage",
+            name="sort_date",
+            field=models.DateTimeField(
+                editable=False,
+                help_text="Date listings are sorted by: the event date, or first publication.",
+                null=True,
+                verbose_name="Sort date",
+            ),
+        ),
+        migrations.AddField(
+            model_name="publicationpage",
+            name="visible_until",
+            field=models.DateTimeField(
+                editable=False,
+                help_text="When an event becomes past and leaves the default listings.",
+                null=True,
+                verbose_name="Visible until",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publicationpage",
+            index=models.Index(
+                fields=["-sort_date", "visible_until"], name="publication_listing_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_listing_dates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 6.0.3 on 2026-10-18 01:55
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import UnaccentExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import TextField, Value
+
+SEARCH_CONFIG = "publications_french"
+
+
+def create_search_index(apps, schema_editor):
+    """Create the text search configuration and GIN index, then fill the vectors.
+
+    PostgreSQL only: SQLite keeps the ``icontains`` search and cannot build a
+    GIN index.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        f"CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = pg_catalog.french)"
+    )
+    schema_editor.execute(
+        f"ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, french_stem"
+    )
+    schema_editor.execute(
+        "CREATE INDEX publication_search_idx ON publications_publicationpage "
+        "USING gin (search_vector)"
+    )
+
+    PublicationPage = apps.get_model("publications", "PublicationPage")
+    for page in PublicationPage.objects.only("pk", "title", "description", "content").iterator():
+        content = " ".join(page.content.stream_block.get_searchable_content(page.content))
+        PublicationPage.objects.filter(pk=page.pk).update(
+            search_vector=(
+                SearchVector(
+                    Value(page.title, output_field=TextField()), weight="A", config=SEARCH_CONFIG
+                )
+                + SearchVector(
+                    Value(page.description, output_field=TextField()),
+                    weight="B",
+                    config=SEARCH_CONFIG,
+                )
+                + SearchVector(
+                    Value(content, output_field=TextField()), weight="C", config=SEARCH_CONFIG
+                )
+            )
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS publication_search_idx")
+    schema_editor.execute(f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0015_publication_sort_date"),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.AddField(
+            model_name="publicationpage",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, serialize=False
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-18 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0016_publication_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectpage",
+            name="toc_items",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_idea_statistics(apps, schema_editor):
+    """Seed the idea counters from the ideas already collected."""
+    IdeaResponse = apps.get_model("publications", "IdeaResponse")
+    IdeaStatistics = apps.get_model("publications", "IdeaStatistics")
+
+    rows = (
+        IdeaResponse.objects.values("project_id")
+        .annotate(
+            total_ideas=Count("id"),
+            local_total_ideas=Count("id", filter=Q(is_local=True)),
+        )
+        .order_by()
+    )
+    IdeaStatistics.objects.bulk_create([IdeaStatistics(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0017_projectpage_toc_items"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdeaStatistics",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="idea_statistics",
+                        serialize=False,
+                        to="publications.projectpage",
+                        verbose_name="Project",
+                    ),
+                ),
+                ("total_ideas", models.PositiveIntegerField(default=0, verbose_name="Total ideas")),
+                (
+                    "local_total_ideas",
+                    models.PositiveIntegerField(default=0, verbose_name="Local ideas"),
+                ),
+            ],
+            options={
+                "verbose_name": "Idea Statistics",
+                "verbose_name_plural": "Idea Statistics",
+            },
+        ),
+        migrations.RunPython(backfill_idea_statistics, migrations.RunPython.noop),
+    ]
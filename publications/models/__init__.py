@@ -11,4 +11,8 @@ from .form import (
     VoteChoice,
 )
 from .idea import IdeaResponse
+from .idea_statistics import IdeaStatistics
 from .external_link import ProjectExternalLink
+from .vote_tally import VoteTally
+from .vote_statistics import VoteStatistics
+from .activity import ActivityGranularity, ActivityKind, ParticipationActivity
@@ -0,0 +1,50 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ActivityKind(models.TextChoices):
+    VOTE = "VOTE", _("Vote")
+    IDEA = "IDEA", _("Idea")
+
+
+class ActivityGranularity(models.TextChoices):
+    HOUR = "HOUR", _("Hour")
+    DAY = "DAY", _("Day")
+
+
+class ParticipationActivity(models.Model):
+    """Number of votes or ideas submitted on a project during one hour or day.
+
+    Rows are split by vote choice (blank for ideas) and by voter locality so the
+    admin timelines can honour the local/all toggle. Buckets are filled by
+    :func:`publications.tasks.rollup_participation_activity`; a response is
+    counted in the bucket of its creation, with its choice at rollup time.
+    """
+
+    project = models.ForeignKey(
+        "publications.ProjectPage",
+        on_delete=models.CASCADE,
+        related_name="participation_activity",
+        verbose_name=_("Project"),
+    )
+    kind = models.CharField(_("Kind"), max_length=10, choices=ActivityKind.choices)
+    granularity = models.CharField(
+        _("Granularity"), max_length=10, choices=ActivityGranularity.choices
+    )
+    bucket = models.DateTimeField(_("Period start"))
+    choice = models.CharField(_("Choice"), max_length=30, blank=True)
+    is_local = models.BooleanField(_("Local"), default=False)
+    count = models.PositiveIntegerField(_("Count"), default=0)
+
+    class Meta:
+        verbose_name = _("Participation Activity")
+        verbose_name_plural = _("Participation Activity")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "kind", "granularity", "bucket", "choice", "is_local"],
+                name="unique_participation_activity_bucket",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.project_id} {self.kind} {self.bucket:%Y-%m-%d %H:%M}: {self.count}"
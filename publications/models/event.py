@@ -78,26 +78,36 @@ class EventPage(PublicationPage):
         FieldPanel("max_participants"),
     ]
 
-    @property
-    def is_past(self) -> bool:
+    def get_sort_date(self) -> datetime | None:
+        return self.event_date
+
+    def get_visible_until(self) -> datetime | None:
         """
-        Détermine si un événement est passé.
-        - Si end_date existe: l'événement est passé si end_date < maintenant
-        - Sinon: l'événement est passé si event_date à 23:59:59 < maintenant
+        Moment à partir duquel l'événement est passé.
+        - Si end_date existe: end_date
+        - Sinon: event_date à 23:59:59
+        - Sans date (brouillon non renseigné): None
         Cela évite qu'un événement en cours soit marqué comme passé.
         """
 
-        now = timezone.now()
-
         if self.end_date:
-            return self.end_date < now
+            return self.end_date
+        if self.event_date is None:
+            return None
 
         # Utilise 23:59:59 du jour de l'événement
         event_day_end = datetime.combine(self.event_date.date(), time(23, 59, 59))
         if timezone.is_aware(self.event_date):
             event_day_end = timezone.make_aware(event_day_end, timezone.get_current_timezone())
 
-        return event_day_end < now
+        return event_day_end
+
+    @property
+    def is_past(self) -> bool:
+        """Détermine si un événement est passé (voir ``get_visible_until``)."""
+
+        visible_until = self.get_visible_until()
+        return visible_until is not None and visible_until < timezone.now()
 
     @property
     def is_ongoing(self) -> bool:
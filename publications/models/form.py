@@ -55,6 +55,11 @@ class FormResponse(models.Model):
         default=False,
         help_text=_("Hide your identity in public displays"),
     )
+    is_local = models.BooleanField(
+        _("Local"),
+        default=False,
+        help_text=_("Whether the author has the local postal code"),
+    )
 
     class Meta:
         verbose_name = _("Vote Response")
@@ -65,6 +70,10 @@ class FormResponse(models.Model):
                 name="unique_user_project_vote",
             )
         ]
+        indexes = [
+            models.Index(fields=["project", "is_local"], name="vote_project_locality_idx"),
+            models.Index(fields=["project", "created_at"], name="vote_project_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.project.title} - {self.choice}"
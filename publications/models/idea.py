@@ -36,6 +36,11 @@ class IdeaResponse(models.Model):
         default=False,
         help_text=_("Hide your identity in administrator displays"),
     )
+    is_local = models.BooleanField(
+        _("Local"),
+        default=False,
+        help_text=_("Whether the author has the local postal code"),
+    )
 
     class Meta:
         verbose_name = _("Idea Response")
@@ -46,6 +51,10 @@ class IdeaResponse(models.Model):
                 name="unique_user_project_idea",
             )
         ]
+        indexes = [
+            models.Index(fields=["project", "is_local"], name="idea_project_locality_idx"),
+            models.Index(fields=["project", "created_at"], name="idea_project_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.project.title} - idea"
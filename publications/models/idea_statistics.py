@@ -0,0 +1,35 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class IdeaStatistics(models.Model):
+    """Precomputed idea counters shown on the admin idea collection views.
+
+    One row per project, counting all ideas and those of local authors only
+    (postal code ``LOCAL_POSTAL_CODE``), so the views need not count the
+    ideas on every request. Updated incrementally by the idea write helpers
+    in :mod:`publications.services` and reconciled periodically by
+    :func:`publications.tasks.reconcile_idea_statistics`.
+    """
+
+    project = models.OneToOneField(
+        "publications.ProjectPage",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="idea_statistics",
+        verbose_name=_("Project"),
+    )
+
+    total_ideas = models.PositiveIntegerField(_("Total ideas"), default=0)
+    local_total_ideas = models.PositiveIntegerField(_("Local ideas"), default=0)
+
+    class Meta:
+        verbose_name = _("Idea Statistics")
+        verbose_name_plural = _("Idea Statistics")
+
+    def __str__(self) -> str:
+        return f"{self.project_id}: {self.total_ideas} ideas"
+
+    def for_scope(self, local_only: bool) -> int:
+        """Return the number of ideas from all or local authors."""
+        return self.local_total_ideas if local_only else self.total_ideas
@@ -1,5 +1,6 @@
 from datetime import datetime
 from functools import cached_property
+from typing import Any, override
 
 from django.db import models
 from django.utils import timezone
@@ -8,7 +9,13 @@ from django_stubs_ext import StrOrPromise
 from wagtail.admin.panels import FieldPanel, InlinePanel
 from wagtail.search import index
 
-from core.toc import TableOfContentsItem, generate_header_ids, get_table_of_contents
+from core.toc import (
+    TableOfContentsItem,
+    dump_table_of_contents,
+    generate_header_ids,
+    get_table_of_contents,
+    load_table_of_contents,
+)
 from publications.models.publication import PublicationPage
 
 
@@ -86,6 +93,12 @@ class ProjectPage(PublicationPage):
         help_text=_("Display the table of contents in the sidebar"),
     )
 
+    # Table of contents of ``content``, stored when the content is saved to the
+    # live row so rendering the page need not parse its rich text. ``clean``
+    # marks it stale, so a preview of edited content parses it instead.
+    toc_items: models.JSONField = models.JSONField(null=True, blank=True, editable=False)
+    _toc_items_stale = False
+
     search_fields = PublicationPage.search_fields + [
         index.SearchField("category"),
     ]
@@ -108,12 +121,27 @@ class ProjectPage(PublicationPage):
         """True when the project collects ideas instead of votes."""
         return self.participation_mode == ParticipationMode.IDEAS
 
+    @override
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # Partial saves, such as ``save_revision`` writing to the live row while
+        # the instance holds the draft, keep the stored table of contents unless
+        # they write the content; publishing does a full save.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.toc_items = dump_table_of_contents(get_table_of_contents(self.content))
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "toc_items"}
+
+        super().save(*args, **kwargs)
+
+    @override
     def clean(self) -> None:
         super().clean()
 
         for block in self.content:
             if block.block_type in ("text", "rich_text"):
                 generate_header_ids(block)
+        self._toc_items_stale = True
 
     @property
     def vote_question(self) -> str:
@@ -142,7 +170,9 @@ class ProjectPage(PublicationPage):
 
     @property
     def table_of_contents(self) -> list[TableOfContentsItem]:
-        return get_table_of_contents(self.content)
+        if self.toc_items is None or self._toc_items_stale:
+            return get_table_of_contents(self.content)
+        return load_table_of_contents(self.toc_items)
 
     class Meta:
         verbose_name = _("Project")
@@ -2,6 +2,7 @@ from datetime import datetime, time
 from typing import Any, Self, override
 
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -13,12 +14,24 @@ from wagtail.search import index
 from core.blocks import CONTENT_BLOCK_TYPES
 
 
+# Fields making up a publication's full-text search document.
+SEARCH_DOCUMENT_FIELDS = frozenset({"title", "description", "content"})
+# Fields ``sort_date`` and ``visible_until`` are derived from, across subtypes.
+LISTING_DATE_FIELDS = frozenset({"first_published_at", "event_date", "end_date"})
+
+
 class PublicationPage(Page):
     parent_page_types: list[str] = ["publications.PublicationIndexPage"]
 
     class Meta:
         verbose_name = _("Publication")
         verbose_name_plural = _("Publications")
+        indexes = [
+            models.Index(
+                fields=["-sort_date", "visible_until"],
+                name="publication_listing_idx",
+            ),
+        ]
 
     real_type = models.ForeignKey(  # type: ignore[var-annotated]
         ContentType,
@@ -28,16 +41,61 @@ class PublicationPage(Page):
         related_name="+",
     )
 
+    sort_date: models.DateTimeField[Any, Any] = models.DateTimeField(
+        null=True,
+        editable=False,
+        verbose_name=_("Sort date"),
+        help_text=_("Date listings are sorted by: the event date, or first publication."),
+    )
+
+    visible_until: models.DateTimeField[Any, Any] = models.DateTimeField(
+        null=True,
+        editable=False,
+        verbose_name=_("Visible until"),
+        help_text=_("When an event becomes past and leaves the default listings."),
+    )
+
+    # Full-text search document (title, description and content text), only
+    # filled on PostgreSQL. Its GIN index is created by migration 0016 since
+    # SQLite cannot build one. Not serialized into revisions.
+    search_vector = SearchVectorField(null=True, editable=False, serialize=False)
+
     @override
     def save(self, *args: Any, **kwargs: Any) -> None:
         if not self.real_type_id:
             self.real_type = ContentType.objects.get_for_model(type(self))
+
+        # Stored so listings can sort and hide past events from an index
+        # instead of joining each subtype. Publishing does a full save; partial
+        # saves leave them alone unless they write a field they derive from, as
+        # ``save_revision`` writes to the live row while holding the draft.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or not LISTING_DATE_FIELDS.isdisjoint(update_fields):
+            self.sort_date = self.get_sort_date()
+            self.visible_until = self.get_visible_until()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "sort_date", "visible_until"}
+
         super().save(*args, **kwargs)
 
+        if update_fields is None or not SEARCH_DOCUMENT_FIELDS.isdisjoint(update_fields):
+            from publications.services import update_search_vectors
+
+            update_search_vectors([self])
+
+    def get_sort_date(self) -> datetime | None:
+        return self.first_published_at
+
+    def get_visible_until(self) -> datetime | None:
+        return None
+
     def get_real_instance(self) -> Self:
-        if self.real_type:
-            model_name = self.real_type.model
-            if hasattr(self, model_name):
+        # get_for_id is served from the content type cache, unlike self.real_type.
+        # The subtype row itself is read once and cached on the instance, or
+        # preloaded for a whole list by resolve_publication_subtypes.
+        if self.real_type_id:
+            model_name = ContentType.objects.get_for_id(self.real_type_id).model
+            if model_name != self._meta.model_name and hasattr(self, model_name):
                 return getattr(self, model_name)
         return self
 
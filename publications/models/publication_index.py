@@ -11,6 +11,7 @@ from wagtail.fields import RichTextField
 from wagtail.models import Page
 from wagtail.search import index
 
+from core.cache import subtree_tag, tagged_key
 from publications.services import PublicationFilters, get_filtered_publications
 
 
@@ -64,7 +65,10 @@ class PublicationIndexPage(Page):
         filters = PublicationFilters.from_request(request)
 
         return get_filtered_publications(
-            base_queryset, filters, per_page=self.PUBLICATIONS_PER_PAGE
+            base_queryset,
+            filters,
+            per_page=self.PUBLICATIONS_PER_PAGE,
+            count_key=tagged_key(filters.count_key(f"publications:{self.pk}"), [subtree_tag(self)]),
         )
 
     def get_context(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Context:
@@ -0,0 +1,43 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class VoteStatistics(models.Model):
+    """Precomputed vote counters shown on the admin vote statistics dashboard.
+
+    One row per project, with each counter kept both for all voters and for
+    local voters only (postal code ``LOCAL_POSTAL_CODE``), so the dashboard
+    reads a single row per project whatever the number of votes. Updated
+    incrementally by the vote write helpers in :mod:`publications.services` and
+    reconciled periodically by
+    :func:`publications.tasks.reconcile_vote_statistics`.
+    """
+
+    project = models.OneToOneField(
+        "publications.ProjectPage",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="vote_statistics",
+        verbose_name=_("Project"),
+    )
+
+    total_votes = models.PositiveIntegerField(_("Total votes"), default=0)
+    with_comments = models.PositiveIntegerField(_("Votes with a comment"), default=0)
+    favorable_votes = models.PositiveIntegerField(_("Favorable votes"), default=0)
+
+    local_total_votes = models.PositiveIntegerField(_("Local votes"), default=0)
+    local_with_comments = models.PositiveIntegerField(_("Local votes with a comment"), default=0)
+    local_favorable_votes = models.PositiveIntegerField(_("Local favorable votes"), default=0)
+
+    class Meta:
+        verbose_name = _("Vote Statistics")
+        verbose_name_plural = _("Vote Statistics")
+
+    def __str__(self) -> str:
+        return f"{self.project_id}: {self.total_votes} votes"
+
+    def for_scope(self, local_only: bool) -> tuple[int, int, int]:
+        """Return ``(total, with_comments, favorable)`` for all or local voters."""
+        if local_only:
+            return self.local_total_votes, self.local_with_comments, self.local_favorable_votes
+        return self.total_votes, self.with_comments, self.favorable_votes
@@ -0,0 +1,43 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from publications.models.form import VoteChoice
+
+
+class VoteTally(models.Model):
+    """Running vote count for one choice of one project.
+
+    Denormalised from :class:`~publications.models.form.FormResponse` so public
+    results are read from at most one row per choice instead of re-counting
+    every vote. Kept in step by the vote write helpers in
+    :mod:`publications.services`, in the same transaction as the vote itself;
+    reconciled periodically by :func:`publications.tasks.reconcile_vote_tallies`
+    (or ``manage.py rebuild_vote_tallies``).
+    """
+
+    project = models.ForeignKey(
+        "publications.ProjectPage",
+        on_delete=models.CASCADE,
+        related_name="vote_tallies",
+        verbose_name=_("Project"),
+    )
+    choice = models.CharField(
+        _("Choice"),
+        max_length=30,
+        choices=VoteChoice.choices,
+    )
+    count = models.PositiveIntegerField(_("Votes"), default=0)
+    comment_count = models.PositiveIntegerField(_("Votes with a comment"), default=0)
+
+    class Meta:
+        verbose_name = _("Vote Tally")
+        verbose_name_plural = _("Vote Tallies")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "choice"],
+                name="unique_project_choice_tally",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.project_id} - {self.choice}: {self.count}"
@@ -1,17 +1,42 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Sequence, Union
 
-from django.db.models import Count, Q, QuerySet
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import Count, Exists, F, Max, OuterRef, Q, QuerySet, Sum, TextField, Value
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Greatest, TruncDay, TruncHour
 from django.core.paginator import Page as PaginatorPage
-from django.core.paginator import Paginator
 from django.http import HttpRequest
+from django.utils import timezone
+from django.utils.translation import get_language
 
+from core.cache import (
+    VOTE_RESULTS_KEY,
+    VOTE_RESULTS_TIMEOUT,
+    VOTE_RESULTS_VERSION_KEY,
+    bump_cache_version,
+    get_cache_version,
+    get_versioned_cache,
+    pagination_count_key,
+)
+from core.pagination import CachedCountPaginator
+from core.utils import get_stream_text
 from publications.models.project import ProjectCategory
 
 if TYPE_CHECKING:
+    from core.models import User
+    from publications.models.form import FormResponse
+    from publications.models.idea import IdeaResponse
     from publications.models.project import ProjectPage
+    from publications.models.publication import PublicationPage
 
 
 @dataclass
@@ -34,14 +59,31 @@ class PublicationFilters:
             show_past_events=request.GET.get("show_past", "").lower() in ("true", "1", "on"),
         )
 
+    def count_key(self, scope: str) -> str:
+        """Cache key for the number of publications in ``scope`` matching these filters."""
+        return pagination_count_key(
+            scope,
+            type=self.publication_type,
+            category=self.category,
+            search=self.search_query,
+            show_past=self.show_past_events,
+        )
+
+
+def _exclude_past_events(publications: QuerySet) -> QuerySet:
+    return publications.filter(Q(visible_until__isnull=True) | Q(visible_until__gte=timezone.now()))
+
 
 def filter_publications_by_type(
     publications: QuerySet, publication_type: str, show_past_events: bool = False
 ) -> QuerySet:
+    """Filter publications by type and order them by their stored ``sort_date``.
+
+    ``sort_date`` and ``visible_until`` are kept up to date by
+    ``PublicationPage.save``, so neither the ordering nor the past-event filter
+    needs to join the subtype tables.
+    """
     from django.contrib.contenttypes.models import ContentType
-    from django.db.models import Case, When
-    from django.db.models.functions import Coalesce
-    from django.utils import timezone
 
     from publications.models.event import EventPage
     from publications.models.project import ProjectPage
@@ -52,69 +94,137 @@ def filter_publications_by_type(
 
     elif publication_type == "events":
         event_ct = ContentType.objects.get_for_model(EventPage)
-        now = timezone.now()
+        publications = publications.filter(real_type=event_ct)
 
-        event_queryset = publications.filter(real_type=event_ct)
+    if not show_past_events:
+        publications = _exclude_past_events(publications)
 
-        if not show_past_events:
-            today = now.date()
-            event_queryset = event_queryset.filter(
-                Q(eventpage__end_date__gte=now)
-                | Q(eventpage__end_date__isnull=True, eventpage__event_date__date__gte=today)
-            )
+    return publications.order_by("-sort_date")
 
-        return event_queryset.order_by("-eventpage__event_date")
 
-    event_ct = ContentType.objects.get_for_model(EventPage)
+def filter_publications_by_category(publications: QuerySet, category: Optional[str]) -> QuerySet:
+    if category and category in [c.value for c in ProjectCategory]:
+        return publications.filter(projectpage__category=category)
+    return publications
 
-    if not show_past_events:
-        now = timezone.now()
-        today = now.date()
 
-        past_events_filter = Q(real_type=event_ct) & (
-            Q(eventpage__end_date__lt=now)
-            | Q(eventpage__end_date__isnull=True, eventpage__event_date__date__lt=today)
-        )
-        publications = publications.exclude(past_events_filter)
+# Text search configuration created by migration 0016: the built-in French
+# stemmer, with accents stripped so "evenement" also matches "événement".
+SEARCH_CONFIG = "publications_french"
 
-    publications = publications.annotate(
-        sort_date=Case(
-            When(real_type=event_ct, then="eventpage__event_date"),
-            default="first_published_at",
+
+def search_publications(publications: QuerySet, search_query: str) -> QuerySet:
+    """Keep the publications matching ``search_query``.
+
+    On PostgreSQL this queries the GIN-indexed ``search_vector`` and puts the
+    best ranked matches first; elsewhere (SQLite dev/test setup) it falls back
+    to a case-insensitive match on the title and description.
+    """
+    if not search_query:
+        return publications
+
+    if connection.vendor != "postgresql":
+        return _search_publications_icontains(publications, search_query)
+
+    query = SearchQuery(search_query, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        publications.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", *publications.query.order_by)
+    )
+
+
+def _search_publications_icontains(publications: QuerySet, search_query: str) -> QuerySet:
+    return publications.filter(
+        Q(title__icontains=search_query) | Q(description__icontains=search_query)
+    )
+
+
+def get_search_document(page: PublicationPage) -> CombinedExpression:
+    """The weighted search vector of ``page``: title, then description, then content."""
+    content = get_stream_text(page.content)
+    return (
+        SearchVector(Value(page.title, output_field=TextField()), weight="A", config=SEARCH_CONFIG)
+        + SearchVector(
+            Value(page.description, output_field=TextField()), weight="B", config=SEARCH_CONFIG
         )
+        + SearchVector(Value(content, output_field=TextField()), weight="C", config=SEARCH_CONFIG)
     )
 
-    return publications.order_by("-sort_date")
 
+def update_search_vectors(pages: Iterable[PublicationPage]) -> int:
+    """Store the search vector of each page; a no-op outside PostgreSQL.
 
-def filter_publications_by_category(publications: QuerySet, category: Optional[str]) -> QuerySet:
-    if category and category in [c.value for c in ProjectCategory]:
-        return publications.filter(projectpage__category=category)
-    return publications
+    Called from ``PublicationPage.save``, so publishing a page refreshes it.
+    Returns the number of rows updated.
+    """
+    if connection.vendor != "postgresql":
+        return 0
 
+    from publications.models.publication import PublicationPage
 
-def search_publications(publications: QuerySet, search_query: str) -> QuerySet:
-    if search_query:
-        return publications.filter(
-            Q(title__icontains=search_query) | Q(description__icontains=search_query)
+    updated = 0
+    for page in pages:
+        updated += PublicationPage.objects.filter(pk=page.pk).update(
+            search_vector=get_search_document(page)
         )
-    return publications
+    return updated
 
 
 def paginate_publications(
     publications: Union[QuerySet, Sequence],
     page_number: Optional[int] = None,
     per_page: int = 12,
+    count_key: Optional[str] = None,
 ) -> PaginatorPage:
-    paginator = Paginator(publications, per_page)
+    paginator = CachedCountPaginator(publications, per_page, count_key=count_key)
     return paginator.get_page(page_number)
 
 
+def resolve_publication_subtypes(publications: Iterable[PublicationPage]) -> list[PublicationPage]:
+    """Preload the ``ProjectPage``/``EventPage`` row behind each publication.
+
+    Issues one query per subtype present instead of one per publication, and
+    caches each row on its ``PublicationPage`` so ``get_real_instance`` and the
+    properties built on it (``is_event``, ``event_date``, ...) need no query.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from publications.models.publication import PublicationPage
+
+    publications = list(publications)
+    pending: dict[int, list[PublicationPage]] = {}
+    for publication in publications:
+        if type(publication) is PublicationPage and publication.real_type_id:
+            pending.setdefault(publication.real_type_id, []).append(publication)
+
+    for real_type_id, base_pages in pending.items():
+        model = ContentType.objects.get_for_id(real_type_id).model_class()
+        if model is None or not issubclass(model, PublicationPage) or model is PublicationPage:
+            continue
+        subtype_link = PublicationPage._meta.get_field(model._meta.model_name)
+        specific_pages = model.objects.in_bulk([page.pk for page in base_pages])
+        for page in base_pages:
+            if page.pk in specific_pages:
+                subtype_link.set_cached_value(page, specific_pages[page.pk])
+
+    return publications
+
+
 def get_filtered_publications(
     base_queryset: QuerySet,
     filters: PublicationFilters,
     per_page: int = 12,
+    count_key: Optional[str] = None,
 ) -> PaginatorPage:
+    """Filter, search and paginate ``base_queryset``.
+
+    ``count_key`` caches the total across requests, see ``CachedCountPaginator``;
+    it must identify both the base queryset and ``filters``.
+    """
+    from core.pagination import LazyObjectList
+    from core.renditions import prefetch_card_images
+
     publications = filter_publications_by_type(
         base_queryset, filters.publication_type, filters.show_past_events
     )
@@ -124,14 +234,580 @@ def get_filtered_publications(
 
     publications = search_publications(publications, filters.search_query)
 
-    return paginate_publications(publications, filters.page_number, per_page)
+    page = paginate_publications(publications, filters.page_number, per_page, count_key)
+    # Loaded when the cards are rendered, which a cached listing fragment skips.
+    page.object_list = LazyObjectList(
+        page.object_list,
+        lambda publications: prefetch_card_images(resolve_publication_subtypes(publications)),
+    )
+    return page
+
 
+class _VoteContribution(NamedTuple):
+    """What a single vote adds to its project's tally and statistics."""
 
-def get_vote_results(project: "ProjectPage") -> dict[str, Any]:
+    choice: str
+    has_comment: bool
+    is_local: bool
+
+
+def is_local_voter(user: "User") -> bool:
+    """Whether ``user`` counts as a local voter (postal code ``LOCAL_POSTAL_CODE``)."""
+    return user.postal_code == getattr(settings, "LOCAL_POSTAL_CODE", "13007")
+
+
+def _increment(queryset: QuerySet, deltas: dict[str, int]) -> None:
+    # Greatest() keeps a drifted counter (e.g. votes removed by a user cascade)
+    # from failing the positive-integer check; reconciliation fixes it.
+    updates = {field: Greatest(F(field) + delta, 0) for field, delta in deltas.items() if delta}
+    if updates:
+        queryset.update(**updates)
+
+
+def _apply_vote_change(
+    project_id: int,
+    removed: Optional[_VoteContribution],
+    added: Optional[_VoteContribution],
+) -> bool:
+    """Move a project's tally and statistics from the ``removed`` vote to ``added``.
+
+    Either side may be ``None`` for a new or deleted vote. Counter rows are
+    updated in a fixed order (tallies by choice, then statistics) so that
+    concurrent vote changes cannot deadlock. Returns whether anything changed.
+    """
+    from publications.models.form import FAVORABLE_VALUES
+    from publications.models.vote_statistics import VoteStatistics
+    from publications.models.vote_tally import VoteTally
+
+    if removed == added:
+        return False
+
+    tally_deltas: dict[str, dict[str, int]] = {}
+    statistics_deltas: dict[str, int] = {}
+    for contribution, delta in ((removed, -1), (added, 1)):
+        if contribution is None:
+            continue
+
+        choice_deltas = tally_deltas.setdefault(contribution.choice, {})
+        counters = ["count"] + (["comment_count"] if contribution.has_comment else [])
+        for counter in counters:
+            choice_deltas[counter] = choice_deltas.get(counter, 0) + delta
+
+        counters = ["total_votes"]
+        if contribution.has_comment:
+            counters.append("with_comments")
+        if contribution.choice in FAVORABLE_VALUES:
+            counters.append("favorable_votes")
+        prefixes = ("", "local_") if contribution.is_local else ("",)
+        for counter in (prefix + counter for prefix in prefixes for counter in counters):
+            statistics_deltas[counter] = statistics_deltas.get(counter, 0) + delta
+
+    VoteTally.objects.bulk_create(
+        [VoteTally(project_id=project_id, choice=choice) for choice in sorted(tally_deltas)],
+        ignore_conflicts=True,
+    )
+    for choice in sorted(tally_deltas):
+        _increment(
+            VoteTally.objects.filter(project_id=project_id, choice=choice), tally_deltas[choice]
+        )
+
+    VoteStatistics.objects.bulk_create(
+        [VoteStatistics(project_id=project_id)], ignore_conflicts=True
+    )
+    _increment(VoteStatistics.objects.filter(project_id=project_id), statistics_deltas)
+
+    return True
+
+
+# One statement that upserts the vote and reports both whether the row was
+# inserted (xmax = 0 only on a fresh tuple) and the values it replaced, read
+# under FOR UPDATE so the tally can be adjusted. If the conflicting row was
+# inserted by a concurrent transaction after our snapshot, ``previous`` cannot
+# see it: the WHERE clause then skips the update, nothing is returned, and the
+# caller simply re-runs the statement against the now-visible row.
+_PG_UPSERT_VOTE_SQL = """
+WITH previous AS (
+    SELECT {choice}, {comment}, {is_local} FROM {table}
+    WHERE {user} = %(user_id)s AND {project} = %(project_id)s
+    FOR UPDATE
+), upserted AS (
+    INSERT INTO {table} ({created_at}, {updated_at}, {user}, {project}, {choice}, {comment},
+        {anonymize}, {is_local})
+    VALUES (%(now)s, %(now)s, %(user_id)s, %(project_id)s, %(choice)s, %(comment)s,
+        %(anonymize)s, %(is_local)s)
+    ON CONFLICT ({user}, {project}) DO UPDATE SET
+        {updated_at} = EXCLUDED.{updated_at},
+        {choice} = EXCLUDED.{choice},
+        {comment} = EXCLUDED.{comment},
+        {anonymize} = EXCLUDED.{anonymize},
+        {is_local} = EXCLUDED.{is_local}
+    WHERE EXISTS (SELECT 1 FROM previous)
+    RETURNING {pk}, {created_at}, (xmax = 0) AS created
+)
+SELECT upserted.*, previous.{choice}, previous.{comment}, previous.{is_local}
+FROM upserted LEFT JOIN previous ON TRUE
+"""
+
+_UPSERT_VOTE_ATTEMPTS = 3
+
+
+class VoteConflictError(OperationalError):
+    """A vote could not be written because of repeated concurrent writes; retry later."""
+
+
+def _upsert_vote_postgresql(
+    user: "User",
+    project: "ProjectPage",
+    choice: str,
+    comment: str,
+    anonymize: bool,
+    is_local: bool,
+) -> tuple["FormResponse", bool, Optional[Mapping[str, Any]]]:
+    from publications.models.form import FormResponse
+
+    meta = FormResponse._meta
+    qn = connection.ops.quote_name
+    columns = {field.name: field.column for field in meta.concrete_fields}
+    sql = _PG_UPSERT_VOTE_SQL.format(
+        table=qn(meta.db_table),
+        pk=qn(meta.pk.column),
+        **{
+            name: qn(columns[name])
+            for name in (
+                "created_at",
+                "updated_at",
+                "user",
+                "project",
+                "choice",
+                "comment",
+                "anonymize",
+                "is_local",
+            )
+        },
+    )
+    now = timezone.now()
+    params = {
+        "now": now,
+        "user_id": user.pk,
+        "project_id": project.pk,
+        "choice": choice,
+        "comment": comment,
+        "anonymize": anonymize,
+        "is_local": is_local,
+    }
+
+    with connection.cursor() as cursor:
+        for _attempt in range(_UPSERT_VOTE_ATTEMPTS):
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+            if row is not None:
+                break
+        else:
+            raise VoteConflictError("Could not upsert vote after repeated conflicts")
+
+    pk, created_at, created, previous_choice, previous_comment, previous_is_local = row
+    response = FormResponse(
+        pk=pk,
+        created_at=created_at,
+        updated_at=now,
+        user=user,
+        project=project,
+        choice=choice,
+        comment=comment,
+        anonymize=anonymize,
+        is_local=is_local,
+    )
+    previous = (
+        None
+        if created
+        else {
+            "choice": previous_choice,
+            "comment": previous_comment or "",
+            "is_local": previous_is_local,
+        }
+    )
+    return response, created, previous
+
+
+def _upsert_vote_fallback(
+    user: "User",
+    project: "ProjectPage",
+    choice: str,
+    comment: str,
+    anonymize: bool,
+    is_local: bool,
+) -> tuple["FormResponse", bool, Optional[Mapping[str, Any]]]:
+    """ORM equivalent of the PostgreSQL upsert, for the SQLite dev/test setup."""
+    from publications.models.form import FormResponse
+
+    previous = (
+        FormResponse.objects.select_for_update()
+        .filter(user=user, project=project)
+        .values("choice", "comment", "is_local")
+        .first()
+    )
+    response, created = FormResponse.objects.update_or_create(
+        user=user,
+        project=project,
+        defaults={
+            "choice": choice,
+            "comment": comment,
+            "anonymize": anonymize,
+            "is_local": is_local,
+        },
+    )
+    return response, created, previous
+
+
+def record_vote(
+    user: "User",
+    project: "ProjectPage",
+    choice: str,
+    comment: str = "",
+    anonymize: bool = False,
+) -> tuple["FormResponse", bool]:
+    """Create or update ``user``'s vote on ``project``, keeping its counters in step.
+
+    The voter's locality is recorded on the row as it is written. Returns the
+    response and whether it was created (as ``update_or_create``).
+    On PostgreSQL the vote row is written by a single ``INSERT ... ON CONFLICT``
+    statement, which is also safe against concurrent votes from the same user.
+    Raises ``VoteConflictError`` if that statement keeps losing to concurrent
+    writes.
+    """
+    upsert = _upsert_vote_postgresql if connection.vendor == "postgresql" else _upsert_vote_fallback
+
+    with transaction.atomic():
+        response, created, previous = upsert(
+            user, project, choice, comment, anonymize, is_local_voter(user)
+        )
+
+        removed = (
+            _VoteContribution(previous["choice"], bool(previous["comment"]), previous["is_local"])
+            if previous is not None
+            else None
+        )
+        added = _VoteContribution(response.choice, bool(response.comment), response.is_local)
+        if _apply_vote_change(project.pk, removed, added):
+            transaction.on_commit(partial(refresh_cached_vote_results, project))
+
+    return response, created
+
+
+def remove_vote(user: "User", project: "ProjectPage") -> bool:
+    """Delete ``user``'s vote on ``project``, if any, and update its counters."""
+    from publications.models.form import FormResponse
+
+    with transaction.atomic():
+        previous = (
+            FormResponse.objects.select_for_update()
+            .filter(user=user, project=project)
+            .values("pk", "choice", "comment", "is_local")
+            .first()
+        )
+        if previous is None:
+            return False
+
+        FormResponse.objects.filter(pk=previous["pk"]).delete()
+        removed = _VoteContribution(
+            previous["choice"], bool(previous["comment"]), previous["is_local"]
+        )
+        _apply_vote_change(project.pk, removed, None)
+        transaction.on_commit(partial(refresh_cached_vote_results, project))
+
+    return True
+
+
+def _apply_idea_change(
+    project_id: int, removed_is_local: Optional[bool], added_is_local: Optional[bool]
+) -> None:
+    """Move a project's idea counters from a removed idea to an added one.
+
+    Each side is the idea's ``is_local`` flag, or ``None`` for a new or
+    deleted idea.
+    """
+    from publications.models.idea_statistics import IdeaStatistics
+
+    deltas: dict[str, int] = {}
+    for is_local, delta in ((removed_is_local, -1), (added_is_local, 1)):
+        if is_local is None:
+            continue
+        for counter in ("total_ideas", "local_total_ideas") if is_local else ("total_ideas",):
+            deltas[counter] = deltas.get(counter, 0) + delta
+
+    IdeaStatistics.objects.bulk_create(
+        [IdeaStatistics(project_id=project_id)], ignore_conflicts=True
+    )
+    _increment(IdeaStatistics.objects.filter(project_id=project_id), deltas)
+
+
+def record_idea(
+    user: "User", project: "ProjectPage", description: str, anonymize: bool = False
+) -> tuple["IdeaResponse", bool]:
+    """Create or update ``user``'s idea on ``project``, keeping its counters in step.
+
+    Returns the response and whether it was created (as ``update_or_create``).
+    """
+    from publications.models.idea import IdeaResponse
+
+    with transaction.atomic():
+        previous = (
+            IdeaResponse.objects.select_for_update()
+            .filter(user=user, project=project)
+            .values("is_local")
+            .first()
+        )
+        response, created = IdeaResponse.objects.update_or_create(
+            user=user,
+            project=project,
+            defaults={
+                "description": description,
+                "anonymize": anonymize,
+                "is_local": is_local_voter(user),
+            },
+        )
+        if created:
+            _apply_idea_change(project.pk, None, response.is_local)
+        elif previous is not None:
+            _apply_idea_change(project.pk, previous["is_local"], response.is_local)
+
+    return response, created
+
+
+def remove_idea(user: "User", project: "ProjectPage") -> bool:
+    """Delete ``user``'s idea on ``project``, if any, and update its counters."""
+    from publications.models.idea import IdeaResponse
+
+    with transaction.atomic():
+        previous = (
+            IdeaResponse.objects.select_for_update()
+            .filter(user=user, project=project)
+            .values("pk", "is_local")
+            .first()
+        )
+        if previous is None:
+            return False
+
+        IdeaResponse.objects.filter(pk=previous["pk"]).delete()
+        _apply_idea_change(project.pk, previous["is_local"], None)
+
+    return True
+
+
+def rebuild_vote_tallies(project_ids: Optional[Sequence[int]] = None) -> int:
+    """Recompute vote tallies from ``FormResponse``; return the number of rows written.
+
+    Rebuilds every project's tally, or only those in ``project_ids``, and then
+    invalidates their cached results. Each project's rows are locked in the
+    order vote writes update them before counting, so votes committed
+    concurrently are neither lost nor counted twice.
+    """
     from publications.models.form import FormResponse, VoteChoice
+    from publications.models.project import ProjectPage
+    from publications.models.vote_tally import VoteTally
+
+    if project_ids is None:
+        project_ids = list(ProjectPage.objects.values_list("pk", flat=True))
+
+    choices = sorted(VoteChoice.values)
+    cache = get_versioned_cache()
+    written = 0
+
+    for project_id in project_ids:
+        # With a row for every choice, a concurrent vote can only update rows
+        # locked below, never insert one behind the rebuild's back.
+        VoteTally.objects.bulk_create(
+            [VoteTally(project_id=project_id, choice=choice) for choice in choices],
+            ignore_conflicts=True,
+        )
+        with transaction.atomic():
+            tallies = VoteTally.objects.select_for_update().filter(project_id=project_id)
+            for choice in choices:
+                list(tallies.filter(choice=choice))
+
+            counts = {
+                row["choice"]: row
+                for row in FormResponse.objects.filter(project_id=project_id)
+                .values("choice")
+                .annotate(count=Count("id"), comment_count=Count("id", filter=~Q(comment="")))
+                .order_by()
+            }
+            for choice in choices:
+                row = counts.get(choice, {})
+                written += tallies.filter(choice=choice).update(
+                    count=row.get("count", 0), comment_count=row.get("comment_count", 0)
+                )
+
+            transaction.on_commit(
+                partial(
+                    bump_cache_version,
+                    cache,
+                    VOTE_RESULTS_VERSION_KEY.format(project_id=project_id),
+                )
+            )
+
+    return written
+
+
+def rebuild_vote_statistics(project_ids: Optional[Sequence[int]] = None) -> int:
+    """Recompute the admin vote statistics from ``FormResponse``.
+
+    Reconciles every project, or only those in ``project_ids``, and returns the
+    number of projects processed. Each project's row is locked before counting,
+    so votes committed concurrently are neither lost nor counted twice.
+    """
+    from publications.models.form import FAVORABLE_VALUES, FormResponse
+    from publications.models.project import ProjectPage
+    from publications.models.vote_statistics import VoteStatistics
+
+    if project_ids is None:
+        project_ids = list(ProjectPage.objects.values_list("pk", flat=True))
+
+    has_comment = ~Q(comment="")
+    favorable = Q(choice__in=FAVORABLE_VALUES)
+    local = Q(is_local=True)
+
+    for project_id in project_ids:
+        with transaction.atomic():
+            VoteStatistics.objects.bulk_create(
+                [VoteStatistics(project_id=project_id)], ignore_conflicts=True
+            )
+            statistics = VoteStatistics.objects.select_for_update().filter(project_id=project_id)
+            list(statistics)
+
+            counts = FormResponse.objects.filter(project_id=project_id).aggregate(
+                total_votes=Count("id"),
+                with_comments=Count("id", filter=has_comment),
+                favorable_votes=Count("id", filter=favorable),
+                local_total_votes=Count("id", filter=local),
+                local_with_comments=Count("id", filter=local & has_comment),
+                local_favorable_votes=Count("id", filter=local & favorable),
+            )
+            statistics.update(**counts)
+
+    return len(project_ids)
+
+
+def rebuild_idea_statistics(project_ids: Optional[Sequence[int]] = None) -> int:
+    """Recompute the admin idea counters from ``IdeaResponse``.
+
+    Reconciles every project, or only those in ``project_ids``, and returns the
+    number of projects processed. As in :func:`rebuild_vote_statistics`, each
+    project's row is locked before counting.
+    """
+    from publications.models.idea import IdeaResponse
+    from publications.models.idea_statistics import IdeaStatistics
+    from publications.models.project import ProjectPage
+
+    if project_ids is None:
+        project_ids = list(ProjectPage.objects.values_list("pk", flat=True))
+
+    for project_id in project_ids:
+        with transaction.atomic():
+            IdeaStatistics.objects.bulk_create(
+                [IdeaStatistics(project_id=project_id)], ignore_conflicts=True
+            )
+            statistics = IdeaStatistics.objects.select_for_update().filter(project_id=project_id)
+            list(statistics)
+
+            counts = IdeaResponse.objects.filter(project_id=project_id).aggregate(
+                total_ideas=Count("id"),
+                local_total_ideas=Count("id", filter=Q(is_local=True)),
+            )
+            statistics.update(**counts)
+
+    return len(project_ids)
+
+
+def update_response_locality(user: "User") -> int:
+    """Re-flag ``user``'s votes and ideas after their postal code changed.
+
+    Moves the affected votes and ideas between the local and overall
+    statistics so the dashboards follow the voter. Returns the number of votes
+    re-flagged.
+    """
+    from publications.models.form import FormResponse
+    from publications.models.idea import IdeaResponse
+
+    is_local = is_local_voter(user)
+
+    with transaction.atomic():
+        moved = list(
+            FormResponse.objects.select_for_update()
+            .filter(user=user)
+            .exclude(is_local=is_local)
+            .order_by("project_id")
+            .values_list("pk", "project_id", "choice", "comment")
+        )
+        for _pk, project_id, choice, comment in moved:
+            _apply_vote_change(
+                project_id,
+                _VoteContribution(choice, bool(comment), not is_local),
+                _VoteContribution(choice, bool(comment), is_local),
+            )
+        FormResponse.objects.filter(pk__in=[row[0] for row in moved]).update(is_local=is_local)
+
+        moved_ideas = list(
+            IdeaResponse.objects.select_for_update()
+            .filter(user=user)
+            .exclude(is_local=is_local)
+            .order_by("project_id")
+            .values_list("pk", "project_id")
+        )
+        for _pk, project_id in moved_ideas:
+            _apply_idea_change(project_id, not is_local, is_local)
+        IdeaResponse.objects.filter(pk__in=[row[0] for row in moved_ideas]).update(
+            is_local=is_local
+        )
+
+    return len(moved)
+
+
+def backfill_response_locality(batch_size: int = 5000) -> int:
+    """Set ``is_local`` on every vote and idea from its author's postal code.
+
+    Rows are updated in primary-key batches to keep each transaction short,
+    then the vote and idea statistics are rebuilt from the new flags. Returns the
+    number of rows processed.
+    """
+    from django.contrib.auth import get_user_model
+
+    from publications.models.form import FormResponse
+    from publications.models.idea import IdeaResponse
 
-    responses = FormResponse.objects.filter(project=project)
-    total_votes = responses.count()
+    local_author = Exists(
+        get_user_model().objects.filter(
+            pk=OuterRef("user_id"),
+            postal_code=getattr(settings, "LOCAL_POSTAL_CODE", "13007"),
+        )
+    )
+
+    processed = 0
+    for model in (FormResponse, IdeaResponse):
+        last_pk = 0
+        while True:
+            pks = list(
+                model.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            model.objects.filter(pk__in=pks).update(is_local=local_author)
+            processed += len(pks)
+            last_pk = pks[-1]
+
+    rebuild_vote_statistics()
+    rebuild_idea_statistics()
+    return processed
+
+
+def get_vote_results(project: "ProjectPage") -> dict[str, Any]:
+    from publications.models.form import VoteChoice
+    from publications.models.vote_tally import VoteTally
+
+    counts_dict = dict(VoteTally.objects.filter(project=project).values_list("choice", "count"))
+    total_votes = sum(counts_dict.values())
 
     if total_votes == 0:
         return {
@@ -139,10 +815,6 @@ def get_vote_results(project: "ProjectPage") -> dict[str, Any]:
             "choices": {choice[0]: {"count": 0, "percentage": 0} for choice in VoteChoice.choices},
         }
 
-    # Count votes per choice
-    vote_counts = responses.values("choice").annotate(count=Count("id"))
-    counts_dict = {item["choice"]: item["count"] for item in vote_counts}
-
     choices_results = {}
     for choice_value, choice_label in VoteChoice.choices:
         count = counts_dict.get(choice_value, 0)
@@ -157,3 +829,214 @@ def get_vote_results(project: "ProjectPage") -> dict[str, Any]:
         "total_votes": total_votes,
         "choices": choices_results,
     }
+
+
+def get_vote_results_version(project: "ProjectPage") -> int:
+    """Return the project's current results version (bumped by every vote write)."""
+    return get_cache_version(
+        get_versioned_cache(), VOTE_RESULTS_VERSION_KEY.format(project_id=project.pk)
+    )
+
+
+def get_cached_vote_results(project: "ProjectPage") -> dict[str, Any]:
+    """Return :func:`get_vote_results` for ``project`` through the results cache.
+
+    The entry is keyed by the project's current results version, which every
+    vote write bumps once committed (see :func:`refresh_cached_vote_results`),
+    so a reader never picks up totals older than the last committed vote. The
+    key also carries the active language, as the choice labels are translated.
+    """
+    cache = get_versioned_cache()
+    cache_key = VOTE_RESULTS_KEY.format(
+        project_id=project.pk,
+        version=get_vote_results_version(project),
+        language=get_language(),
+    )
+
+    results = cache.get(cache_key)
+    if results is None:
+        results = get_vote_results(project)
+        cache.add(cache_key, results, VOTE_RESULTS_TIMEOUT)
+    return results
+
+
+def refresh_cached_vote_results(project: "ProjectPage") -> None:
+    """Bump the project's results version and write the fresh results through.
+
+    Runs after the vote transaction commits. Results are computed *after* the
+    bump, so whatever is stored under a version already includes every vote
+    committed before that version was issued.
+    """
+    cache = get_versioned_cache()
+    version = bump_cache_version(cache, VOTE_RESULTS_VERSION_KEY.format(project_id=project.pk))
+    cache.set(
+        VOTE_RESULTS_KEY.format(project_id=project.pk, version=version, language=get_language()),
+        get_vote_results(project),
+        VOTE_RESULTS_TIMEOUT,
+    )
+
+
+# Hourly buckets from this far before the latest one are recomputed on every
+# rollup, so responses committed just after a run are picked up by the next.
+ACTIVITY_ROLLUP_OVERLAP = timedelta(hours=1)
+
+
+def _local_day_start(moment: datetime) -> datetime:
+    return timezone.make_aware(datetime.combine(timezone.localdate(moment), time.min))
+
+
+def _rollup_project_activity(
+    project_id: int,
+    kind: str,
+    model: type[Union["FormResponse", "IdeaResponse"]],
+    by_choice: bool,
+) -> int:
+    from publications.models.activity import ActivityGranularity, ParticipationActivity
+
+    activity = ParticipationActivity.objects.filter(project_id=project_id, kind=kind)
+    latest = activity.filter(granularity=ActivityGranularity.HOUR).aggregate(latest=Max("bucket"))[
+        "latest"
+    ]
+    since = latest - ACTIVITY_ROLLUP_OVERLAP if latest is not None else None
+
+    responses = model.objects.filter(project_id=project_id)
+    if since is not None:
+        responses = responses.filter(created_at__gte=since)
+    dimensions = ("bucket", "choice", "is_local") if by_choice else ("bucket", "is_local")
+    hourly = [
+        ParticipationActivity(
+            project_id=project_id,
+            kind=kind,
+            granularity=ActivityGranularity.HOUR,
+            bucket=row["bucket"],
+            choice=row.get("choice", ""),
+            is_local=row["is_local"],
+            count=row["count"],
+        )
+        # Truncated in UTC, so the hour repeated when clocks go back keeps its own bucket.
+        for row in responses.annotate(bucket=TruncHour("created_at", tzinfo=dt_timezone.utc))
+        .values(*dimensions)
+        .annotate(count=Count("id"))
+        .order_by()
+    ]
+    if since is None and not hourly:
+        return 0
+
+    day_start = _local_day_start(since) if since is not None else None
+    with transaction.atomic():
+        stale_hours = activity.filter(granularity=ActivityGranularity.HOUR)
+        stale_days = activity.filter(granularity=ActivityGranularity.DAY)
+        if since is not None:
+            stale_hours = stale_hours.filter(bucket__gte=since)
+            stale_days = stale_days.filter(bucket__gte=day_start)
+        stale_hours.delete()
+        ParticipationActivity.objects.bulk_create(hourly)
+
+        # Days are summed from the hourly rows, which are few, not from responses.
+        stale_days.delete()
+        hours = activity.filter(granularity=ActivityGranularity.HOUR)
+        if day_start is not None:
+            hours = hours.filter(bucket__gte=day_start)
+        daily = [
+            ParticipationActivity(
+                project_id=project_id,
+                kind=kind,
+                granularity=ActivityGranularity.DAY,
+                bucket=row["day"],
+                choice=row["choice"],
+                is_local=row["is_local"],
+                count=row["total"],
+            )
+            for row in hours.annotate(day=TruncDay("bucket"))
+            .values("day", "choice", "is_local")
+            .annotate(total=Sum("count"))
+            .order_by()
+        ]
+        ParticipationActivity.objects.bulk_create(daily)
+
+    return len(hourly) + len(daily)
+
+
+def rollup_participation_activity(project_ids: Optional[Sequence[int]] = None) -> int:
+    """Bring the hourly and daily participation activity of projects up to date.
+
+    Only responses created since the latest hourly bucket (minus
+    ``ACTIVITY_ROLLUP_OVERLAP``) are read, through the ``(project, created_at)``
+    index; a project's first run covers its whole history. Returns the number
+    of activity rows written.
+    """
+    from publications.models.activity import ActivityKind
+    from publications.models.form import FormResponse
+    from publications.models.idea import IdeaResponse
+    from publications.models.project import ProjectPage
+
+    if project_ids is None:
+        project_ids = list(ProjectPage.objects.values_list("pk", flat=True))
+
+    written = 0
+    for project_id in project_ids:
+        written += _rollup_project_activity(project_id, ActivityKind.VOTE, FormResponse, True)
+        written += _rollup_project_activity(project_id, ActivityKind.IDEA, IdeaResponse, False)
+    return written
+
+
+def _activity_buckets(first: datetime, last: datetime, granularity: str) -> Iterator[datetime]:
+    from publications.models.activity import ActivityGranularity
+
+    if granularity == ActivityGranularity.DAY:
+        # Wall-clock arithmetic keeps each step on local midnight across DST.
+        current, step = timezone.localtime(first), timedelta(days=1)
+    else:
+        # Hours step in UTC, as local ones repeat or vanish across DST.
+        current, step = first.astimezone(dt_timezone.utc), timedelta(hours=1)
+    while current <= last:
+        yield timezone.localtime(current)
+        current += step
+
+
+def get_activity_timeline(
+    project: "ProjectPage",
+    kind: str,
+    granularity: str,
+    local_only: bool,
+    since: Optional[datetime] = None,
+) -> dict[str, Any]:
+    """Return a project's participation activity ready for charting.
+
+    ``labels`` holds one entry per bucket from the first to the last active
+    one, and ``series`` maps each choice (``""`` for ideas) to the counts of
+    those buckets, zero-filled.
+    """
+    from publications.models.activity import ActivityGranularity, ParticipationActivity
+
+    rows = ParticipationActivity.objects.filter(project=project, kind=kind, granularity=granularity)
+    if local_only:
+        rows = rows.filter(is_local=True)
+    if since is not None:
+        rows = rows.filter(bucket__gte=since)
+    totals = {
+        (row["bucket"].timestamp(), row["choice"]): row["total"]
+        for row in rows.values("bucket", "choice").annotate(total=Sum("count")).order_by()
+    }
+    if not totals:
+        return {"labels": [], "series": {}}
+
+    first = min(bucket for bucket, _choice in totals)
+    last = max(bucket for bucket, _choice in totals)
+    buckets = list(
+        _activity_buckets(
+            datetime.fromtimestamp(first, tz=timezone.get_current_timezone()),
+            datetime.fromtimestamp(last, tz=timezone.get_current_timezone()),
+            granularity,
+        )
+    )
+    label_format = "%d/%m/%Y" if granularity == ActivityGranularity.DAY else "%d/%m %Hh"
+    choices = sorted({choice for _bucket, choice in totals})
+
+    return {
+        "labels": [timezone.localtime(bucket).strftime(label_format) for bucket in buckets],
+        "series": {
+            choice: [totals.get((bucket.timestamp(), choice), 0) for bucket in buckets]
+            for choice in choices
+        },
+    }
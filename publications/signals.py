@@ -0,0 +1,19 @@
+from typing import Any, Optional
+
+from publications.services import update_response_locality
+
+
+def sync_response_locality(
+    sender: type,
+    instance: Any,
+    created: bool = False,
+    raw: bool = False,
+    update_fields: Optional[frozenset[str]] = None,
+    **kwargs: Any,
+) -> None:
+    """Keep the locality flag of a user's votes and ideas in step with their postal code."""
+    if created or raw:
+        return
+    if update_fields is not None and "postal_code" not in update_fields:
+        return
+    update_response_locality(instance)
@@ -0,0 +1,23 @@
+from celery import shared_task
+
+from publications import services
+
+
+@shared_task
+def reconcile_vote_tallies() -> int:
+    return services.rebuild_vote_tallies()
+
+
+@shared_task
+def reconcile_vote_statistics() -> int:
+    return services.rebuild_vote_statistics()
+
+
+@shared_task
+def reconcile_idea_statistics() -> int:
+    return services.rebuild_idea_statistics()
+
+
+@shared_task
+def rollup_participation_activity() -> int:
+    return services.rollup_participation_activity()
@@ -10,6 +10,7 @@ from publications.models import (
     ProjectPage,
     VoteChoice,
 )
+from publications.models.idea_statistics import IdeaStatistics
 
 
 @pytest.fixture
@@ -137,6 +138,21 @@ class TestIdeaAPI:
         assert response.status_code == 200
         assert IdeaResponse.objects.filter(user=user, project=project_with_ideas).count() == 0
 
+    def test_idea_counters_follow_submissions(self, client, user, project_with_ideas):
+        url = f"/api/projects/{project_with_ideas.pk}/idea/"
+        client.force_login(user)
+
+        def counters():
+            statistics = IdeaStatistics.objects.get(project=project_with_ideas)
+            return statistics.total_ideas, statistics.local_total_ideas
+
+        client.post(url, data=json.dumps({"description": "First"}), content_type="application/json")
+        assert counters() == (1, 0)
+        client.post(url, data=json.dumps({"description": "Again"}), content_type="application/json")
+        assert counters() == (1, 0)
+        client.delete(url)
+        assert counters() == (0, 0)
+
     def test_idea_on_voting_project_rejected(self, client, user, project_with_voting):
         client.force_login(user)
         response = client.post(
@@ -186,6 +202,22 @@ class TestIdeaMine:
         response = client.get(f"/api/projects/{project_with_voting.pk}/idea/mine/")
         assert response.status_code == 400
 
+    def test_mine_revalidates_with_etag(self, client, user, project_with_ideas):
+        client.force_login(user)
+        url = f"/api/projects/{project_with_ideas.pk}/idea/mine/"
+        etag = client.get(url)["ETag"]
+
+        assert client.get(url, headers={"if-none-match": etag}).status_code == 304
+
+        client.post(
+            f"/api/projects/{project_with_ideas.pk}/idea/",
+            data=json.dumps({"description": "A new idea"}),
+            content_type="application/json",
+        )
+        response = client.get(url, headers={"if-none-match": etag})
+        assert response.status_code == 200
+        assert response.json()["user_idea"]["description"] == "A new idea"
+
 
 class TestModeSwitchingPreservesResponses:
     """Switching participation mode must never destroy responses already collected."""
@@ -1,3 +1,5 @@
+import csv
+
 import pytest
 
 from core.models import User
@@ -7,6 +9,9 @@ from publications.models import (
     ProjectPage,
     PublicationIndexPage,
 )
+from publications.models.idea_statistics import IdeaStatistics
+from publications.services import record_idea
+from publications.tasks import reconcile_idea_statistics
 
 
 @pytest.fixture
@@ -51,7 +56,10 @@ def project_with_ideas(db, regular_user):
     )
     index_page.add_child(instance=project)
     IdeaResponse.objects.create(
-        user=regular_user, project=project, description="Plant trees on the boulevard"
+        user=regular_user,
+        project=project,
+        description="Plant trees on the boulevard",
+        is_local=True,
     )
     return project
 
@@ -123,7 +131,11 @@ class TestIdeaStatsDetailView:
             postal_code="13007",
         )
         IdeaResponse.objects.create(
-            user=anon, project=project, description="A secret idea", anonymize=True
+            user=anon,
+            project=project,
+            description="A secret idea",
+            anonymize=True,
+            is_local=True,
         )
 
         client.force_login(admin_user)
@@ -153,7 +165,7 @@ class TestIdeaStatsLocalFilter:
             last_name="Voter",
             postal_code="13007",
         )
-        IdeaResponse.objects.create(user=local, project=project, description="Local idea")
+        record_idea(local, project, "Local idea")
 
         outside = User.objects.create_user(
             email="outside_idea@example.com",
@@ -162,7 +174,7 @@ class TestIdeaStatsLocalFilter:
             last_name="Voter",
             postal_code="75001",
         )
-        IdeaResponse.objects.create(user=outside, project=project, description="Outside idea")
+        record_idea(outside, project, "Outside idea")
         return project
 
     def test_detail_hides_outside_by_default(self, client, admin_user, project_local_and_outside):
@@ -180,3 +192,69 @@ class TestIdeaStatsLocalFilter:
         content = response.content.decode()
         assert "Local idea" in content
         assert "Outside idea" in content
+
+    def test_detail_reads_the_maintained_counter(
+        self, client, admin_user, project_local_and_outside
+    ):
+        IdeaStatistics.objects.filter(project=project_local_and_outside).update(
+            total_ideas=7, local_total_ideas=5
+        )
+        client.force_login(admin_user)
+        response = client.get(f"/admin/idea-collection/{project_local_and_outside.pk}/")
+        assert response.context["total_ideas"] == 5
+
+    def test_list_reads_the_maintained_counter(self, client, admin_user, project_local_and_outside):
+        client.force_login(admin_user)
+        response = client.get("/admin/idea-collection/?show_all=1")
+        stats = {
+            row["project"].pk: row["total_ideas"] for row in response.context["projects_stats"]
+        }
+        assert stats[project_local_and_outside.pk] == 2
+
+    def test_reconcile_task_fixes_drift(self, project_local_and_outside):
+        IdeaStatistics.objects.filter(project=project_local_and_outside).update(
+            total_ideas=9, local_total_ideas=0
+        )
+        reconcile_idea_statistics.delay()
+        statistics = IdeaStatistics.objects.get(project=project_local_and_outside)
+        assert (statistics.total_ideas, statistics.local_total_ideas) == (2, 1)
+
+    def test_export_streams_local_ideas_as_csv(self, client, admin_user, project_local_and_outside):
+        client.force_login(admin_user)
+        response = client.get(f"/admin/idea-collection/{project_local_and_outside.pk}/export/")
+
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/csv")
+        content = b"".join(response.streaming_content).decode()
+        assert content.splitlines()[0] == "created_at,description,author"
+        assert "Local idea" in content
+        assert "local_idea@example.com" in content
+        assert "Outside idea" not in content
+
+    def test_export_ndjson_with_show_all(self, client, admin_user, project_local_and_outside):
+        import json
+
+        client.force_login(admin_user)
+        response = client.get(
+            f"/admin/idea-collection/{project_local_and_outside.pk}/export/?format=ndjson&show_all=1"
+        )
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert {row["description"] for row in rows} == {"Local idea", "Outside idea"}
+
+    def test_export_csv_neutralises_formulas(self, client, admin_user, project_local_and_outside):
+        IdeaResponse.objects.filter(project=project_local_and_outside).update(
+            description='=HYPERLINK("https://example.com","Click")'
+        )
+
+        client.force_login(admin_user)
+        response = client.get(
+            f"/admin/idea-collection/{project_local_and_outside.pk}/export/?show_all=1"
+        )
+
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        assert {row[1] for row in rows[1:]} == {'\'=HYPERLINK("https://example.com","Click")'}
+
+    def test_export_requires_admin(self, client, project_local_and_outside):
+        response = client.get(f"/admin/idea-collection/{project_local_and_outside.pk}/export/")
+        assert response.status_code == 302
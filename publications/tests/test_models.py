@@ -1,5 +1,8 @@
 from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
 
+from django.core.management import call_command
 from django.test import TestCase, RequestFactory
 from django.utils import timezone
 from wagtail.rich_text import RichText
@@ -63,6 +66,82 @@ class ProjectPageModelTest(TestCase):
         self.assertEqual(toc[1].title, "Context")
         self.assertEqual(toc[1].level, 3)
 
+    def test_table_of_contents_is_stored_on_save(self) -> None:
+        project = ProjectPage(
+            title="Stored TOC",
+            content=[
+                (
+                    BLOCK_TYPE_RICH_TEXT,
+                    {
+                        "text": RichText("<h2>Introduction</h2><p>Text</p><h3>Détails</h3>"),
+                        "justification": TextJustification.LEFT,
+                    },
+                )
+            ],
+        )
+        self.project_index.add_child(instance=project)
+
+        project = ProjectPage.objects.get(pk=project.pk)
+        self.assertEqual(
+            project.toc_items,
+            [
+                {"title": "Introduction", "id": "introduction", "level": 2},
+                {"title": "Détails", "id": "details", "level": 3},
+            ],
+        )
+        with patch("publications.models.project.get_table_of_contents") as parse:
+            toc = project.table_of_contents
+        parse.assert_not_called()
+        self.assertEqual([item.id for item in toc], ["introduction", "details"])
+
+    def test_saving_a_draft_leaves_the_live_table_of_contents(self) -> None:
+        project = ProjectPage(title="Draft TOC", content=self._rich_text("<h2>Publié</h2>"))
+        self.project_index.add_child(instance=project)
+        project.save_revision().publish()
+
+        project.content = self._rich_text("<h2>Brouillon</h2>")
+        with patch("publications.models.project.get_table_of_contents") as parse:
+            project.save_revision()
+        parse.assert_not_called()
+
+        project.refresh_from_db()
+        self.assertEqual(project.toc_items, [{"title": "Publié", "id": "publie", "level": 2}])
+
+        # A preview cleans the edited page, which then parses its own content.
+        project.content = self._rich_text("<h2>Brouillon</h2>")
+        project.clean()
+        self.assertEqual([item.title for item in project.table_of_contents], ["Brouillon"])
+
+    @staticmethod
+    def _rich_text(html: str) -> list:
+        return [
+            (
+                BLOCK_TYPE_RICH_TEXT,
+                {"text": RichText(html), "justification": TextJustification.LEFT},
+            )
+        ]
+
+    def test_backfill_stores_missing_table_of_contents(self) -> None:
+        project = ProjectPage(
+            title="Old project",
+            content=[
+                (
+                    BLOCK_TYPE_RICH_TEXT,
+                    {
+                        "text": RichText("<h2>Contexte</h2>"),
+                        "justification": TextJustification.LEFT,
+                    },
+                )
+            ],
+        )
+        self.project_index.add_child(instance=project)
+        ProjectPage.objects.filter(pk=project.pk).update(toc_items=None)
+
+        call_command("backfill_table_of_contents", stdout=StringIO())
+
+        project.refresh_from_db()
+        self.assertEqual(project.toc_items, [{"title": "Contexte", "id": "contexte", "level": 2}])
+
 
 class EventPageModelTest(TestCase):
     publication_index: PublicationIndexPage
@@ -131,6 +210,12 @@ class EventPageModelTest(TestCase):
         self.assertTrue(finished_event.is_past)
         self.assertFalse(finished_event.is_upcoming)
 
+    def test_is_past_without_dates(self) -> None:
+        draft_event = EventPage(title="Undated Event")
+
+        self.assertIsNone(draft_event.get_visible_until())
+        self.assertFalse(draft_event.is_past)
+
 
 class PublicationIndexPageModelTest(TestCase):
     publication_index: PublicationIndexPage
@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from django.utils import timezone
+
+from core.models import User
+from publications.models import (
+    ActivityGranularity,
+    ActivityKind,
+    FormResponse,
+    IdeaResponse,
+    ParticipationActivity,
+    ParticipationMode,
+    ProjectPage,
+    PublicationIndexPage,
+    VoteChoice,
+)
+from publications.services import get_activity_timeline, rollup_participation_activity
+from publications.tasks import rollup_participation_activity as rollup_task
+
+
+@pytest.fixture
+def project(db):
+    from wagtail.models import Page
+
+    index_page = PublicationIndexPage.objects.first()
+    if not index_page:
+        index_page = PublicationIndexPage(title="Publications", slug="publications")
+        Page.objects.get(depth=1).add_child(instance=index_page)
+
+    project = ProjectPage(
+        title="Busy Project",
+        slug="busy-project",
+        participation_mode=ParticipationMode.VOTING,
+    )
+    index_page.add_child(instance=project)
+    return project
+
+
+def _at(day: int, hour: int) -> datetime:
+    return timezone.make_aware(datetime(2026, 3, day, hour, 15))
+
+
+_users = iter(range(1000))
+
+
+def _vote(project, created_at, choice=VoteChoice.FAVORABLE, is_local=False):
+    user = User.objects.create_user(email=f"activity{next(_users)}@example.com", password="x")
+    response = FormResponse.objects.create(
+        user=user, project=project, choice=choice, is_local=is_local
+    )
+    FormResponse.objects.filter(pk=response.pk).update(created_at=created_at)
+
+
+def _counts(project, granularity):
+    return {
+        (timezone.localtime(row.bucket).strftime("%d %H"), row.choice, row.is_local): row.count
+        for row in ParticipationActivity.objects.filter(
+            project=project, kind=ActivityKind.VOTE, granularity=granularity
+        )
+    }
+
+
+class TestRollup:
+    def test_buckets_by_hour_and_day(self, project):
+        _vote(project, _at(2, 9))
+        _vote(project, _at(2, 9), is_local=True)
+        _vote(project, _at(2, 14), VoteChoice.UNFAVORABLE)
+        _vote(project, _at(3, 10))
+
+        rollup_task.delay().get()
+
+        assert _counts(project, ActivityGranularity.HOUR) == {
+            ("02 09", "FAVORABLE", False): 1,
+            ("02 09", "FAVORABLE", True): 1,
+            ("02 14", "UNFAVORABLE", False): 1,
+            ("03 10", "FAVORABLE", False): 1,
+        }
+        assert _counts(project, ActivityGranularity.DAY) == {
+            ("02 00", "FAVORABLE", False): 1,
+            ("02 00", "FAVORABLE", True): 1,
+            ("02 00", "UNFAVORABLE", False): 1,
+            ("03 00", "FAVORABLE", False): 1,
+        }
+
+    def test_incremental_runs_match_a_full_run(self, project):
+        _vote(project, _at(2, 9))
+        _vote(project, _at(3, 10))
+        rollup_participation_activity([project.pk])
+
+        _vote(project, _at(3, 10))
+        _vote(project, _at(3, 11), VoteChoice.RATHER_FAVORABLE)
+        rollup_participation_activity([project.pk])
+        incremental = _counts(project, ActivityGranularity.DAY)
+
+        ParticipationActivity.objects.all().delete()
+        rollup_participation_activity([project.pk])
+
+        assert _counts(project, ActivityGranularity.DAY) == incremental
+        assert incremental[("03 00", "FAVORABLE", False)] == 2
+
+    def test_ideas_are_rolled_up_without_choice(self, project):
+        user = User.objects.create_user(email="ideas@example.com", password="x")
+        IdeaResponse.objects.create(user=user, project=project, description="Benches")
+
+        rollup_participation_activity([project.pk])
+
+        row = ParticipationActivity.objects.get(
+            project=project, kind=ActivityKind.IDEA, granularity=ActivityGranularity.DAY
+        )
+        assert (row.choice, row.count) == ("", 1)
+
+
+class TestTimeline:
+    def test_daily_timeline_is_zero_filled(self, project):
+        _vote(project, _at(2, 9), is_local=True)
+        _vote(project, _at(4, 9), VoteChoice.UNFAVORABLE)
+        rollup_participation_activity([project.pk])
+
+        timeline = get_activity_timeline(
+            project, ActivityKind.VOTE, ActivityGranularity.DAY, local_only=False
+        )
+
+        assert timeline["labels"] == ["02/03/2026", "03/03/2026", "04/03/2026"]
+        assert timeline["series"] == {"FAVORABLE": [1, 0, 0], "UNFAVORABLE": [0, 0, 1]}
+
+    def test_hourly_timeline_keeps_the_repeated_dst_hour(self, project, settings):
+        settings.TIME_ZONE = "Europe/Paris"
+        # Clocks go back from 03:00 to 02:00 in Paris on 25 October 2026.
+        for hour in (0, 1, 2):
+            _vote(project, datetime(2026, 10, 25, hour, 30, tzinfo=dt_timezone.utc))
+        rollup_participation_activity([project.pk])
+
+        timeline = get_activity_timeline(
+            project, ActivityKind.VOTE, ActivityGranularity.HOUR, local_only=False
+        )
+
+        assert timeline["labels"] == ["25/10 02h", "25/10 02h", "25/10 03h"]
+        assert timeline["series"] == {"FAVORABLE": [1, 1, 1]}
+
+    def test_local_only_timeline(self, project):
+        _vote(project, _at(2, 9), is_local=True)
+        _vote(project, _at(2, 9))
+        rollup_participation_activity([project.pk])
+
+        timeline = get_activity_timeline(
+            project, ActivityKind.VOTE, ActivityGranularity.HOUR, local_only=True
+        )
+
+        assert timeline["series"] == {"FAVORABLE": [1]}
+
+    def test_detail_view_shows_hourly_timeline(self, client, project):
+        admin = User.objects.create_superuser(email="admin@example.com", password="x")
+        _vote(project, timezone.now() - timedelta(hours=2))
+        rollup_participation_activity([project.pk])
+
+        client.force_login(admin)
+        response = client.get(
+            f"/admin/vote-statistics/{project.pk}/", {"show_all": "1", "timeline": "hour"}
+        )
+
+        assert response.context["timeline_hourly"] is True
+        datasets = response.context["timeline_data"]["datasets"]
+        assert [sum(dataset["data"]) for dataset in datasets] == [1]
+        assert "activity-timeline-data" in response.content.decode()
@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.renditions import CARD_IMAGE_RENDITION
+from core.tests.utils.factories import ImageFactory
+from publications.models import (
+    EventPage,
+    ParticipationMode,
+    ProjectCategory,
+    ProjectPage,
+    PublicationIndexPage,
+    PublicationPage,
+)
+from publications.services import (
+    PublicationFilters,
+    get_filtered_publications,
+    resolve_publication_subtypes,
+)
+
+
+@pytest.fixture
+def publication_index(db):
+    from wagtail.models import Page
+
+    index = PublicationIndexPage.objects.first()
+    if not index:
+        index = PublicationIndexPage(title="Publications", slug="publications")
+        Page.objects.get(depth=1).add_child(instance=index)
+    return index
+
+
+def _add_publications(index, count: int, offset: int = 0, images: bool = False) -> None:
+    for number in range(offset, offset + count):
+        if number % 2:
+            page = EventPage(
+                title=f"Event {number}",
+                slug=f"event-{number}",
+                event_date=timezone.now() + timedelta(days=number + 1),
+            )
+        else:
+            page = ProjectPage(
+                title=f"Project {number}",
+                slug=f"project-{number}",
+                participation_mode=ParticipationMode.VOTING,
+                category=ProjectCategory.choices[0][0],
+            )
+        if images:
+            page.hero_image = ImageFactory.create()
+            page.hero_image.get_rendition(CARD_IMAGE_RENDITION)
+        index.add_child(instance=page)
+
+
+def _read_card_properties(publications) -> None:
+    for publication in publications:
+        publication.is_event
+        publication.is_project
+        publication.category
+        publication.get_category_display()
+        publication.event_date
+        publication.is_upcoming
+        publication.is_past
+        publication.is_ongoing
+        if publication.hero_image:
+            publication.hero_image.get_rendition(CARD_IMAGE_RENDITION)
+
+
+def _listing_queries(index) -> int:
+    with CaptureQueriesContext(connection) as queries:
+        page = get_filtered_publications(
+            PublicationPage.objects.live().descendant_of(index), PublicationFilters()
+        )
+        _read_card_properties(page)
+    return len(queries)
+
+
+def test_listing_query_count_does_not_depend_on_page_size(publication_index):
+    _add_publications(publication_index, 2)
+    _listing_queries(publication_index)  # warm the content type cache
+    small_page = _listing_queries(publication_index)
+
+    _add_publications(publication_index, 10, offset=2)
+
+    assert _listing_queries(publication_index) == small_page
+
+
+def test_listing_card_images_do_not_add_queries_per_card(publication_index):
+    _add_publications(publication_index, 2, images=True)
+    _listing_queries(publication_index)
+    small_page = _listing_queries(publication_index)
+
+    _add_publications(publication_index, 10, offset=2, images=True)
+
+    assert _listing_queries(publication_index) == small_page
+
+
+def test_resolution_loads_one_query_per_subtype(publication_index, django_assert_num_queries):
+    _add_publications(publication_index, 6)
+    publications = list(PublicationPage.objects.descendant_of(publication_index))
+
+    with django_assert_num_queries(2):
+        resolved = resolve_publication_subtypes(publications)
+
+    with django_assert_num_queries(0):
+        _read_card_properties(resolved)
+    assert sorted(page.is_event for page in resolved) == [False] * 3 + [True] * 3
+    assert all(page.category for page in resolved if page.is_project)
+
+
+def test_listing_dates_are_stored_on_save(publication_index):
+    starts = timezone.now() + timedelta(days=3)
+    event = EventPage(title="Stored event", slug="stored-event", event_date=starts)
+    publication_index.add_child(instance=event)
+
+    event.refresh_from_db()
+    assert event.sort_date == starts
+    assert event.visible_until.date() == starts.astimezone(timezone.get_current_timezone()).date()
+
+    event.end_date = starts + timedelta(days=2)
+    event.save(update_fields=["end_date"])
+    event.refresh_from_db()
+    assert event.visible_until == starts + timedelta(days=2)
+
+
+def test_saving_a_draft_leaves_the_live_listing_dates(publication_index):
+    starts = timezone.now() + timedelta(days=3)
+    event = EventPage(title="Draft event", slug="draft-event", event_date=starts)
+    publication_index.add_child(instance=event)
+    event.save_revision().publish()
+    event.refresh_from_db()
+    live_dates = (event.sort_date, event.visible_until)
+
+    event.event_date = starts - timedelta(days=40)
+    event.save_revision()
+
+    event.refresh_from_db()
+    assert event.event_date == starts
+    assert (event.sort_date, event.visible_until) == live_dates
+
+
+def test_listing_excludes_past_events_and_orders_by_sort_date(publication_index):
+    now = timezone.now()
+    for slug, event_date in [
+        ("past", now - timedelta(days=5)),
+        ("soon", now + timedelta(days=1)),
+        ("later", now + timedelta(days=10)),
+    ]:
+        publication_index.add_child(
+            instance=EventPage(title=slug, slug=slug, event_date=event_date)
+        )
+    queryset = PublicationPage.objects.live().descendant_of(publication_index)
+
+    upcoming = get_filtered_publications(queryset, PublicationFilters(publication_type="events"))
+    assert [page.slug for page in upcoming] == ["later", "soon"]
+
+    everything = get_filtered_publications(
+        queryset, PublicationFilters(publication_type="events", show_past_events=True)
+    )
+    assert [page.slug for page in everything] == ["later", "soon", "past"]
@@ -1,15 +1,20 @@
 from unittest.mock import MagicMock, patch
 
+from django.contrib.postgres.search import SearchQuery
 from django.test import TestCase
 
 from publications.services import (
+    SEARCH_CONFIG,
     PublicationFilters,
     filter_publications_by_category,
     filter_publications_by_type,
     paginate_publications,
     search_publications,
+    update_search_vectors,
 )
 
+SORT_DATE_ORDER = "-sort_date"
+
 
 class PublicationFiltersTest(TestCase):
     def test_default_values(self) -> None:
@@ -106,7 +111,7 @@ class FilterPublicationsByTypeTest(TestCase):
 
         mock_queryset.filter.assert_called_once_with(real_type=mock_ct)
         mock_filtered.filter.assert_called_once()
-        mock_filtered_upcoming.order_by.assert_called_once_with("-eventpage__event_date")
+        mock_filtered_upcoming.order_by.assert_called_once_with(SORT_DATE_ORDER)
         self.assertEqual(result, mock_ordered)
 
     @patch("django.contrib.contenttypes.models.ContentType.objects.get_for_model")
@@ -129,7 +134,7 @@ class FilterPublicationsByTypeTest(TestCase):
         mock_queryset.filter.assert_called_once_with(real_type=mock_ct)
         # No additional filter when showing past events
         mock_filtered.filter.assert_not_called()
-        mock_filtered.order_by.assert_called_once_with("-eventpage__event_date")
+        mock_filtered.order_by.assert_called_once_with(SORT_DATE_ORDER)
         self.assertEqual(result, mock_ordered)
 
     @patch("django.contrib.contenttypes.models.ContentType.objects.get_for_model")
@@ -138,24 +143,18 @@ class FilterPublicationsByTypeTest(TestCase):
         self, mock_now: MagicMock, mock_get_for_model: MagicMock
     ) -> None:
         mock_queryset = MagicMock()
-        mock_excluded = MagicMock()
-        mock_annotated = MagicMock()
+        mock_filtered = MagicMock()
         mock_ordered = MagicMock()
 
-        mock_queryset.exclude.return_value = mock_excluded
-        mock_excluded.annotate.return_value = mock_annotated
-        mock_annotated.order_by.return_value = mock_ordered
-
-        mock_ct = MagicMock()
-        mock_get_for_model.return_value = mock_ct
+        mock_queryset.filter.return_value = mock_filtered
+        mock_filtered.order_by.return_value = mock_ordered
 
         result = filter_publications_by_type(mock_queryset, "all")
 
-        # By default, past events are excluded
-        mock_queryset.exclude.assert_called_once()
-        # Sorted by unified sort_date (event_date for events, first_published_at for others)
-        mock_excluded.annotate.assert_called_once()
-        mock_annotated.order_by.assert_called_once_with("-sort_date")
+        # By default, past events are excluded through the stored visible_until
+        mock_queryset.filter.assert_called_once()
+        # Sorted by the stored sort_date (event_date for events, first_published_at otherwise)
+        mock_filtered.order_by.assert_called_once_with(SORT_DATE_ORDER)
         self.assertEqual(result, mock_ordered)
 
     @patch("django.contrib.contenttypes.models.ContentType.objects.get_for_model")
@@ -163,20 +162,14 @@ class FilterPublicationsByTypeTest(TestCase):
         self, mock_get_for_model: MagicMock
     ) -> None:
         mock_queryset = MagicMock()
-        mock_annotated = MagicMock()
         mock_ordered = MagicMock()
 
-        mock_queryset.annotate.return_value = mock_annotated
-        mock_annotated.order_by.return_value = mock_ordered
-
-        mock_ct = MagicMock()
-        mock_get_for_model.return_value = mock_ct
+        mock_queryset.order_by.return_value = mock_ordered
 
         result = filter_publications_by_type(mock_queryset, "all", show_past_events=True)
 
-        mock_queryset.exclude.assert_not_called()
-        mock_queryset.annotate.assert_called_once()
-        mock_annotated.order_by.assert_called_once_with("-sort_date")
+        mock_queryset.filter.assert_not_called()
+        mock_queryset.order_by.assert_called_once_with(SORT_DATE_ORDER)
         self.assertEqual(result, mock_ordered)
 
     @patch("django.contrib.contenttypes.models.ContentType.objects.get_for_model")
@@ -185,23 +178,17 @@ class FilterPublicationsByTypeTest(TestCase):
         self, mock_now: MagicMock, mock_get_for_model: MagicMock
     ) -> None:
         mock_queryset = MagicMock()
-        mock_excluded = MagicMock()
-        mock_annotated = MagicMock()
+        mock_filtered = MagicMock()
         mock_ordered = MagicMock()
 
-        mock_queryset.exclude.return_value = mock_excluded
-        mock_excluded.annotate.return_value = mock_annotated
-        mock_annotated.order_by.return_value = mock_ordered
-
-        mock_ct = MagicMock()
-        mock_get_for_model.return_value = mock_ct
+        mock_queryset.filter.return_value = mock_filtered
+        mock_filtered.order_by.return_value = mock_ordered
 
         result = filter_publications_by_type(mock_queryset, "unknown")
 
         # By default, past events are excluded even for unknown types
-        mock_queryset.exclude.assert_called_once()
-        mock_excluded.annotate.assert_called_once()
-        mock_annotated.order_by.assert_called_once_with("-sort_date")
+        mock_queryset.filter.assert_called_once()
+        mock_filtered.order_by.assert_called_once_with(SORT_DATE_ORDER)
         self.assertEqual(result, mock_ordered)
 
     @patch("django.contrib.contenttypes.models.ContentType.objects.get_for_model")
@@ -209,20 +196,14 @@ class FilterPublicationsByTypeTest(TestCase):
         self, mock_get_for_model: MagicMock
     ) -> None:
         mock_queryset = MagicMock()
-        mock_annotated = MagicMock()
         mock_ordered = MagicMock()
 
-        mock_queryset.annotate.return_value = mock_annotated
-        mock_annotated.order_by.return_value = mock_ordered
-
-        mock_ct = MagicMock()
-        mock_get_for_model.return_value = mock_ct
+        mock_queryset.order_by.return_value = mock_ordered
 
         result = filter_publications_by_type(mock_queryset, "unknown", show_past_events=True)
 
-        mock_queryset.exclude.assert_not_called()
-        mock_queryset.annotate.assert_called_once()
-        mock_annotated.order_by.assert_called_once_with("-sort_date")
+        mock_queryset.filter.assert_not_called()
+        mock_queryset.order_by.assert_called_once_with(SORT_DATE_ORDER)
         self.assertEqual(result, mock_ordered)
 
 
@@ -281,6 +262,24 @@ class SearchPublicationsTest(TestCase):
         mock_queryset.filter.assert_not_called()
         self.assertEqual(result, mock_queryset)
 
+    @patch("publications.services.connection")
+    def test_postgresql_search_uses_ranked_search_vector(self, mock_connection: MagicMock) -> None:
+        mock_connection.vendor = "postgresql"
+        mock_queryset = MagicMock()
+        mock_queryset.query.order_by = ("-sort_date",)
+        mock_filtered = mock_queryset.filter.return_value
+        mock_ranked = mock_filtered.annotate.return_value
+
+        result = search_publications(mock_queryset, "jardin partagé")
+
+        query = SearchQuery("jardin partagé", config=SEARCH_CONFIG, search_type="websearch")
+        mock_queryset.filter.assert_called_once_with(search_vector=query)
+        mock_ranked.order_by.assert_called_once_with("-search_rank", "-sort_date")
+        self.assertEqual(result, mock_ranked.order_by.return_value)
+
+    def test_search_vectors_are_not_stored_outside_postgresql(self) -> None:
+        self.assertEqual(update_search_vectors([MagicMock()]), 0)
+
 
 class PaginatePublicationsTest(TestCase):
     def test_paginate_returns_page_object(self) -> None:
@@ -1,9 +1,11 @@
 import json
+from unittest.mock import patch
 
 import pytest
 
 from core.models import User
 from publications.models import FormResponse, ParticipationMode, ProjectPage, VoteChoice
+from publications.services import VoteConflictError
 
 
 @pytest.fixture
@@ -278,6 +280,20 @@ class TestVoteAPI:
         assert data["results"] is not None
         assert data["results"]["total_votes"] == 1
 
+    def test_vote_conflict_asks_to_retry(self, client, user, project_with_voting):
+        """Test that a vote losing repeatedly to concurrent writes is answered with a 409."""
+        client.force_login(user)
+
+        with patch("publications.views.vote.record_vote", side_effect=VoteConflictError):
+            response = client.post(
+                f"/api/projects/{project_with_voting.pk}/vote/",
+                data=json.dumps({"choice": "FAVORABLE"}),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 409
+        assert response.json()["success"] is False
+
     def test_invalid_choice(self, client, user, project_with_voting):
         """Test submitting an invalid vote choice."""
         client.force_login(user)
@@ -0,0 +1,124 @@
+"""Concurrent vote writes must keep exactly one response per user and exact tallies.
+
+Exercises the native ``INSERT ... ON CONFLICT`` path, so it only runs when the
+suite is configured with PostgreSQL; SQLite fails concurrent writers outright
+instead of waiting for them.
+"""
+
+import threading
+from functools import partial
+
+import pytest
+from django.db import connection, connections
+
+from core.models import User
+from publications.models import (
+    FormResponse,
+    ParticipationMode,
+    ProjectPage,
+    PublicationIndexPage,
+    VoteChoice,
+    VoteTally,
+)
+from publications.services import record_vote
+
+# Threads use their own connections, so writes must really commit; the rollback
+# is serialized to restore the pages created by data migrations between tests.
+pytestmark = [
+    pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Needs concurrent writers (PostgreSQL)"
+    ),
+    pytest.mark.django_db(transaction=True, serialized_rollback=True),
+]
+
+CHOICES = [choice.value for choice in VoteChoice]
+
+
+@pytest.fixture
+def project():
+    from wagtail.models import Page
+
+    index_page = PublicationIndexPage.objects.first()
+    if not index_page:
+        index_page = PublicationIndexPage(title="Publications", slug="publications")
+        Page.objects.get(depth=1).add_child(instance=index_page)
+
+    project = ProjectPage(
+        title="Contested Project",
+        slug="contested-project",
+        participation_mode=ParticipationMode.VOTING,
+    )
+    index_page.add_child(instance=project)
+    return project
+
+
+def _make_user(index: int) -> User:
+    return User.objects.create_user(
+        email=f"concurrent{index}@example.com",
+        password="TestPass123",
+        first_name="Voter",
+        last_name=str(index),
+    )
+
+
+def _run_in_parallel(calls: list) -> list[BaseException]:
+    """Start every call at the same time in its own thread; return raised errors."""
+    barrier = threading.Barrier(len(calls))
+    errors: list[BaseException] = []
+
+    def run(call):
+        try:
+            barrier.wait()
+            call()
+        except BaseException as exc:  # noqa: BLE001 - reported by the test
+            errors.append(exc)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=run, args=(call,)) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def _tally_total(project) -> int:
+    return sum(VoteTally.objects.filter(project=project).values_list("count", flat=True))
+
+
+def test_parallel_votes_from_one_user_keep_a_single_response(project):
+    user = _make_user(0)
+    calls = [
+        partial(record_vote, user, project, CHOICES[index % len(CHOICES)]) for index in range(12)
+    ]
+
+    errors = _run_in_parallel(calls)
+
+    assert errors == []
+    response = FormResponse.objects.get(user=user, project=project)
+    assert _tally_total(project) == 1
+    assert VoteTally.objects.get(project=project, choice=response.choice).count == 1
+
+
+def test_parallel_votes_from_many_users_are_all_counted(project):
+    users = [_make_user(index) for index in range(20)]
+    calls = [
+        partial(
+            record_vote,
+            user,
+            project,
+            CHOICES[index % len(CHOICES)],
+            "Because" if index % 2 else "",
+        )
+        for index, user in enumerate(users)
+    ]
+
+    errors = _run_in_parallel(calls)
+
+    assert errors == []
+    assert FormResponse.objects.filter(project=project).count() == 20
+    assert _tally_total(project) == 20
+    assert (
+        sum(VoteTally.objects.filter(project=project).values_list("comment_count", flat=True)) == 10
+    )
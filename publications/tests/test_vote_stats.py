@@ -10,6 +10,7 @@ from publications.models import (
     VoteChoice,
 )
 from publications.models.form import FAVORABLE_VALUES, UNFAVORABLE_VALUES
+from publications.services import record_vote
 
 
 @pytest.fixture
@@ -60,12 +61,7 @@ def project_with_votes(db, regular_user):
     index_page.add_child(instance=project)
 
     # Add some votes
-    FormResponse.objects.create(
-        user=regular_user,
-        project=project,
-        choice=VoteChoice.FAVORABLE,
-        comment="Great project!",
-    )
+    record_vote(regular_user, project, VoteChoice.FAVORABLE, "Great project!")
 
     return project
 
@@ -210,6 +206,7 @@ class TestVoteStatsDetailView:
             choice=VoteChoice.FAVORABLE,
             comment="This is an anonymous comment",
             anonymize=True,
+            is_local=True,
         )
 
         # Access admin stats detail page
@@ -246,6 +243,7 @@ class TestVoteStatsDetailView:
             choice=VoteChoice.UNFAVORABLE,
             comment="This is a public comment",
             anonymize=False,
+            is_local=True,
         )
 
         # Access admin stats detail page
@@ -279,6 +277,7 @@ class TestVoteStatsDetailView:
             choice=VoteChoice.FAVORABLE,
             comment="This vote is from a user who will be deleted",
             anonymize=False,
+            is_local=True,
         )
 
         # Soft delete the user
@@ -349,6 +348,7 @@ def project_with_mixed_votes(db):
             user=user,
             project=project,
             choice=choice,
+            is_local=True,
         )
 
     return project
@@ -422,6 +422,7 @@ class TestVoteStatsDetailViewAggregates:
                 user=user,
                 project=project,
                 choice=choice,
+                is_local=True,
             )
 
         client.force_login(admin_user)
@@ -476,7 +477,7 @@ class TestVoteStatsDetailViewAggregates:
                 last_name="Tester",
                 postal_code="13007",
             )
-            FormResponse.objects.create(user=user, project=project, choice=choice)
+            FormResponse.objects.create(user=user, project=project, choice=choice, is_local=True)
 
         client.force_login(admin_user)
         response = client.get(f"/admin/vote-statistics/{project.pk}/")
@@ -519,7 +520,7 @@ class TestVoteStatsDetailViewAggregates:
                 last_name="Tester",
                 postal_code="13007",
             )
-            FormResponse.objects.create(user=user, project=project, choice=choice)
+            FormResponse.objects.create(user=user, project=project, choice=choice, is_local=True)
 
         client.force_login(admin_user)
         response = client.get(f"/admin/vote-statistics/{project.pk}/")
@@ -578,12 +579,7 @@ def project_with_local_and_outside_votes(db):
         last_name="Voter",
         postal_code="13007",
     )
-    FormResponse.objects.create(
-        user=local_user,
-        project=project,
-        choice=VoteChoice.FAVORABLE,
-        comment="Local comment",
-    )
+    record_vote(local_user, project, VoteChoice.FAVORABLE, "Local comment")
 
     # Outside user (different postal code)
     outside_user = User.objects.create_user(
@@ -593,12 +589,7 @@ def project_with_local_and_outside_votes(db):
         last_name="Voter",
         postal_code="75001",
     )
-    FormResponse.objects.create(
-        user=outside_user,
-        project=project,
-        choice=VoteChoice.UNFAVORABLE,
-        comment="Outside comment",
-    )
+    record_vote(outside_user, project, VoteChoice.UNFAVORABLE, "Outside comment")
 
     return project
 
@@ -709,3 +700,118 @@ class TestVoteStatsLocalFilter:
             f"/admin/vote-statistics/{project_with_local_and_outside_votes.pk}/?show_all=1"
         )
         assert response.context["show_all"] is True
+
+
+@pytest.mark.django_db
+class TestVoteCommentsExport:
+    """Tests for the streaming export of vote comments."""
+
+    def test_export_streams_local_comments_as_csv(
+        self, client, admin_user, project_with_local_and_outside_votes
+    ):
+        client.force_login(admin_user)
+        response = client.get(
+            f"/admin/vote-statistics/{project_with_local_and_outside_votes.pk}/export/"
+        )
+
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/csv")
+        assert "attachment" in response["Content-Disposition"]
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0] == "created_at,choice,comment,author"
+        assert len(lines) == 2
+        assert "Local comment" in lines[1]
+        assert "local_voter@example.com" in lines[1]
+
+    def test_export_ndjson_with_show_all(
+        self, client, admin_user, project_with_local_and_outside_votes
+    ):
+        import json
+
+        client.force_login(admin_user)
+        response = client.get(
+            f"/admin/vote-statistics/{project_with_local_and_outside_votes.pk}/export/"
+            "?format=ndjson&show_all=1"
+        )
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert {row["comment"] for row in rows} == {"Local comment", "Outside comment"}
+
+    def test_export_hides_anonymous_and_deleted_authors(
+        self, client, admin_user, project_without_votes
+    ):
+        anonymous = User.objects.create_user(
+            email="anon_export@example.com", password="TestPass123", postal_code="13007"
+        )
+        deleted = User.objects.create_user(
+            email="deleted_export@example.com", password="TestPass123", postal_code="13007"
+        )
+        record_vote(anonymous, project_without_votes, VoteChoice.FAVORABLE, "Hidden", True)
+        record_vote(deleted, project_without_votes, VoteChoice.UNFAVORABLE, "Gone")
+        deleted.soft_delete()
+
+        client.force_login(admin_user)
+        response = client.get(f"/admin/vote-statistics/{project_without_votes.pk}/export/")
+        content = b"".join(response.streaming_content).decode()
+
+        assert "anon_export@example.com" not in content
+        assert "@deleted.local" not in content
+        assert "Anonymous" in content or "Anonyme" in content
+        assert "Hidden" in content
+        assert "Gone" in content
+
+
+@pytest.mark.django_db
+class TestVoteCommentsPagination:
+    """Tests for the keyset pagination of comments in the detail view."""
+
+    @pytest.fixture
+    def project_with_many_comments(self, project_without_votes):
+        for index in range(5):
+            user = User.objects.create_user(
+                email=f"paged{index}@example.com", password="TestPass123", postal_code="13007"
+            )
+            choice = VoteChoice.FAVORABLE if index % 2 else VoteChoice.UNFAVORABLE
+            record_vote(user, project_without_votes, choice, f"Comment {index}")
+        return project_without_votes
+
+    def test_pages_follow_the_cursor(
+        self, client, admin_user, project_with_many_comments, monkeypatch
+    ):
+        from publications.views.vote_stats import VoteStatsDetailView
+
+        monkeypatch.setattr(VoteStatsDetailView, "page_size", 2)
+        client.force_login(admin_user)
+        url = f"/admin/vote-statistics/{project_with_many_comments.pk}/"
+
+        seen = []
+        cursor = None
+        for _page in range(3):
+            response = client.get(url, {"cursor": cursor} if cursor else {})
+            seen += [vote.comment for vote in response.context["votes_with_comments"]]
+            cursor = response.context["comments_page"].next_cursor
+        assert cursor is None
+        assert response.context["comments_total"] == 5
+        assert seen == [f"Comment {index}" for index in reversed(range(5))]
+
+    def test_choice_filter(self, client, admin_user, project_with_many_comments):
+        client.force_login(admin_user)
+        response = client.get(
+            f"/admin/vote-statistics/{project_with_many_comments.pk}/", {"choice": "FAVORABLE"}
+        )
+
+        comments = {vote.comment for vote in response.context["votes_with_comments"]}
+        assert comments == {"Comment 1", "Comment 3"}
+        assert response.context["comments_total"] == 2
+
+    def test_invalid_cursor_falls_back_to_first_page(
+        self, client, admin_user, project_with_many_comments
+    ):
+        client.force_login(admin_user)
+        response = client.get(
+            f"/admin/vote-statistics/{project_with_many_comments.pk}/", {"cursor": "garbage"}
+        )
+
+        assert response.status_code == 200
+        assert response.context["comments_page"].is_first
@@ -0,0 +1,356 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from core.models import User
+from publications.models import (
+    FormResponse,
+    ParticipationMode,
+    ProjectPage,
+    PublicationIndexPage,
+    VoteChoice,
+    VoteStatistics,
+    VoteTally,
+)
+from publications.services import (
+    get_cached_vote_results,
+    get_vote_results,
+    rebuild_vote_tallies,
+)
+
+
+@pytest.fixture
+def project(db):
+    from wagtail.models import Page
+
+    index_page = PublicationIndexPage.objects.first()
+    if not index_page:
+        index_page = PublicationIndexPage(title="Publications", slug="publications")
+        Page.objects.get(depth=1).add_child(instance=index_page)
+
+    project = ProjectPage(
+        title="Tallied Project",
+        slug="tallied-project",
+        participation_mode=ParticipationMode.VOTING,
+    )
+    index_page.add_child(instance=project)
+    return project
+
+
+def _make_user(index: int) -> User:
+    return User.objects.create_user(
+        email=f"voter{index}@example.com",
+        password="TestPass123",
+        first_name="Voter",
+        last_name=str(index),
+    )
+
+
+def _vote(client, user, project, choice, comment=""):
+    client.force_login(user)
+    return client.post(
+        f"/api/projects/{project.pk}/vote/",
+        data=json.dumps({"choice": choice, "comment": comment}),
+        content_type="application/json",
+    )
+
+
+def _tally(project) -> dict[str, tuple[int, int]]:
+    return {
+        tally.choice: (tally.count, tally.comment_count)
+        for tally in VoteTally.objects.filter(project=project)
+    }
+
+
+class TestVoteTally:
+    def test_vote_increments_tally(self, client, project):
+        _vote(client, _make_user(1), project, "FAVORABLE", "Yes!")
+        _vote(client, _make_user(2), project, "FAVORABLE")
+
+        assert _tally(project)["FAVORABLE"] == (2, 1)
+
+    def test_changing_vote_moves_it_between_choices(self, client, project):
+        user = _make_user(1)
+        _vote(client, user, project, "FAVORABLE", "Yes!")
+        _vote(client, user, project, "UNFAVORABLE")
+
+        tally = _tally(project)
+        assert tally["FAVORABLE"] == (0, 0)
+        assert tally["UNFAVORABLE"] == (1, 0)
+
+    def test_removing_vote_decrements_tally(self, client, project):
+        user = _make_user(1)
+        _vote(client, user, project, "RATHER_FAVORABLE", "Hmm")
+        client.delete(f"/api/projects/{project.pk}/vote/")
+
+        assert _tally(project)["RATHER_FAVORABLE"] == (0, 0)
+
+    def test_results_read_from_tally(self, client, project):
+        _vote(client, _make_user(1), project, "FAVORABLE")
+        _vote(client, _make_user(2), project, "UNFAVORABLE")
+
+        results = get_vote_results(project)
+
+        assert results["total_votes"] == 2
+        assert results["choices"]["FAVORABLE"]["count"] == 1
+        assert results["choices"]["FAVORABLE"]["percentage"] == 50.0
+
+    def test_results_query_count_does_not_grow_with_votes(self, django_assert_num_queries, project):
+        for index in range(10):
+            FormResponse.objects.create(
+                user=_make_user(index), project=project, choice=VoteChoice.FAVORABLE
+            )
+        rebuild_vote_tallies()
+
+        with django_assert_num_queries(1):
+            results = get_vote_results(project)
+
+        assert results["total_votes"] == 10
+
+    def test_rebuild_command_matches_responses(self, project):
+        FormResponse.objects.create(
+            user=_make_user(1), project=project, choice=VoteChoice.FAVORABLE, comment="Yes"
+        )
+        FormResponse.objects.create(
+            user=_make_user(2), project=project, choice=VoteChoice.FAVORABLE
+        )
+        VoteTally.objects.create(project=project, choice=VoteChoice.UNFAVORABLE, count=42)
+
+        call_command("rebuild_vote_tallies")
+
+        assert _tally(project) == {choice: (0, 0) for choice in VoteChoice.values} | {
+            "FAVORABLE": (2, 1)
+        }
+
+
+_LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "content": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "c"},
+}
+
+
+@pytest.fixture
+def locmem_caches(settings):
+    from django.core.cache import caches
+
+    settings.CACHES = _LOCMEM_CACHES
+    caches["default"].clear()
+    yield
+    caches["default"].clear()
+
+
+class TestCachedVoteResults:
+    def test_results_are_served_from_cache(self, locmem_caches, django_assert_num_queries, project):
+        get_cached_vote_results(project)
+
+        with django_assert_num_queries(0):
+            results = get_cached_vote_results(project)
+
+        assert results["total_votes"] == 0
+
+    def test_vote_writes_fresh_results_through(
+        self, client, locmem_caches, django_capture_on_commit_callbacks, project
+    ):
+        assert get_cached_vote_results(project)["total_votes"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _vote(client, _make_user(1), project, "FAVORABLE")
+
+        assert get_cached_vote_results(project)["total_votes"] == 1
+
+    def test_vote_removal_bumps_version(
+        self, client, locmem_caches, django_capture_on_commit_callbacks, project
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            _vote(client, _make_user(1), project, "FAVORABLE")
+        assert get_cached_vote_results(project)["total_votes"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.delete(f"/api/projects/{project.pk}/vote/")
+
+        assert get_cached_vote_results(project)["total_votes"] == 0
+
+    def test_reconcile_task_fixes_drift_and_cached_results(
+        self, locmem_caches, django_capture_on_commit_callbacks, project
+    ):
+        from publications.tasks import reconcile_vote_tallies
+
+        FormResponse.objects.create(
+            user=_make_user(1), project=project, choice=VoteChoice.FAVORABLE
+        )
+        assert get_cached_vote_results(project)["total_votes"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert reconcile_vote_tallies.delay().get() >= 1
+
+        assert _tally(project)["FAVORABLE"] == (1, 0)
+        assert get_cached_vote_results(project)["total_votes"] == 1
+
+    def test_results_are_cached_per_language(
+        self, locmem_caches, django_assert_num_queries, project
+    ):
+        # The choice labels are translated, so each language has its own entry.
+        with translation.override("en"):
+            get_cached_vote_results(project)
+        with translation.override("fr"):
+            with CaptureQueriesContext(connection) as queries:
+                get_cached_vote_results(project)
+        assert len(queries) > 0
+
+        with translation.override("en"), django_assert_num_queries(0):
+            get_cached_vote_results(project)
+
+    def test_content_cache_flush_keeps_results(
+        self, locmem_caches, django_assert_num_queries, project
+    ):
+        from core.cache import clear_content_cache
+
+        get_cached_vote_results(project)
+        clear_content_cache()
+
+        with django_assert_num_queries(0):
+            get_cached_vote_results(project)
+
+
+def _statistics(project) -> tuple[int, ...]:
+    statistics = VoteStatistics.objects.get(project=project)
+    return statistics.for_scope(local_only=False) + statistics.for_scope(local_only=True)
+
+
+class TestVoteStatistics:
+    def test_votes_update_statistics(self, client, project):
+        local_user = _make_user(1)
+        local_user.postal_code = "13007"
+        local_user.save()
+        _vote(client, local_user, project, "FAVORABLE", "Yes!")
+        _vote(client, _make_user(2), project, "UNFAVORABLE")
+
+        assert _statistics(project) == (2, 1, 1, 1, 1, 1)
+
+    def test_changing_and_removing_vote_updates_statistics(self, client, project):
+        user = _make_user(1)
+        _vote(client, user, project, "FAVORABLE", "Yes!")
+        _vote(client, user, project, "UNFAVORABLE")
+        assert _statistics(project) == (1, 0, 0, 0, 0, 0)
+
+        client.delete(f"/api/projects/{project.pk}/vote/")
+        assert _statistics(project) == (0, 0, 0, 0, 0, 0)
+
+    def test_reconcile_task_fixes_drift(self, project):
+        from publications.tasks import reconcile_vote_statistics
+
+        FormResponse.objects.create(
+            user=_make_user(1), project=project, choice=VoteChoice.RATHER_FAVORABLE, comment="Ok"
+        )
+        VoteStatistics.objects.create(project=project, total_votes=7)
+
+        assert reconcile_vote_statistics.delay().get() >= 1
+        assert _statistics(project) == (1, 1, 1, 0, 0, 0)
+
+    def test_dashboard_query_count_does_not_grow_with_votes(self, client, project):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        admin = User.objects.create_superuser(email="admin@example.com", password="TestPass123")
+
+        def dashboard_queries() -> int:
+            client.force_login(admin)
+            with CaptureQueriesContext(connection) as queries:
+                client.get("/admin/vote-statistics/?show_all=1")
+            return len(queries)
+
+        _vote(client, _make_user(0), project, "FAVORABLE")
+        dashboard_queries()  # warm up per-process admin lookups
+        baseline = dashboard_queries()
+        for index in range(1, 10):
+            _vote(client, _make_user(index), project, "FAVORABLE")
+
+        assert dashboard_queries() == baseline
+
+
+class TestResponseLocality:
+    def test_vote_records_locality(self, client, project):
+        user = _make_user(1)
+        user.postal_code = "13007"
+        user.save()
+        _vote(client, user, project, "FAVORABLE")
+
+        assert FormResponse.objects.get(user=user).is_local is True
+
+    def test_postal_code_change_moves_votes_between_scopes(self, client, project):
+        user = _make_user(1)
+        _vote(client, user, project, "FAVORABLE", "Yes!")
+        assert _statistics(project) == (1, 1, 1, 0, 0, 0)
+
+        user.postal_code = "13007"
+        user.save()
+
+        assert FormResponse.objects.get(user=user).is_local is True
+        assert _statistics(project) == (1, 1, 1, 1, 1, 1)
+
+        user.postal_code = "75001"
+        user.save(update_fields=["postal_code"])
+
+        assert _statistics(project) == (1, 1, 1, 0, 0, 0)
+
+    def test_backfill_command_sets_flags(self, project):
+        local_user = _make_user(1)
+        local_user.postal_code = "13007"
+        local_user.save()
+        FormResponse.objects.create(user=local_user, project=project, choice=VoteChoice.FAVORABLE)
+        FormResponse.objects.create(
+            user=_make_user(2), project=project, choice=VoteChoice.FAVORABLE, is_local=True
+        )
+
+        call_command("backfill_response_locality", batch_size=1)
+
+        assert dict(FormResponse.objects.values_list("user__email", "is_local")) == {
+            "voter1@example.com": True,
+            "voter2@example.com": False,
+        }
+        assert _statistics(project) == (2, 0, 2, 1, 0, 1)
+
+
+class TestVoteResultsETag:
+    def _results(self, client, project, etag=None):
+        headers = {"if-none-match": etag} if etag else {}
+        return client.get(f"/api/projects/{project.pk}/vote/results/", headers=headers)
+
+    def test_unchanged_results_are_not_modified(
+        self, client, locmem_caches, django_assert_max_num_queries, project
+    ):
+        _vote(client, _make_user(1), project, "FAVORABLE")
+        etag = self._results(client, project)["ETag"]
+
+        with django_assert_max_num_queries(4):
+            response = self._results(client, project, etag)
+
+        assert response.status_code == 304
+        assert not response.content
+
+    def test_another_vote_changes_the_etag(
+        self, client, locmem_caches, django_capture_on_commit_callbacks, project
+    ):
+        voter = _make_user(1)
+        _vote(client, voter, project, "FAVORABLE")
+        etag = self._results(client, project)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _vote(client, _make_user(2), project, "UNFAVORABLE")
+        client.force_login(voter)
+        response = self._results(client, project, etag)
+
+        assert response.status_code == 200
+        assert response.json()["results"]["total_votes"] == 2
+        assert response["ETag"] != etag
+
+    def test_etag_is_per_user(self, client, locmem_caches, project):
+        _vote(client, _make_user(1), project, "FAVORABLE")
+        etag = self._results(client, project)["ETag"]
+
+        client.logout()
+        assert self._results(client, project, etag).status_code == 200
@@ -0,0 +1,54 @@
+from datetime import timedelta
+from typing import Any
+
+from django.http import HttpRequest
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from publications.models import ActivityGranularity, ActivityKind, ProjectPage, VoteChoice
+from publications.services import get_activity_timeline
+
+# The hourly timeline only covers recent activity; the daily one covers it all.
+HOURLY_TIMELINE_SPAN = timedelta(days=7)
+
+TIMELINE_COLORS = {
+    VoteChoice.FAVORABLE: "#22c55e",
+    VoteChoice.RATHER_FAVORABLE: "#3b82f6",
+    VoteChoice.RATHER_UNFAVORABLE: "#eab308",
+    VoteChoice.UNFAVORABLE: "#ef4444",
+    "": "#6366f1",
+}
+
+
+def activity_timeline_context(
+    request: HttpRequest, project: ProjectPage, kind: ActivityKind, show_all: bool
+) -> dict[str, Any]:
+    """Template context for the participation timeline of a detail view.
+
+    ``?timeline=hour`` switches from daily buckets to the hourly ones of the
+    last ``HOURLY_TIMELINE_SPAN``.
+    """
+    hourly = request.GET.get("timeline") == "hour"
+    timeline = get_activity_timeline(
+        project,
+        kind,
+        ActivityGranularity.HOUR if hourly else ActivityGranularity.DAY,
+        local_only=not show_all,
+        since=timezone.now() - HOURLY_TIMELINE_SPAN if hourly else None,
+    )
+
+    choice_labels = dict(VoteChoice.choices)
+    datasets = [
+        {
+            "label": str(choice_labels.get(choice, _("Ideas"))),
+            "data": timeline["series"][choice],
+            "backgroundColor": TIMELINE_COLORS.get(choice, TIMELINE_COLORS[""]),
+        }
+        for choice in [*VoteChoice.values, ""]
+        if choice in timeline["series"]
+    ]
+
+    return {
+        "timeline_hourly": hourly,
+        "timeline_data": {"labels": timeline["labels"], "datasets": datasets},
+    }
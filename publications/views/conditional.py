@@ -0,0 +1,31 @@
+import hashlib
+from typing import Any, Optional
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a quoted ETag from the values a response is derived from.
+
+    The active language is always mixed in, since the JSON carries translated
+    labels.
+    """
+    digest = hashlib.md5(  # nosec B324 - not used for security
+        repr((get_language(), *parts)).encode(), usedforsecurity=False
+    ).hexdigest()
+    return quote_etag(digest)
+
+
+def not_modified(request: HttpRequest, etag: str) -> Optional[HttpResponse]:
+    """Return a ``304 Not Modified`` response if ``If-None-Match`` matches ``etag``."""
+    return get_conditional_response(request, etag=etag)
+
+
+def with_etag(response: HttpResponseBase, etag: str) -> HttpResponseBase:
+    """Tag ``response`` and make browsers revalidate it on every poll."""
+    response.headers["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -8,6 +8,8 @@ from django.views import View
 from core.models import User
 from publications.models.idea import IdeaResponse
 from publications.models.project import ProjectPage
+from publications.services import record_idea, remove_idea
+from publications.views.conditional import make_etag, not_modified, with_etag
 
 
 class IdeaView(View):
@@ -51,14 +53,8 @@ class IdeaView(View):
                 status=400,
             )
 
-        response, created = IdeaResponse.objects.update_or_create(
-            user=request.user,
-            project=project,
-            defaults={
-                "description": description,
-                "anonymize": anonymize,
-            },
-        )
+        user: User = request.user  # type: ignore[assignment]
+        response, created = record_idea(user, project, description, anonymize)
 
         return JsonResponse(
             {
@@ -89,12 +85,7 @@ class IdeaView(View):
             )
 
         user: User = request.user  # type: ignore[assignment]
-        deleted_count, _deleted_types = IdeaResponse.objects.filter(
-            user=user,
-            project=project,
-        ).delete()
-
-        if deleted_count == 0:
+        if not remove_idea(user, project):
             return JsonResponse(
                 {"success": False, "error": _("No idea found to remove")},
                 status=404,
@@ -111,7 +102,7 @@ class IdeaView(View):
 class IdeaMineView(View):
     """Return the requesting user's own idea (ideas are private to user + admins)."""
 
-    def get(self, request: HttpRequest, project_id: int) -> JsonResponse:
+    def get(self, request: HttpRequest, project_id: int) -> HttpResponseBase:
         try:
             project = ProjectPage.objects.get(pk=project_id)
         except ProjectPage.DoesNotExist:
@@ -128,6 +119,7 @@ class IdeaMineView(View):
 
         user_idea = None
         has_submitted = False
+        response = None
 
         if request.user.is_authenticated:
             try:
@@ -140,12 +132,25 @@ class IdeaMineView(View):
             except IdeaResponse.DoesNotExist:
                 pass
 
-        return JsonResponse(
-            {
-                "success": True,
-                "is_authenticated": request.user.is_authenticated,
-                "has_submitted": has_submitted,
-                "is_open": project.is_ideas_open,
-                "user_idea": user_idea,
-            }
+        etag = make_etag(
+            project.pk,
+            project.last_published_at,
+            project.is_ideas_open,
+            request.user.pk,
+            response.updated_at if response else None,
+        )
+        if (not_modified_response := not_modified(request, etag)) is not None:
+            return not_modified_response
+
+        return with_etag(
+            JsonResponse(
+                {
+                    "success": True,
+                    "is_authenticated": request.user.is_authenticated,
+                    "has_submitted": has_submitted,
+                    "is_open": project.is_ideas_open,
+                    "user_idea": user_idea,
+                }
+            ),
+            etag,
         )
@@ -1,14 +1,24 @@
 from typing import Any
 
 from django.conf import settings
-from django.db.models import Count, Q, QuerySet
+from django.db.models import QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
+from django.views import View
 from django.views.generic import TemplateView
 from wagtail.admin.views.generic.base import WagtailAdminTemplateMixin
 
-from publications.models import ParticipationMode, ProjectPage
+from publications.models import ActivityKind, ParticipationMode, ProjectPage
 from publications.models.idea import IdeaResponse
+from publications.views.activity import activity_timeline_context
+from publications.views.export import (
+    EXPORT_CHUNK_SIZE,
+    author_label,
+    get_export_format,
+    streaming_export_response,
+)
+from publications.views.pagination import KEYSET_PAGE_SIZE, keyset_paginate
 
 LOCAL_POSTAL_CODE: str = getattr(settings, "LOCAL_POSTAL_CODE", "13007")
 
@@ -17,19 +27,20 @@ def _is_show_all(request: Any) -> bool:
     return request.GET.get("show_all") == "1"
 
 
-def _local_ideas_filter() -> Q:
-    """Return a Q filter for ideas from local users (matching LOCAL_POSTAL_CODE)."""
-    return Q(idea_responses__user__postal_code=LOCAL_POSTAL_CODE)
-
-
 def _local_responses_qs(show_all: bool) -> QuerySet:
     """Return an IdeaResponse queryset filtered by locality unless show_all is True."""
     qs = IdeaResponse.objects.all()
     if not show_all:
-        qs = qs.filter(user__postal_code=LOCAL_POSTAL_CODE)
+        qs = qs.filter(is_local=True)
     return qs
 
 
+def _total_ideas(project: ProjectPage, show_all: bool) -> int:
+    """Read the project's idea count from its maintained ``IdeaStatistics`` row."""
+    statistics = getattr(project, "idea_statistics", None)
+    return statistics.for_scope(local_only=not show_all) if statistics else 0
+
+
 class IdeaStatsView(WagtailAdminTemplateMixin, TemplateView):
     template_name = "publications/admin/ideas_stats.html"
     page_title = _("Idea Collection")
@@ -38,19 +49,18 @@ class IdeaStatsView(WagtailAdminTemplateMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         show_all = _is_show_all(self.request)
-        local_filter = Q() if show_all else _local_ideas_filter()
 
         projects = (
             ProjectPage.objects.live()
             .filter(participation_mode=ParticipationMode.IDEAS)
-            .annotate(total_ideas=Count("idea_responses", filter=local_filter))
+            .select_related("idea_statistics")
             .order_by("-first_published_at")
         )
 
         projects_stats = [
             {
                 "project": project,
-                "total_ideas": project.total_ideas,
+                "total_ideas": _total_ideas(project, show_all),
             }
             for project in projects
         ]
@@ -69,29 +79,60 @@ class IdeaStatsView(WagtailAdminTemplateMixin, TemplateView):
 class IdeaStatsDetailView(WagtailAdminTemplateMixin, TemplateView):
     template_name = "publications/admin/ideas_stats_detail.html"
     page_title = _("Idea Collection")
+    page_size = KEYSET_PAGE_SIZE
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
         show_all = _is_show_all(self.request)
         project_id = self.kwargs.get("project_id")
-        project = get_object_or_404(ProjectPage, id=project_id)
+        project = get_object_or_404(
+            ProjectPage.objects.select_related("idea_statistics"), id=project_id
+        )
 
-        ideas = (
-            _local_responses_qs(show_all)
-            .filter(project=project)
-            .select_related("user")
-            .order_by("-created_at")
+        ideas = _local_responses_qs(show_all).filter(project=project)
+        ideas_page = keyset_paginate(
+            ideas.select_related("user"), self.request.GET.get("cursor"), self.page_size
         )
 
         context.update(
             {
                 "project": project,
-                "ideas": ideas,
-                "total_ideas": ideas.count(),
+                "ideas": ideas_page.items,
+                "ideas_page": ideas_page,
+                "total_ideas": _total_ideas(project, show_all),
                 "show_all": show_all,
                 "local_postal_code": LOCAL_POSTAL_CODE,
+                **activity_timeline_context(self.request, project, ActivityKind.IDEA, show_all),
             }
         )
 
         return context
+
+
+class IdeasExportView(View):
+    """Stream a project's ideas as CSV or NDJSON (``?format=ndjson``)."""
+
+    columns = ("created_at", "description", "author")
+
+    def get(self, request: HttpRequest, project_id: int) -> StreamingHttpResponse:
+        project = get_object_or_404(ProjectPage, id=project_id)
+
+        ideas = (
+            _local_responses_qs(_is_show_all(request))
+            .filter(project=project)
+            .order_by("-created_at")
+            .values_list(
+                "created_at", "description", "anonymize", "user__email", "user__deleted_at"
+            )
+        )
+        rows = (
+            (created_at.isoformat(), description, author_label(anonymize, email, deleted_at))
+            for created_at, description, anonymize, email, deleted_at in ideas.iterator(
+                chunk_size=EXPORT_CHUNK_SIZE
+            )
+        )
+
+        return streaming_export_response(
+            self.columns, rows, get_export_format(request), f"{project.slug}-ideas"
+        )
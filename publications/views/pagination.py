@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from django.db.models import Q, QuerySet
+
+KEYSET_PAGE_SIZE = 50
+
+
+@dataclass
+class KeysetPage:
+    """One page of a keyset-paginated listing, newest first.
+
+    ``next_cursor`` points past the last item of the page and is ``None`` on the
+    last page. Unlike offset pagination, fetching a page costs the same however
+    deep it is, provided the ordering columns are indexed.
+    """
+
+    items: list[Any]
+    next_cursor: Optional[str]
+    is_first: bool
+
+
+def _encode_cursor(created_at: datetime, pk: int) -> str:
+    return f"{created_at.isoformat()}_{pk}"
+
+
+def _decode_cursor(cursor: str) -> Optional[tuple[datetime, int]]:
+    created_at, _separator, pk = cursor.rpartition("_")
+    try:
+        return datetime.fromisoformat(created_at), int(pk)
+    except ValueError:
+        return None
+
+
+def keyset_paginate(
+    queryset: QuerySet, cursor: Optional[str], page_size: int = KEYSET_PAGE_SIZE
+) -> KeysetPage:
+    """Return the page of ``queryset`` after ``cursor``, ordered by ``(-created_at, -id)``.
+
+    An unparseable cursor is treated as no cursor, so a mangled URL falls back
+    to the first page.
+    """
+    position = _decode_cursor(cursor) if cursor else None
+    if position is not None:
+        created_at, pk = position
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+        )
+
+    items = list(queryset.order_by("-created_at", "-pk")[: page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = _encode_cursor(items[-1].created_at, items[-1].pk)
+
+    return KeysetPage(items=items, next_cursor=next_cursor, is_first=position is None)
@@ -8,7 +8,14 @@ from django.views import View
 from core.models import User
 from publications.models.form import FormResponse, VoteChoice
 from publications.models.project import ProjectPage
-from publications.services import get_vote_results
+from publications.services import (
+    VoteConflictError,
+    get_cached_vote_results,
+    get_vote_results_version,
+    record_vote,
+    remove_vote,
+)
+from publications.views.conditional import make_etag, not_modified, with_etag
 
 
 class VoteView(View):
@@ -59,17 +66,25 @@ class VoteView(View):
                 status=400,
             )
 
-        response, created = FormResponse.objects.update_or_create(
-            user=request.user,
-            project=project,
-            defaults={
-                "choice": choice,
-                "comment": comment,
-                "anonymize": anonymize,
-            },
-        )
+        user: User = request.user  # type: ignore[assignment]
+        try:
+            response, created = record_vote(
+                user,
+                project,
+                choice=choice,
+                comment=comment,
+                anonymize=anonymize,
+            )
+        except VoteConflictError:
+            return JsonResponse(
+                {
+                    "success": False,
+                    "error": _("Your vote could not be saved right now, please try again"),
+                },
+                status=409,
+            )
 
-        results = get_vote_results(project)
+        results = get_cached_vote_results(project)
 
         return JsonResponse(
             {
@@ -108,12 +123,7 @@ class VoteView(View):
             )
 
         user: User = request.user  # type: ignore[assignment]
-        deleted_count, _deleted_types = FormResponse.objects.filter(
-            user=user,
-            project=project,
-        ).delete()
-
-        if deleted_count == 0:
+        if not remove_vote(user, project):
             return JsonResponse(
                 {"success": False, "error": _("No vote found to remove")},
                 status=404,
@@ -128,7 +138,7 @@ class VoteView(View):
 
 
 class VoteResultsView(View):
-    def get(self, request: HttpRequest, project_id: int) -> JsonResponse:
+    def get(self, request: HttpRequest, project_id: int) -> HttpResponseBase:
         try:
             project = ProjectPage.objects.get(pk=project_id)
         except ProjectPage.DoesNotExist:
@@ -145,6 +155,7 @@ class VoteResultsView(View):
 
         user_vote = None
         has_voted = False
+        response = None
 
         if request.user.is_authenticated:
             try:
@@ -161,18 +172,33 @@ class VoteResultsView(View):
             except FormResponse.DoesNotExist:
                 pass
 
+        # Everything the payload depends on, read without aggregating the votes.
+        etag = make_etag(
+            project.pk,
+            project.last_published_at,
+            project.is_voting_open,
+            request.user.pk,
+            response.updated_at if response else None,
+            get_vote_results_version(project) if has_voted else None,
+        )
+        if (not_modified_response := not_modified(request, etag)) is not None:
+            return not_modified_response
+
         results = None
         if has_voted:
-            results = get_vote_results(project)
-
-        return JsonResponse(
-            {
-                "success": True,
-                "is_authenticated": request.user.is_authenticated,
-                "has_voted": has_voted,
-                "is_open": project.is_voting_open,
-                "question": project.vote_question,
-                "user_vote": user_vote,
-                "results": results,
-            }
+            results = get_cached_vote_results(project)
+
+        return with_etag(
+            JsonResponse(
+                {
+                    "success": True,
+                    "is_authenticated": request.user.is_authenticated,
+                    "has_voted": has_voted,
+                    "is_open": project.is_voting_open,
+                    "question": project.vote_question,
+                    "user_vote": user_vote,
+                    "results": results,
+                }
+            ),
+            etag,
         )
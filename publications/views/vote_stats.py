@@ -2,18 +2,28 @@ from typing import Any
 
 from django.conf import settings
 from django.db.models import Count, Q, QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
+from django.views import View
 from django.views.generic import TemplateView
 from wagtail.admin.views.generic.base import WagtailAdminTemplateMixin
 
-from publications.models import ParticipationMode, ProjectPage
+from publications.models import ActivityKind, ParticipationMode, ProjectPage
 from publications.models.form import (
     FAVORABLE_VALUES,
     FormResponse,
     UNFAVORABLE_VALUES,
     VoteChoice,
 )
+from publications.views.activity import activity_timeline_context
+from publications.views.export import (
+    EXPORT_CHUNK_SIZE,
+    author_label,
+    get_export_format,
+    streaming_export_response,
+)
+from publications.views.pagination import KEYSET_PAGE_SIZE, keyset_paginate
 
 LOCAL_POSTAL_CODE: str = getattr(settings, "LOCAL_POSTAL_CODE", "13007")
 
@@ -22,16 +32,11 @@ def _is_show_all(request: Any) -> bool:
     return request.GET.get("show_all") == "1"
 
 
-def _local_votes_filter() -> Q:
-    """Return a Q filter for votes from local users (matching LOCAL_POSTAL_CODE)."""
-    return Q(vote_responses__user__postal_code=LOCAL_POSTAL_CODE)
-
-
 def _local_responses_qs(show_all: bool) -> QuerySet:
     """Return a FormResponse queryset filtered by locality unless show_all is True."""
     qs = FormResponse.objects.all()
     if not show_all:
-        qs = qs.filter(user__postal_code=LOCAL_POSTAL_CODE)
+        qs = qs.filter(is_local=True)
     return qs
 
 
@@ -43,41 +48,31 @@ class VoteStatsView(WagtailAdminTemplateMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         show_all = _is_show_all(self.request)
-        local_filter = Q() if show_all else _local_votes_filter()
 
         projects = (
             ProjectPage.objects.live()
             .filter(participation_mode=ParticipationMode.VOTING)
-            .annotate(
-                total_votes=Count("vote_responses", filter=local_filter),
-                with_comments=Count(
-                    "vote_responses",
-                    filter=local_filter
-                    & Q(vote_responses__comment__isnull=False)
-                    & ~Q(vote_responses__comment=""),
-                ),
-                favorable_count=Count(
-                    "vote_responses",
-                    filter=local_filter & Q(vote_responses__choice__in=FAVORABLE_VALUES),
-                ),
-            )
+            .select_related("vote_statistics")
             .order_by("-first_published_at")
         )
 
-        projects_stats = [
-            {
-                "project": project,
-                "total_votes": project.total_votes,
-                "with_comments": project.with_comments,
-                "favorable_percent": (
-                    round((project.favorable_count / project.total_votes) * 100, 1)
-                    if project.total_votes > 0
-                    else 0
-                ),
-                "is_voting_open": project.is_voting_open,
-            }
-            for project in projects
-        ]
+        projects_stats = []
+        for project in projects:
+            statistics = getattr(project, "vote_statistics", None)
+            total_votes, with_comments, favorable_count = (
+                statistics.for_scope(local_only=not show_all) if statistics else (0, 0, 0)
+            )
+            projects_stats.append(
+                {
+                    "project": project,
+                    "total_votes": total_votes,
+                    "with_comments": with_comments,
+                    "favorable_percent": (
+                        round((favorable_count / total_votes) * 100, 1) if total_votes > 0 else 0
+                    ),
+                    "is_voting_open": project.is_voting_open,
+                }
+            )
 
         context.update(
             {
@@ -93,6 +88,7 @@ class VoteStatsView(WagtailAdminTemplateMixin, TemplateView):
 class VoteStatsDetailView(WagtailAdminTemplateMixin, TemplateView):
     template_name = "publications/admin/vote_stats_detail.html"
     page_title = _("Vote Statistics")
+    page_size = KEYSET_PAGE_SIZE
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -128,11 +124,18 @@ class VoteStatsDetailView(WagtailAdminTemplateMixin, TemplateView):
         favorable_percentage = round((favorable_total / total) * 100, 1) if total > 0 else 0
         unfavorable_percentage = round((unfavorable_total / total) * 100, 1) if total > 0 else 0
 
-        votes_with_comments = (
-            base_qs.exclude(comment="")
-            .exclude(comment__isnull=True)
-            .select_related("user")
-            .order_by("-created_at")
+        choice_filter = self.request.GET.get("choice")
+        if choice_filter not in counts:
+            choice_filter = None
+
+        votes_with_comments = base_qs.exclude(comment="").select_related("user")
+        if choice_filter:
+            votes_with_comments = votes_with_comments.filter(choice=choice_filter)
+            comments_total = counts_with_comment[choice_filter]
+        else:
+            comments_total = sum(counts_with_comment.values())
+        comments_page = keyset_paginate(
+            votes_with_comments, self.request.GET.get("cursor"), self.page_size
         )
 
         context.update(
@@ -147,11 +150,44 @@ class VoteStatsDetailView(WagtailAdminTemplateMixin, TemplateView):
                 "unfavorable_total": unfavorable_total,
                 "unfavorable_percentage": unfavorable_percentage,
                 "is_voting_open": project.is_voting_open,
-                "votes_with_comments": votes_with_comments,
+                "votes_with_comments": comments_page.items,
+                "comments_page": comments_page,
+                "comments_total": comments_total,
+                "choice_filter": choice_filter,
                 "vote_choices": VoteChoice,
                 "show_all": show_all,
                 "local_postal_code": LOCAL_POSTAL_CODE,
+                **activity_timeline_context(self.request, project, ActivityKind.VOTE, show_all),
             }
         )
 
         return context
+
+
+class VoteCommentsExportView(View):
+    """Stream a project's vote comments as CSV or NDJSON (``?format=ndjson``)."""
+
+    columns = ("created_at", "choice", "comment", "author")
+
+    def get(self, request: HttpRequest, project_id: int) -> StreamingHttpResponse:
+        project = get_object_or_404(ProjectPage, id=project_id)
+
+        comments = (
+            _local_responses_qs(_is_show_all(request))
+            .filter(project=project)
+            .exclude(comment="")
+            .order_by("-created_at")
+            .values_list(
+                "created_at", "choice", "comment", "anonymize", "user__email", "user__deleted_at"
+            )
+        )
+        rows = (
+            (created_at.isoformat(), choice, comment, author_label(anonymize, email, deleted_at))
+            for created_at, choice, comment, anonymize, email, deleted_at in comments.iterator(
+                chunk_size=EXPORT_CHUNK_SIZE
+            )
+        )
+
+        return streaming_export_response(
+            self.columns, rows, get_export_format(request), f"{project.slug}-vote-comments"
+        )
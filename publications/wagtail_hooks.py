@@ -3,8 +3,12 @@ from django.utils.translation import gettext_lazy as _
 from wagtail import hooks
 from wagtail.admin.menu import MenuItem
 
-from publications.views.idea_stats import IdeaStatsView, IdeaStatsDetailView
-from publications.views.vote_stats import VoteStatsView, VoteStatsDetailView
+from publications.views.idea_stats import IdeasExportView, IdeaStatsView, IdeaStatsDetailView
+from publications.views.vote_stats import (
+    VoteCommentsExportView,
+    VoteStatsView,
+    VoteStatsDetailView,
+)
 
 
 @hooks.register("register_admin_urls")
@@ -16,6 +20,11 @@ def register_vote_stats_url() -> list[URLPattern]:
             VoteStatsDetailView.as_view(),
             name="vote_statistics_detail",
         ),
+        path(
+            "vote-statistics/<int:project_id>/export/",
+            VoteCommentsExportView.as_view(),
+            name="vote_statistics_export",
+        ),
     ]
 
 
@@ -38,6 +47,11 @@ def register_idea_stats_url() -> list[URLPattern]:
             IdeaStatsDetailView.as_view(),
             name="idea_statistics_detail",
         ),
+        path(
+            "idea-collection/<int:project_id>/export/",
+            IdeasExportView.as_view(),
+            name="idea_statistics_export",
+        ),
     ]
 
 
@@ -1,9 +1,12 @@
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.paginator import EmptyPage, PageNotAnInteger
 from django.http import HttpResponse, HttpRequest
 from django.template.response import TemplateResponse
 
 from wagtail.models import Page
 
+from core.cache import page_type_tag, pagination_count_key, tagged_key
+from core.pagination import CachedCountPaginator
+
 # To enable logging of search queries for use with the "Promoted search results" module
 # <https://docs.wagtail.org/en/stable/reference/contrib/searchpromotions.html>
 # uncomment the following line and the lines indicated in the search function
@@ -29,7 +32,15 @@ def search(request: HttpRequest) -> HttpResponse:
         search_results = Page.objects.none()
 
     # Pagination
-    paginator = Paginator(search_results, 10)
+    paginator = CachedCountPaginator(
+        search_results,
+        10,
+        count_key=(
+            tagged_key(pagination_count_key("search", query=search_query), [page_type_tag(Page)])
+            if search_query
+            else None
+        ),
+    )
     try:
         search_results = paginator.page(page)
     except PageNotAnInteger:
@@ -49,6 +49,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sitemaps",
+    "django.contrib.postgres",
 ]
 
 MIDDLEWARE = [
@@ -61,6 +62,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
+    # After LocaleMiddleware: the language is part of the cached page key.
+    "core.page_cache.AnonymousPageCacheMiddleware",
 ]
 
 ROOT_URLCONF = "urban_platform.urls"
@@ -238,4 +241,20 @@ CELERY_BEAT_SCHEDULE = {
         "task": "core.emails.tasks.anonymize_old_email_events",
         "schedule": 86400,
     },
+    "reconcile-vote-tallies": {
+        "task": "publications.tasks.reconcile_vote_tallies",
+        "schedule": 3600,
+    },
+    "reconcile-vote-statistics": {
+        "task": "publications.tasks.reconcile_vote_statistics",
+        "schedule": 3600,
+    },
+    "reconcile-idea-statistics": {
+        "task": "publications.tasks.reconcile_idea_statistics",
+        "schedule": 3600,
+    },
+    "rollup-participation-activity": {
+        "task": "publications.tasks.rollup_participation_activity",
+        "schedule": 600,
+    },
 }
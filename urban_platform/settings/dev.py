@@ -23,8 +23,8 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 
-# Separate Redis DB for the content fragment cache: it is flushed wholesale on
-# every page publish, so it must not share a DB with sessions (the default).
+# Separate Redis DB for the content fragment cache: it may be flushed wholesale
+# (core.cache.clear_content_cache), so it must not share a DB with sessions.
 CONTENT_CACHE_URL = os.environ.get("CONTENT_CACHE_URL") or REDIS_URL.rsplit("/", 1)[0] + "/1"
 
 CACHES = {
@@ -1,15 +1,10 @@
 from .base import *
 import os
-from .base import INSTALLED_APPS as INSTALLED_APPS_BASE
 
 DEBUG = False
 
 SECRET_KEY = os.environ["SECRET_KEY"]
 
-INSTALLED_APPS = INSTALLED_APPS_BASE + [
-    "django.contrib.postgres",
-]
-
 # statement_timeout (ms) bounds any single query so a runaway/locked query cannot
 # hang a worker forever. Applies to every connection using these settings,
 # including the migrator and collectstatic — keep it comfortably above the
@@ -71,8 +66,8 @@ MEDIA_ROOT = BASE_DIR / "mediafiles"
 # Cache settings (Redis)
 REDIS_URL = os.environ.get("REDIS_URL", "redis://cache:6379/0")
 
-# Separate Redis DB for the content fragment cache: it is flushed wholesale on
-# every page publish, so it must not share a DB with sessions (the default).
+# Separate Redis DB for the content fragment cache: it may be flushed wholesale
+# (core.cache.clear_content_cache), so it must not share a DB with sessions.
 CONTENT_CACHE_URL = os.environ.get("CONTENT_CACHE_URL") or REDIS_URL.rsplit("/", 1)[0] + "/1"
 
 # Fail fast when Redis is unreachable or unresponsive. Without these, the
@@ -10,6 +10,21 @@ SECRET_KEY = os.environ["SECRET_KEY"]
 
 ALLOWED_HOSTS = ["*"]
 
+# The suite runs on SQLite; TEST_DB_ENGINE=postgresql runs it on the PostgreSQL
+# server given by the DB_* variables instead, which the tests skipped on SQLite
+# (e.g. concurrent vote writes) need. See the "test-postgresql" CI job.
+if os.environ.get("TEST_DB_ENGINE") == "postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("DB_NAME"),
+            "USER": os.environ.get("DB_USER"),
+            "PASSWORD": os.environ.get("DB_PASSWORD"),
+            "HOST": os.environ.get("DB_HOST"),
+            "PORT": os.environ.get("DB_PORT"),
+        }
+    }
+
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 CACHES = {